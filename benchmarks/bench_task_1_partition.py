@@ -0,0 +1,55 @@
+"""
+Пропускная способность разбиения идентификаторов на 2^bits частей по младшим битам:
+partition_by_low_bits (один векторный проход numpy) в сравнении с поэлементной маршрутизацией my_low_bits
+
+Поэлементная маршрутизация замеряется на первых 1e6 идентификаторах. Для 1e8 идентификаторов int64
+нужно около 2.5 ГиБ памяти (идентификаторы, номера частей и перестановка)
+
+Запуск: python -m benchmarks.bench_task_1_partition [количество]
+"""
+import sys
+import time
+
+import numpy as np
+
+from solutions.task_1 import my_low_bits
+from solutions.task_1_numpy import partition_by_low_bits
+
+DEFAULT_SIZE = 10 ** 8
+PURE_PYTHON_SIZE = 10 ** 6
+BITS = (1, 4, 8, 12, 16, 20)
+
+
+def per_record(ids, bits):
+    """
+    Разбиение по одному идентификатору за раз: списки индексов для каждой части
+
+    :rtype: list[list[int]]
+    :return: Индексы идентификаторов каждой части
+    """
+    shards = [[] for _ in range(1 << bits)]
+    for index, value in enumerate(ids):
+        shards[my_low_bits(value, bits)].append(index)
+    return shards
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    ids = np.random.default_rng(0).integers(0, 2 ** 63 - 1, size=size, dtype=np.int64)
+    sample = ids[:PURE_PYTHON_SIZE].tolist()
+    print(f'size={size}')
+    print(f'{"bits":>5} {"vectorized, s":>14} {"ids/s":>14} {"per record, ids/s":>18} {"speedup":>8}')
+    for bits in BITS:
+        started = time.perf_counter()
+        partition_by_low_bits(ids, bits)
+        vectorized = time.perf_counter() - started
+
+        started = time.perf_counter()
+        per_record(sample, bits)
+        python_rate = len(sample) / (time.perf_counter() - started)
+        print(f'{bits:>5} {vectorized:14.3f} {size / vectorized:14,.0f} {python_rate:18,.0f} '
+              f'{size / vectorized / python_rate:8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Произвольный доступ к элементам циклических буферов на 1e6 элементов:
+индексация, срезы и полный проход итератором в сравнении с прежним способом - копированием буфера в список
+
+Запуск: python -m benchmarks.bench_task_2_access [размер]
+"""
+import random
+import sys
+import time
+
+from solutions.task_2_1 import RingBuffer
+from solutions.task_2_2 import AnotherRingBuffer
+from solutions.task_2_3 import YetAnotherRingBuffer
+
+DEFAULT_SIZE = 10 ** 6
+ACCESSES = 10 ** 5
+SLICES = 10 ** 3
+SLICE_LENGTH = 1000
+
+
+def per_operation(function, count):
+    """
+    Среднее время одного вызова function, в микросекундах
+
+    :param function: Замеряемая функция без аргументов
+    :param count: Количество вызовов
+
+    :rtype: float
+    :return: Время одного вызова
+    """
+    started = time.perf_counter()
+    for _ in range(count):
+        function()
+    return (time.perf_counter() - started) / count * 10 ** 6
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    print(f'size={size}, wrapped around once')
+    print(f'{"class":>22} {"index, us":>10} {"slice 1e3, us":>14} {"iterate, s":>11} {"list copy, s":>13}')
+    for buffer_class in (RingBuffer, AnotherRingBuffer, YetAnotherRingBuffer):
+        buffer = buffer_class(size, range(size + size // 2))
+        indices = [random.randrange(-size, size) for _ in range(ACCESSES)]
+        starts = iter([random.randrange(size - SLICE_LENGTH) for _ in range(SLICES)])
+        positions = iter(indices)
+
+        index_time = per_operation(lambda: buffer[next(positions)], ACCESSES)
+        slice_time = per_operation(lambda: buffer[(start := next(starts)):start + SLICE_LENGTH], SLICES)
+        iterate_time = per_operation(lambda: sum(1 for _ in buffer), 1) / 10 ** 6
+        copy_time = per_operation(lambda: list(buffer), 1) / 10 ** 6
+        print(f'{buffer_class.__name__:>22} {index_time:10.3f} {slice_time:14.3f} '
+              f'{iterate_time:11.3f} {copy_time:13.3f}')
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    main()
@@ -0,0 +1,102 @@
+"""
+Память и пропускная способность CompressedRingBuffer в сравнении с RingBuffer (deque)
+на медленно меняющихся счётчиках, метках времени и показаниях датчиков
+
+Память - прирост по tracemalloc после заполнения буфера, пропускная способность - put при заполненном буфере
+и pop до опустошения
+
+Запуск: python -m benchmarks.bench_task_2_compressed [размер]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from solutions.task_2_1 import RingBuffer
+from solutions.task_2_6 import CompressedRingBuffer
+
+DEFAULT_SIZE = 10 ** 6
+
+
+def counters(size):
+    value = 10 ** 9
+    for _ in range(size):
+        value += random.randrange(4)
+        yield value
+
+
+def timestamps(size):
+    value = 1_700_000_000_000
+    for _ in range(size):
+        value += 1000 + random.randrange(-2, 3)
+        yield value
+
+
+def temperatures(size):
+    value = 20.0
+    for _ in range(size):
+        value = round(value + random.choice((-0.25, 0.0, 0.0, 0.25)), 2)
+        yield value
+
+
+WORKLOADS = {
+    'counters': ('int', counters),
+    'timestamps': ('int', timestamps),
+    'temperatures': ('float', temperatures),
+}
+
+
+def measure(factory, generate, values):
+    """
+    Замерить память заполненного буфера и время put/pop одного значения
+
+    :param factory: Функция без аргументов, создающая пустой буфер
+    :param generate: Генератор значений: при замере памяти значения создаются под трассировкой,
+        как у буфера, который сам получает новые объекты
+    :param values: Значения (вдвое больше размера буфера - вторая половина вытесняет первую)
+
+    :rtype: tuple[int, float, float]
+    :return: Память в байтах, время put и pop в микросекундах
+    """
+    random.seed(0)
+    tracemalloc.start()
+    buffer = factory()
+    buffer.extend(generate(len(values)))
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del buffer
+
+    buffer = factory()
+    started = time.perf_counter()
+    for value in values:
+        buffer.put(value)
+    put_time = (time.perf_counter() - started) / len(values) * 10 ** 6
+
+    size = buffer.get_size()
+    started = time.perf_counter()
+    for _ in range(size):
+        buffer.pop()
+    pop_time = (time.perf_counter() - started) / size * 10 ** 6
+    return memory, put_time, pop_time
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    print(f'size={size}')
+    print(f'{"workload":>13} {"buffer":>22} {"memory, MiB":>12} {"bytes/value":>12} {"put, us":>8} {"pop, us":>8}')
+    for workload, (kind, generate) in WORKLOADS.items():
+        values = list(generate(2 * size))
+        factories = {
+            'RingBuffer': lambda: RingBuffer(size),
+            'Compressed(block=64)': lambda: CompressedRingBuffer(size, block_size=64, kind=kind),
+            'Compressed(block=1024)': lambda: CompressedRingBuffer(size, block_size=1024, kind=kind),
+        }
+        for name, factory in factories.items():
+            memory, put_time, pop_time = measure(factory, generate, values)
+            print(f'{workload:>13} {name:>22} {memory / 2 ** 20:12.1f} {memory / size:12.1f} '
+                  f'{put_time:8.3f} {pop_time:8.3f}')
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    main()
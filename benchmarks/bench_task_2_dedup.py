@@ -0,0 +1,65 @@
+"""
+Дедупликация идентификаторов сообщений по последним N увиденным:
+DedupRingBuffer.put_if_absent в сравнении с проверкой `in` по RingBuffer (линейный просмотр deque)
+
+Окно 1e6, поток 1e6 сообщений, около 10% повторов из окна. Проверка по RingBuffer замеряется на небольшой
+выборке сообщений - на всём потоке она заняла бы часы
+
+Запуск: python -m benchmarks.bench_task_2_dedup [окно] [сообщений]
+"""
+import random
+import sys
+import time
+
+from solutions.task_2_1 import RingBuffer
+from solutions.task_2_8 import DedupRingBuffer
+
+DEFAULT_WINDOW = 10 ** 6
+DEFAULT_MESSAGES = 10 ** 6
+LINEAR_SAMPLE = 100
+DUPLICATE_RATIO = 0.1
+
+
+def generate(window, messages):
+    """
+    Поток идентификаторов: новые идентификаторы вперемешку с повторами из последних window
+
+    :rtype: list[int]
+    :return: Идентификаторы сообщений
+    """
+    identifiers, next_identifier = [], 0
+    for _ in range(messages):
+        if next_identifier and random.random() < DUPLICATE_RATIO:
+            identifiers.append(next_identifier - 1 - random.randrange(min(window, next_identifier)))
+        else:
+            identifiers.append(next_identifier)
+            next_identifier += 1
+    return identifiers
+
+
+def main():
+    window = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_WINDOW
+    messages = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_MESSAGES
+    warmup, stream = generate(window, window), generate(window, messages)
+    stream = [identifier + window for identifier in stream]
+    print(f'window={window}, messages={messages}')
+
+    buffer = DedupRingBuffer(window, warmup)
+    started = time.perf_counter()
+    duplicates = sum(not buffer.put_if_absent(identifier) for identifier in stream)
+    elapsed = time.perf_counter() - started
+    print(f'{"DedupRingBuffer":>16}: {messages / elapsed:12,.0f} msgs/s, {duplicates} duplicates')
+
+    buffer = RingBuffer(window, warmup)
+    sample = stream[:LINEAR_SAMPLE]
+    started = time.perf_counter()
+    for identifier in sample:
+        if identifier not in buffer:
+            buffer.put(identifier)
+    elapsed = time.perf_counter() - started
+    print(f'{"RingBuffer":>16}: {len(sample) / elapsed:12,.0f} msgs/s (sample of {len(sample)})')
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    main()
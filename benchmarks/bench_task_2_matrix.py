@@ -0,0 +1,56 @@
+"""
+Матрица замеров трёх реализаций циклического буфера (RingBuffer, AnotherRingBuffer, YetAnotherRingBuffer)
+на смесях операций, размерах и типах элементов. Использует те же замеры, что и калибровка make_ring_buffer
+
+Запуск:
+    python -m benchmarks.bench_task_2_matrix
+    python -m benchmarks.bench_task_2_matrix --calibrate   # заново записать калибровку make_ring_buffer
+"""
+import argparse
+import json
+import random
+
+from solutions.task_2 import BACKENDS, ELEMENT_TYPES, WORKLOADS, load_calibration, run_workload, supports
+
+SIZES = (10, 100, 1000, 10000, 100000)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES))
+    parser.add_argument('--workloads', nargs='+', choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument('--types', nargs='+', choices=ELEMENT_TYPES, default=list(ELEMENT_TYPES))
+    parser.add_argument('--operations', type=int, default=20000)
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--calibrate', action='store_true', help='regenerate the make_ring_buffer calibration table')
+    return parser.parse_args()
+
+
+def main():
+    arguments = parse_arguments()
+    if arguments.calibrate:
+        load_calibration(recalibrate=True)
+
+    results = []
+    print(f'{"workload":>8} {"size":>8} {"type":>6} ' + ' '.join(f'{name + ", us":>10}' for name in BACKENDS) +
+          f' {"fastest":>8}')
+    for workload in arguments.workloads:
+        for size in arguments.sizes:
+            for element_type in arguments.types:
+                timings = {name: run_workload(buffer_class, size, workload, element_type, arguments.operations)
+                           for name, buffer_class in BACKENDS.items() if supports(buffer_class, workload)}
+                fastest = min(timings, key=timings.get)
+                results.append({'workload': workload, 'size': size, 'type': element_type,
+                                'seconds': timings, 'fastest': fastest})
+                cells = ' '.join(f'{timings[name] * 10 ** 6:10.3f}' if name in timings else f'{"-":>10}'
+                                 for name in BACKENDS)
+                print(f'{workload:>8} {size:>8} {element_type:>6} {cells} {fastest:>8}')
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    main()
@@ -0,0 +1,199 @@
+"""
+Набор замеров сортировки на разных распределениях входных данных, типах элементов и размерах
+со сравнением с sorted() и проверкой на регрессию относительно сохранённых результатов.
+
+Регрессия считается по отношению времени сортировки ко времени sorted() на тех же данных,
+поэтому результаты, полученные на разных машинах, сравнимы между собой.
+
+Запуск:
+    python -m benchmarks.bench_task_3 --output bench_task_3.json
+    python -m benchmarks.bench_task_3 --baseline bench_task_3.json --threshold 0.2
+Код возврата 1, если хотя бы один замер медленнее базового больше чем на threshold
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from functools import total_ordering
+
+from solutions.task_3 import auto_sort, merge_sort
+
+SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+ENGINES = {
+    'merge_sort': merge_sort,
+    'auto_sort': auto_sort,
+}
+
+
+@total_ordering
+class Item:
+    """
+    Пользовательский объект, сравниваемый через __lt__ и __eq__
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def sawtooth(size):
+    period = max(2, int(size ** 0.5))
+    return [index % period for index in range(size)]
+
+
+def organ_pipe(size):
+    half = size // 2
+    return list(range(half)) + list(range(size - half, 0, -1))
+
+
+DISTRIBUTIONS = {
+    'random': lambda size: [random.randrange(size * 10) for _ in range(size)],
+    'sorted': lambda size: list(range(size)),
+    'reversed': lambda size: list(range(size, 0, -1)),
+    'sawtooth': sawtooth,
+    'few_unique': lambda size: [random.randrange(4) for _ in range(size)],
+    'organ_pipe': organ_pipe,
+    'many_duplicates': lambda size: [random.randrange(max(1, int(size ** 0.5))) for _ in range(size)],
+}
+
+ELEMENT_TYPES = {
+    'int': lambda values: values,
+    'float': lambda values: [value / 7 for value in values],
+    'str': lambda values: [f'{value:010d}' for value in values],
+    'tuple': lambda values: [(value % 3, value) for value in values],
+    'object': lambda values: [Item(value) for value in values],
+}
+
+
+def measure(engine, source, repeat):
+    """
+    Лучшее время из repeat запусков engine и sorted() на копиях source
+
+    :param engine: Функция сортировки (array, low, high)
+    :param source: Исходный список
+    :param repeat: Количество запусков
+
+    :rtype: tuple[float, float]
+    :return: Время engine и время sorted() в секундах
+    """
+    engine_times, sorted_times = [], []
+    for _ in range(repeat):
+        array = source.copy()
+        started = time.perf_counter()
+        engine(array, 0, len(array) - 1)
+        engine_times.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        expected = sorted(source)
+        sorted_times.append(time.perf_counter() - started)
+        if array != expected:
+            raise AssertionError(f'{engine.__name__} returned an unsorted result')
+    return min(engine_times), min(sorted_times)
+
+
+def run(engine_name, sizes, distributions, element_types, repeat):
+    """
+    Выполнить замеры для всех сочетаний размера, распределения и типа элементов
+
+    :rtype: list[dict]
+    :return: Результаты замеров
+    """
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            values = DISTRIBUTIONS[distribution](size)
+            for element_type in element_types:
+                source = ELEMENT_TYPES[element_type](values)
+                engine_time, sorted_time = measure(ENGINES[engine_name], source, repeat)
+                result = {
+                    'engine': engine_name,
+                    'size': size,
+                    'distribution': distribution,
+                    'type': element_type,
+                    'seconds': engine_time,
+                    'sorted_seconds': sorted_time,
+                    'ratio': engine_time / sorted_time if sorted_time else float('inf'),
+                }
+                results.append(result)
+                print(f'{engine_name:>10} {size:>9} {distribution:>16} {element_type:>7} '
+                      f'{engine_time:10.4f}s {sorted_time:10.4f}s x{result["ratio"]:8.1f}', file=sys.stderr)
+    return results
+
+
+def find_regressions(results, baseline, threshold):
+    """
+    Сравнить результаты с базовыми по отношению ко времени sorted()
+
+    :param results: Текущие результаты
+    :param baseline: Базовые результаты
+    :param threshold: Допустимое относительное замедление (0.2 - на 20%)
+
+    :rtype: list[str]
+    :return: Описания замеров, замедлившихся больше чем на threshold
+    """
+    def case(result):
+        return result['engine'], result['size'], result['distribution'], result['type']
+
+    baseline_ratios = {case(result): result['ratio'] for result in baseline}
+    regressions = []
+    for result in results:
+        baseline_ratio = baseline_ratios.get(case(result))
+        if baseline_ratio and result['ratio'] > baseline_ratio * (1 + threshold):
+            regressions.append(f'{"/".join(map(str, case(result)))}: '
+                               f'x{result["ratio"]:.1f} vs baseline x{baseline_ratio:.1f}')
+    return regressions
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--engine', choices=ENGINES, default='merge_sort')
+    parser.add_argument('--max-size', type=int, default=10 ** 5,
+                        help='largest size from 1e2..1e7 to run (pure Python sorts of 1e7 take minutes)')
+    parser.add_argument('--distributions', nargs='+', choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument('--types', nargs='+', choices=ELEMENT_TYPES, default=list(ELEMENT_TYPES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON results to check for regressions against')
+    parser.add_argument('--threshold', type=float, default=0.2)
+    return parser.parse_args()
+
+
+def main():
+    arguments = parse_arguments()
+    random.seed(arguments.seed)
+    sizes = [size for size in SIZES if size <= arguments.max_size]
+    results = run(arguments.engine, sizes, arguments.distributions, arguments.types, arguments.repeat)
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)['results']
+        regressions = find_regressions(results, baseline, arguments.threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
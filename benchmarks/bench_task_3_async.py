@@ -0,0 +1,75 @@
+"""
+Задержка цикла событий asyncio во время сортировки: merge_sort внутри корутины,
+async_merge_sort порциями и async_merge_sort с выносом в пул потоков
+
+Запуск: python -m benchmarks.bench_task_3_async [размер]
+"""
+import asyncio
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from solutions.task_3 import merge_sort
+from solutions.task_3_async import async_merge_sort
+
+DEFAULT_SIZE = 2 * 10 ** 5
+TICK = 0.001
+
+
+async def measure_lag(sort_coroutine):
+    """
+    Выполнить сортировку, параллельно замеряя, насколько позже TICK просыпается соседняя корутина
+
+    :param sort_coroutine: Корутина сортировки
+
+    :rtype: tuple[float, float, float]
+    :return: Общее время сортировки, максимальная и средняя задержка цикла событий в секундах
+    """
+    lags = []
+    done = False
+
+    async def ticker():
+        while not done:
+            started = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(time.perf_counter() - started - TICK)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await sort_coroutine
+    elapsed = time.perf_counter() - started
+    done = True
+    await task
+    return elapsed, max(lags), sum(lags) / len(lags)
+
+
+async def blocking_sort(array):
+    merge_sort(array, 0, len(array) - 1)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    source = [random.random() for _ in range(size)]
+    executor = ThreadPoolExecutor(max_workers=1)
+    variants = {
+        'merge_sort (blocking)': lambda array: blocking_sort(array),
+        'async_merge_sort step=1024': lambda array: async_merge_sort(array, 0, size - 1, step=1024),
+        'async_merge_sort step=16384': lambda array: async_merge_sort(array, 0, size - 1, step=16384),
+        'async_merge_sort executor': lambda array: async_merge_sort(array, 0, size - 1, executor_threshold=0,
+                                                                    executor=executor),
+    }
+    print(f'size={size}')
+    print(f'{"variant":>30} {"total, s":>9} {"max lag, ms":>12} {"mean lag, ms":>13}')
+    for name, make_coroutine in variants.items():
+        array = source.copy()
+        elapsed, max_lag, mean_lag = asyncio.run(measure_lag(make_coroutine(array)))
+        assert array == sorted(source)
+        print(f'{name:>30} {elapsed:9.3f} {max_lag * 1000:12.2f} {mean_lag * 1000:13.3f}')
+    executor.shutdown()
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    main()
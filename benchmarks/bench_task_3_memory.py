@@ -0,0 +1,51 @@
+"""
+Пиковая дополнительная память (tracemalloc) и время merge_sort по умолчанию и в режиме in_place=True
+
+Запуск: python -m benchmarks.bench_task_3_memory
+"""
+import random
+import time
+import tracemalloc
+
+from solutions.task_3 import merge_sort
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5)
+
+
+def measure(source, in_place):
+    """
+    Отсортировать копии source: одну - замеряя время, другую - под tracemalloc, замеряя пик памяти,
+    выделенной во время сортировки (трассировка сильно замедляет выполнение, поэтому замеры раздельные)
+
+    :param source: Исходный список
+    :param in_place: Режим merge_sort
+
+    :rtype: tuple[float, int]
+    :return: Время в секундах и пик памяти в байтах
+    """
+    array = source.copy()
+    started = time.perf_counter()
+    merge_sort(array, 0, len(array) - 1, in_place=in_place)
+    elapsed = time.perf_counter() - started
+
+    array = source.copy()
+    tracemalloc.start()
+    merge_sort(array, 0, len(array) - 1, in_place=in_place)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    print(f'{"size":>8} {"default, s":>11} {"default peak, KiB":>18} {"in_place, s":>12} {"in_place peak, KiB":>19}')
+    for size in SIZES:
+        source = [random.random() for _ in range(size)]
+        default_time, default_peak = measure(source, in_place=False)
+        in_place_time, in_place_peak = measure(source, in_place=True)
+        print(f'{size:>8} {default_time:11.3f} {default_peak / 1024:18.1f} '
+              f'{in_place_time:12.3f} {in_place_peak / 1024:19.1f}')
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    main()
@@ -0,0 +1,54 @@
+"""
+Сравнение векторизованной сортировки слиянием с numpy.sort(kind='stable') и с merge_sort на списках
+
+Запуск: python -m benchmarks.bench_task_3_numpy
+"""
+import timeit
+
+import numpy as np
+
+from solutions.task_3 import merge_sort
+from solutions.task_3_numpy import merge_argsort, vectorized_merge_sort
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+PURE_PYTHON_LIMIT = 10 ** 5
+REPEAT = 3
+
+
+def best_of(function, setup):
+    """
+    Лучшее время из REPEAT запусков function на свежих данных из setup
+
+    :param function: Замеряемая функция от данных
+    :param setup: Функция, создающая новые данные для каждого запуска
+
+    :rtype: float
+    :return: Время в секундах
+    """
+    times = []
+    for _ in range(REPEAT):
+        data = setup()
+        times.append(timeit.timeit(lambda: function(data), number=1))
+    return min(times)
+
+
+def main():
+    print(f'{"dtype":>8} {"size":>9} {"np.sort":>10} {"vectorized":>11} {"argsort":>10} {"merge_sort":>11}')
+    for dtype in (np.int64, np.float64):
+        for size in SIZES:
+            source = np.random.randint(-size, size, size=size).astype(dtype)
+            numpy_time = best_of(lambda data: np.sort(data, kind='stable'), source.copy)
+            vectorized_time = best_of(lambda data: vectorized_merge_sort(data, 0, len(data) - 1), source.copy)
+            argsort_time = best_of(merge_argsort, source.copy)
+            if size <= PURE_PYTHON_LIMIT:
+                python_time = best_of(lambda data: merge_sort(data, 0, len(data) - 1), source.tolist)
+                python_column = f'{python_time:11.4f}'
+            else:
+                python_column = f'{"-":>11}'
+            print(f'{np.dtype(dtype).name:>8} {size:>9} {numpy_time:10.4f} {vectorized_time:11.4f} '
+                  f'{argsort_time:10.4f} {python_column}')
+
+
+if __name__ == '__main__':
+    np.random.seed(0)
+    main()
@@ -0,0 +1,56 @@
+"""
+Параллельная сортировка в пуле потоков: merge_sort(..., workers=N).
+Скрипт нужно запускать и в обычной сборке CPython, и в сборке без GIL (python3.13t и новее):
+в обычной сборке merge_sort откатывается к последовательной сортировке, поэтому дополнительно
+замеряется принудительный запуск в потоках, показывающий, что при GIL он не ускоряет сортировку
+
+Запуск: python -m benchmarks.bench_task_3_parallel [размер]
+"""
+import platform
+import random
+import sys
+import time
+
+from solutions.task_3 import _parallel_merge_sort, is_gil_enabled, merge_sort
+
+DEFAULT_SIZE = 10 ** 6
+WORKERS = (1, 2, 4, 8)
+
+
+def measure(function, source):
+    """
+    Время сортировки копии source
+
+    :param function: Функция сортировки от списка
+    :param source: Исходный список
+
+    :rtype: float
+    :return: Время в секундах
+    """
+    array = source.copy()
+    started = time.perf_counter()
+    function(array)
+    elapsed = time.perf_counter() - started
+    assert array == sorted(source)
+    return elapsed
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    source = [random.random() for _ in range(size)]
+    print(f'{platform.python_implementation()} {platform.python_version()}, GIL enabled: {is_gil_enabled()}, '
+          f'size={size}')
+    print(f'{"workers":>8} {"merge_sort, s":>14} {"forced threads, s":>18}')
+    for workers in WORKERS:
+        default_time = measure(lambda array: merge_sort(array, 0, size - 1, workers=workers), source)
+        if workers > 1:
+            forced_time = measure(lambda array: _parallel_merge_sort(array, 0, size - 1, False, workers), source)
+            forced_column = f'{forced_time:18.3f}'
+        else:
+            forced_column = f'{"-":>18}'
+        print(f'{workers:>8} {default_time:14.3f} {forced_column}')
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    main()
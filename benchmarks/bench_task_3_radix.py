@@ -0,0 +1,74 @@
+"""
+Точки перелома между способами сортировки, которые выбирает auto_sort:
+поразрядная сортировка целых чисел в зависимости от размера и размаха значений,
+поразрядная сортировка строк в зависимости от размера и длины общего префикса
+и адаптивное слияние в зависимости от количества упорядоченных серий
+
+Запуск: python -m benchmarks.bench_task_3_radix
+"""
+import random
+import timeit
+
+from solutions.task_3 import choose_engine, merge_sort, natural_merge_sort
+from solutions.task_3_radix import lsd_radix_sort, msd_radix_sort
+
+SIZES = (16, 64, 256, 1000, 10 ** 4, 10 ** 5)
+BITS = (8, 16, 32, 64)
+PREFIXES = (4, 8, 16, 196)
+ELEMENTS_PER_RUN = 2 * 10 ** 5
+
+
+def average_time(function, source):
+    """
+    Среднее время сортировки копии source функцией function(array, low, high)
+
+    :param function: Способ сортировки
+    :param source: Исходный список
+
+    :rtype: float
+    :return: Время в секундах
+    """
+    number = max(1, ELEMENTS_PER_RUN // len(source) // 10)
+    return timeit.timeit(lambda: function(source.copy(), 0, len(source) - 1), number=number) / number
+
+
+def main():
+    print('lsd_radix_sort vs merge_sort: speedup (engine chosen by auto_sort)')
+    print(f'{"size":>8}' + ''.join(f'{f"{bits} bit":>20}' for bits in BITS))
+    for size in SIZES:
+        row = f'{size:>8}'
+        for bits in BITS:
+            source = [random.getrandbits(bits) - (1 << bits - 1) for _ in range(size)]
+            speedup = average_time(merge_sort, source) / average_time(lsd_radix_sort, source)
+            row += f'{speedup:8.2f} ({choose_engine(source, 0, size - 1):>9})'
+        print(row)
+
+    print('\nmsd_radix_sort vs merge_sort on 12-character strings: speedup')
+    for size in SIZES:
+        source = [''.join(random.choice('abcdefghij') for _ in range(12)) for _ in range(size)]
+        speedup = average_time(merge_sort, source) / average_time(msd_radix_sort, source)
+        print(f'{size:>8} {speedup:8.2f} ({choose_engine(source, 0, size - 1)})')
+
+    print('\nmsd_radix_sort vs merge_sort on strings with a common prefix: speedup (engine chosen by auto_sort)')
+    print(f'{"size":>8}' + ''.join(f'{f"prefix {prefix}":>20}' for prefix in PREFIXES))
+    for size in SIZES:
+        row = f'{size:>8}'
+        for prefix in PREFIXES:
+            source = ['x' * prefix + ''.join(random.choice('abcdefghij') for _ in range(4)) for _ in range(size)]
+            speedup = average_time(merge_sort, source) / average_time(msd_radix_sort, source)
+            row += f'{speedup:8.2f} ({choose_engine(source, 0, size - 1):>9})'
+        print(row)
+
+    size = 10 ** 5
+    print(f'\nnatural_merge_sort vs merge_sort on {size} floats made of sorted runs: speedup')
+    for runs in (1, 16, 256, 4096, size // 8, size // 4, size // 2):
+        source = []
+        for _ in range(runs):
+            source += sorted(random.random() for _ in range(size // runs))
+        speedup = average_time(merge_sort, source) / average_time(natural_merge_sort, source)
+        print(f'{runs:>8} runs {speedup:8.2f} ({choose_engine(source, 0, len(source) - 1)})')
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    main()
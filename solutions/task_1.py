@@ -7,3 +7,7 @@ def isEven(value):
 def my_is_even(value):
     return not (value & 0b1)
 
+
+# Обобщение на 2^bits частей: номер части - младшие bits бит (my_is_even(value) == (my_low_bits(value, 1) == 0))
+def my_low_bits(value, bits):
+    return value & ((1 << bits) - 1)
@@ -0,0 +1,86 @@
+from array import array as py_array
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_MAX_BITS = 24
+
+
+def partition_by_low_bits(ids: Any, bits: int) -> tuple[Any, Any, Any]:
+    """
+    Разбить идентификаторы на 2^bits частей по младшим bits битам (как my_low_bits из task_1, но для всего массива
+    за один векторный проход без объектов Python на каждый элемент).
+    Номера частей записываются сразу в массив наименьшего подходящего беззнакового типа, счётчики частей
+    считаются подсчётом (np.bincount), а порядок - устойчивой сортировкой номеров частей, которая для 8- и 16-битных
+    номеров выполняется в numpy поразрядной (подсчётом), то есть за O(n); номера больше 16 бит сортируются
+    в два таких прохода
+
+    :param ids: Одномерный целочисленный массив (numpy.ndarray или array.array)
+    :type ids: numpy.ndarray | array.array
+    :param bits: Количество младших бит, определяющих часть (от 0 до 24)
+    :type bits: int
+
+    :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    :return: Перестановка order, счётчики counts длины 2^bits и смещения offsets длины 2^bits + 1:
+        индексы элементов части s - order[offsets[s]:offsets[s + 1]], в исходном порядке
+    """
+    view = _as_integer_view(ids)
+    if not 0 <= bits <= _MAX_BITS:
+        raise ValueError(f'Bits must be between 0 and {_MAX_BITS}')
+    mask = (1 << bits) - 1
+
+    shard_type = np.min_scalar_type(mask)
+    shards = np.empty(len(view), dtype=shard_type)
+    np.bitwise_and(view, shard_type.type(mask), out=shards, casting='unsafe')
+    counts = np.bincount(shards, minlength=mask + 1)
+    offsets = np.zeros(mask + 2, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+    if bits <= 16:
+        order = np.argsort(shards, kind='stable')
+    else:
+        # Два прохода поразрядной сортировки: по младшим 16 битам номера части, затем по старшим
+        order = np.argsort(shards.astype(np.uint16), kind='stable')
+        high = (shards[order] >> 16).astype(np.uint8)
+        order = order[np.argsort(high, kind='stable')]
+    return order, counts, offsets
+
+
+def group_by_low_bits(ids: Any, bits: int) -> tuple[Any, Any]:
+    """
+    Сгруппировать идентификаторы по младшим bits битам с сохранением исходного порядка внутри части
+
+    :param ids: Одномерный целочисленный массив (numpy.ndarray или array.array)
+    :type ids: numpy.ndarray | array.array
+    :param bits: Количество младших бит, определяющих часть (от 0 до 24)
+    :type bits: int
+
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    :return: Сгруппированные идентификаторы и смещения offsets длины 2^bits + 1:
+        часть s - grouped[offsets[s]:offsets[s + 1]]
+    """
+    order, _, offsets = partition_by_low_bits(ids, bits)
+    return _as_integer_view(ids)[order], offsets
+
+
+def _as_integer_view(ids: Any) -> Any:
+    """
+    Получить numpy-представление целочисленного массива без копирования данных
+
+    :param ids: Одномерный целочисленный массив
+    :type ids: numpy.ndarray | array.array
+
+    :rtype: numpy.ndarray
+    :return: Представление массива
+    """
+    if np is None:
+        raise ImportError('numpy is required for vectorized partitioning')
+    if isinstance(ids, py_array):
+        if ids.typecode not in 'bBhHiIlLqQ':
+            raise TypeError('Expected an integer array.array')
+        return np.frombuffer(ids, dtype=ids.typecode)
+    if not isinstance(ids, np.ndarray) or ids.ndim != 1 or ids.dtype.kind not in 'iu':
+        raise TypeError('Expected a one-dimensional integer numpy.ndarray or array.array')
+    return ids
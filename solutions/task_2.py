@@ -0,0 +1,246 @@
+import json
+import math
+import os
+import platform
+import random
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from solutions.task_2_1 import RingBuffer
+from solutions.task_2_2 import AnotherRingBuffer
+from solutions.task_2_3 import YetAnotherRingBuffer
+
+BACKENDS = {
+    'deque': RingBuffer,
+    'list': AnotherRingBuffer,
+    'dict': YetAnotherRingBuffer,
+}
+CALIBRATION_SIZES = (10, 1000, 100000)
+CALIBRATION_OPERATIONS = 20000
+CALIBRATION_PATH = Path(os.environ.get('RING_BUFFER_CALIBRATION',
+                                       Path.home() / '.cache' / 'ring_buffer_calibration.json'))
+_RESIZE_PERIOD = 1000
+
+_calibration = None
+
+
+def _append(buffer: Any, values: list[Any], size: int):
+    put = buffer.put
+    for value in values:
+        put(value)
+
+
+def _fifo(buffer: Any, values: list[Any], size: int):
+    put, pop = buffer.put, buffer.pop
+    for value in values:
+        put(value)
+        pop()
+
+
+def _peek(buffer: Any, values: list[Any], size: int):
+    put, peek_newest = buffer.put, buffer.peek_newest
+    for value in values:
+        put(value)
+        buffer[0]
+        peek_newest()
+
+
+def _index(buffer: Any, values: list[Any], size: int):
+    for position in range(len(values)):
+        buffer[position % size]
+
+
+def _resize(buffer: Any, values: list[Any], size: int):
+    put, set_maxsize = buffer.put, buffer.set_maxsize
+    for position, value in enumerate(values):
+        put(value)
+        if not position % _RESIZE_PERIOD:
+            set_maxsize(max(1, size // 2) if position // _RESIZE_PERIOD % 2 else size)
+
+
+# Смесь операций: функция, выполняющая по одной итерации на значение, и нужные ей методы буфера
+WORKLOADS = {
+    'append': (_append, ('put',)),
+    'fifo': (_fifo, ('put', 'pop')),
+    'peek': (_peek, ('put', '__getitem__', 'peek_newest')),
+    'index': (_index, ('__getitem__',)),
+    'resize': (_resize, ('put', 'set_maxsize')),
+}
+ELEMENT_TYPES = {
+    'int': lambda value: value,
+    'str': lambda value: f'{value:010d}',
+    'tuple': lambda value: (value, value),
+}
+
+
+def supports(buffer_class: type, workload: str) -> bool:
+    """
+    Проверить, что у буфера есть все методы, нужные смеси операций
+
+    :param buffer_class: Класс буфера
+    :type buffer_class: type
+    :param workload: Имя смеси операций
+    :type workload: str
+
+    :rtype: bool
+    :return: True, если смесь выполнима на этом буфере. Иначе False
+    """
+    return all(hasattr(buffer_class, method) for method in WORKLOADS[workload][1])
+
+
+def run_workload(buffer_class: type, size: int, workload: str, element_type: str = 'int',
+                 operations: int = CALIBRATION_OPERATIONS) -> float:
+    """
+    Замерить смесь операций на заполненном буфере
+
+    :param buffer_class: Класс буфера
+    :type buffer_class: type
+    :param size: Максимальный размер буфера
+    :type size: int
+    :param workload: Имя смеси операций из WORKLOADS
+    :type workload: str
+    :param element_type: Тип элементов из ELEMENT_TYPES
+    :type element_type: str
+    :param operations: Количество итераций смеси
+    :type operations: int
+
+    :rtype: float
+    :return: Время одной итерации в секундах
+    """
+    function = WORKLOADS[workload][0]
+    make = ELEMENT_TYPES[element_type]
+    buffer = buffer_class(size, [make(value) for value in range(size)])
+    values = [make(random.randrange(operations)) for _ in range(operations)]
+    started = time.perf_counter()
+    function(buffer, values, size)
+    return (time.perf_counter() - started) / operations
+
+
+def calibrate(sizes: Iterable[int] = CALIBRATION_SIZES, operations: int = CALIBRATION_OPERATIONS,
+              progress: Callable[[str], Any] | None = None) -> dict[str, Any]:
+    """
+    Замерить все буферы на всех смесях операций и размерах и выбрать самый быстрый буфер для каждого сочетания
+
+    :param sizes: Размеры буферов
+    :type sizes: Iterable[int]
+    :param operations: Количество итераций каждой смеси
+    :type operations: int
+    :param progress: Функция, которой передаётся строка о каждом замере (None - без вывода)
+    :type progress: Callable[[str], Any] | None
+
+    :rtype: dict[str, Any]
+    :return: Таблица калибровки: описание машины, время замеров и самый быстрый буфер
+        для каждой смеси и размера
+    """
+    timings, best = {}, {}
+    for workload in WORKLOADS:
+        timings[workload], best[workload] = {}, {}
+        for size in sizes:
+            results = {name: run_workload(buffer_class, size, workload, operations=operations)
+                       for name, buffer_class in BACKENDS.items() if supports(buffer_class, workload)}
+            timings[workload][str(size)] = results
+            best[workload][str(size)] = min(results, key=results.get)
+            if progress is not None:
+                progress(f'{workload:>8} {size:>8} -> {best[workload][str(size)]}')
+    return {'host': _host(), 'timings': timings, 'best': best}
+
+
+def load_calibration(path: str | Path | None = None, recalibrate: bool = False) -> dict[str, Any]:
+    """
+    Загрузить таблицу калибровки. Если файла нет, он повреждён, получен на другой машине или другой версии Python,
+    калибровка выполняется один раз и сохраняется в path. Если сохранить не удалось (например, каталог
+    только для чтения), таблица всё равно возвращается
+
+    :param path: Путь к JSON-файлу калибровки (None - CALIBRATION_PATH)
+    :type path: str | Path | None
+    :param recalibrate: Выполнить калибровку заново
+    :type recalibrate: bool
+
+    :rtype: dict[str, Any]
+    :return: Таблица калибровки
+    """
+    path = Path(CALIBRATION_PATH if path is None else path)
+    if not recalibrate:
+        try:
+            with open(path) as file:
+                calibration = json.load(file)
+        except (OSError, ValueError):
+            calibration = None
+        if isinstance(calibration, dict) and calibration.get('host') == _host():
+            return calibration
+
+    calibration = calibrate()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as file:
+            json.dump(calibration, file, indent=2)
+    except OSError:
+        pass
+    return calibration
+
+
+def choose_backend(size: int, workload_hint: str, calibration: dict[str, Any]) -> str:
+    """
+    Выбрать самый быстрый буфер для смеси операций по ближайшему (в логарифмическом масштабе) замеренному размеру
+
+    :param size: Максимальный размер буфера
+    :type size: int
+    :param workload_hint: Имя смеси операций из WORKLOADS
+    :type workload_hint: str
+    :param calibration: Таблица калибровки
+    :type calibration: dict[str, Any]
+
+    :rtype: str
+    :return: Имя буфера из BACKENDS
+    """
+    if workload_hint not in WORKLOADS:
+        raise ValueError(f'Workload hint must be one of {tuple(WORKLOADS)}')
+    best = calibration['best'][workload_hint]
+    nearest = min(best, key=lambda calibrated: abs(math.log(int(calibrated)) - math.log(size)))
+    return best[nearest]
+
+
+def make_ring_buffer(size: int, workload_hint: str = 'fifo', iterable: Iterable[Any] = (),
+                     calibration: dict[str, Any] | None = None) -> Any:
+    """
+    Создать циклический буфер той реализации, которая быстрее всех на этой машине для заданной смеси операций.
+    При первом вызове загружается (или один раз выполняется и сохраняется) калибровка, см. load_calibration
+
+    :param size: Максимальное количество элементов буфера (больше 0)
+    :type size: int
+    :param workload_hint: Преобладающая смесь операций: 'append' - только запись, 'fifo' - запись и извлечение,
+        'peek' - запись и чтение крайних элементов, 'index' - чтение по индексу, 'resize' - запись и изменение размера
+    :type workload_hint: str
+    :param iterable: Последовательность, которую необходимо занести в буфер
+    :type iterable: Iterable[Any]
+    :param calibration: Таблица калибровки (None - сохранённая на этой машине)
+    :type calibration: dict[str, Any] | None
+
+    :rtype: RingBuffer | AnotherRingBuffer | YetAnotherRingBuffer
+    :return: Буфер выбранной реализации
+    """
+    global _calibration
+    if size <= 0:
+        raise ValueError('Size must be greater than zero')
+    if calibration is None:
+        if _calibration is None:
+            _calibration = load_calibration()
+        calibration = _calibration
+    return BACKENDS[choose_backend(size, workload_hint, calibration)](size, iterable)
+
+
+def _host() -> dict[str, str]:
+    """
+    Описание машины и интерпретатора, на которых получена калибровка
+
+    :rtype: dict[str, str]
+    :return: Имя машины, архитектура, реализация и версия Python
+    """
+    return {
+        'node': platform.node(),
+        'machine': platform.machine(),
+        'implementation': platform.python_implementation(),
+        'python': platform.python_version(),
+    }
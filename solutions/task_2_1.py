@@ -1,5 +1,6 @@
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from typing import Any
 
 
@@ -26,6 +27,8 @@ class RingBuffer:
         Получить текущее количество элементов внутри буфера
     get_maxsize(self) -> int
         Получить максимальный размер буфера
+    peek_newest(self) -> Any
+        Получить самый новый элемент (без удаления из буфера)
     """
 
     def __init__(self, size: int, iterable: Iterable[Any] = ()):
@@ -99,6 +102,41 @@ class RingBuffer:
         """
         return self._buffer.maxlen
 
+    def peek_newest(self) -> Any:
+        """
+        Получить самый новый элемент (без удаления из буфера)
+
+        :rtype: Any
+        :return: Самый новый элемент. Если буфер пуст - то None
+        """
+        return self._buffer[-1] if self._buffer else None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """
+        Получить элемент по порядковому номеру от самого старого (0) или список элементов по срезу.
+        Отрицательные номера отсчитываются от самого нового элемента.
+        Доступ к элементам у краёв буфера - O(1), в середине - пропорционально расстоянию до ближайшего края.
+        Срез с шагом, отличным от 1, копирует буфер в список один раз - O(n)
+
+        :param index: Порядковый номер или срез
+        :type index: int | slice
+
+        :rtype: Any
+        :return: Элемент или список элементов среза
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._buffer))
+            if step == 1:
+                return list(islice(self._buffer, start, max(start, stop)))
+            return list(self._buffer)[index]
+        return self._buffer[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._buffer)
+
     def __str__(self):
         return f'{list(self._buffer)}'
 
@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 
@@ -34,6 +34,8 @@ class AnotherRingBuffer:
     set_maxsize(self, size: int)
         Изменить максимальный размер буфера. Если новый размер меньше первоначального - буфер уменьшится с удалением
         самых старых данных
+    peek_newest(self) -> Any
+        Получить самый новый элемент (без удаления из буфера)
     """
 
     def __init__(self, size: int, iterable: Iterable[Any] = ()):
@@ -148,6 +150,18 @@ class AnotherRingBuffer:
         elif self._maxsize < size:
             self._maxsize = size
 
+    def peek_newest(self) -> Any:
+        """
+        Получить самый новый элемент - последний в порядке извлечения (без удаления из буфера)
+
+        :rtype: Any
+        :return: Самый новый элемент. Если буфер пуст - то None
+        """
+        if self._is_not_empty_buffer():
+            return self._buffer[self._pointer - 1]
+        else:
+            return None
+
     def _cut_buffer(self, size: int):
         """
         Уменьшить размер буфера и удалить лишние элементы
@@ -195,6 +209,57 @@ class AnotherRingBuffer:
         """
         return self._pointer >= len(self._buffer)
 
+    def _physical_index(self, index: int) -> int:
+        """
+        Перевести порядковый номер элемента (от самого старого, отрицательный - от самого нового)
+        в индекс внутреннего списка
+
+        :param index: Порядковый номер элемента
+        :type index: int
+        :rtype: int
+        :return: Индекс элемента во внутреннем списке
+        """
+        size = len(self._buffer)
+        if not -size <= index < size:
+            raise IndexError('Ring buffer index out of range')
+        return (self._pointer + index) % size
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """
+        Получить элемент по порядковому номеру от самого старого (0) за O(1) или список элементов по срезу.
+        Отрицательные номера отсчитываются от самого нового элемента.
+        Срез с шагом 1 собирается не более чем из двух копируемых отрезков внутреннего списка
+
+        :param index: Порядковый номер или срез
+        :type index: int | slice
+
+        :rtype: Any
+        :return: Элемент или список элементов среза
+        """
+        if not isinstance(index, slice):
+            return self._buffer[self._physical_index(index)]
+
+        size = len(self._buffer)
+        start, stop, step = index.indices(size)
+        if step != 1:
+            return [self._buffer[(self._pointer + position) % size] for position in range(start, stop, step)]
+        if start >= stop:
+            return []
+        first, last = self._pointer + start, self._pointer + stop
+        if last <= size:
+            return self._buffer[first:last]
+        if first >= size:
+            return self._buffer[first - size:last - size]
+        return self._buffer[first:] + self._buffer[:last - size]
+
+    def __iter__(self) -> Iterator[Any]:
+        size = len(self._buffer)
+        for position in range(size):
+            yield self._buffer[(self._pointer + position) % size]
+
     def __str__(self):
         return f'{self._buffer}'
 
@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 
@@ -38,6 +38,8 @@ class YetAnotherRingBuffer:
     set_maxsize(self, size: int)
         Изменить максимальный размер буфера. Если новый размер меньше первоначального - буфер уменьшится с удалением
         самых старых данных
+    peek_newest(self) -> Any
+        Получить самый новый элемент (без удаления из буфера)
     """
 
     def __init__(self, size: int, iterable: Iterable[Any] = ()):
@@ -148,6 +150,15 @@ class YetAnotherRingBuffer:
         elif self._maxsize < size:
             self._extend_buffer(size)
 
+    def peek_newest(self) -> Any:
+        """
+        Получить самый новый элемент (без удаления из буфера)
+
+        :rtype: Any
+        :return: Самый новый элемент. Если буфер пуст - то None
+        """
+        return self._buffer[(self._newest_cell - 1) % self._maxsize]
+
     def _cut_buffer(self, size: int):
         """
         Создать новый буфер меньшего размера с переносом данных
@@ -239,6 +250,43 @@ class YetAnotherRingBuffer:
             self._increment_oldest()
         self._decrement_size()
 
+    def _physical_index(self, index: int) -> int:
+        """
+        Перевести порядковый номер элемента (от самого старого, отрицательный - от самого нового)
+        в ключ ячейки словаря
+
+        :param index: Порядковый номер элемента
+        :type index: int
+        :rtype: int
+        :return: Ключ ячейки с элементом
+        """
+        if not -self._size <= index < self._size:
+            raise IndexError('Ring buffer index out of range')
+        return (self._oldest_cell + index % self._size) % self._maxsize
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """
+        Получить элемент по порядковому номеру от самого старого (0) за O(1) или список элементов по срезу.
+        Отрицательные номера отсчитываются от самого нового элемента
+
+        :param index: Порядковый номер или срез
+        :type index: int | slice
+
+        :rtype: Any
+        :return: Элемент или список элементов среза
+        """
+        if isinstance(index, slice):
+            return [self._buffer[(self._oldest_cell + position) % self._maxsize]
+                    for position in range(*index.indices(self._size))]
+        return self._buffer[self._physical_index(index)]
+
+    def __iter__(self) -> Iterator[Any]:
+        for position in range(self._size):
+            yield self._buffer[(self._oldest_cell + position) % self._maxsize]
+
     def __str__(self):
         return f'{list(self._buffer.values())}'
 
@@ -0,0 +1,259 @@
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+
+class BroadcastRingBuffer:
+    """
+    Класс циклического буфера с одним писателем и несколькими читателями (в стиле Disruptor)
+
+    Каждое событие хранится в буфере один раз, а каждый читатель получает все события независимо,
+    продвигая собственный курсор - порядковый номер следующего непрочитанного события.
+    Память - O(size) при любом количестве читателей.
+    Если читатель отстал на весь буфер, писатель либо перезаписывает старые события и читателю засчитывается
+    потеря (overwrite=True), либо ждёт, пока самый медленный читатель освободит место (overwrite=False)
+
+    Атрибуты
+    ----
+    _slots: list
+        Список заданного размера для хранения событий
+    _maxsize: int
+        Максимальный размер буфера
+    _sequence: int
+        Количество опубликованных писателем событий (номер следующего события)
+    _readers: list[BroadcastReader]
+        Зарегистрированные читатели
+    _overwrite: bool
+        Режим переполнения: True - перезапись с потерей у отставших читателей, False - ожидание писателя
+    _condition: threading.Condition
+        Условная переменная для ожидания писателя и синхронизации курсоров
+
+    Методы
+    ----
+    put(self, element: Any, timeout: float | None = None) -> bool
+        Опубликовать событие
+    extend(self, iterable: Iterable[Any])
+        Опубликовать последовательность событий
+    add_reader(self) -> BroadcastReader
+        Зарегистрировать нового читателя
+    remove_reader(self, reader: BroadcastReader)
+        Отменить регистрацию читателя
+    get_sequence(self) -> int
+        Получить количество опубликованных событий
+    get_maxsize(self) -> int
+        Получить максимальный размер буфера
+    """
+
+    def __init__(self, size: int, overwrite: bool = True):
+        """
+        Создать буфер с заданным размером size (обязателен, больше 0)
+
+        :param size: Максимальное количество хранимых событий
+        :type size: int
+        :param overwrite: True - перезаписывать события, не прочитанные отставшими читателями,
+            False - ждать самого медленного читателя
+        :type overwrite: bool
+        """
+        if size <= 0:
+            raise ValueError('Size must be greater than zero')
+        self._maxsize = size
+        self._slots = [None] * size
+        self._sequence = 0
+        self._readers = []
+        self._overwrite = overwrite
+        self._condition = threading.Condition()
+
+    def put(self, element: Any, timeout: float | None = None) -> bool:
+        """
+        Опубликовать событие. В режиме ожидания писатель блокируется, пока самый медленный читатель
+        не освободит место
+
+        :param element: Публикуемое событие
+        :type element: Any
+        :param timeout: Максимальное время ожидания в секундах (None - без ограничения)
+        :type timeout: float | None
+
+        :rtype: bool
+        :return: True, если событие опубликовано. False, если время ожидания истекло
+        """
+        with self._condition:
+            if not self._overwrite and not self._condition.wait_for(self._has_free_slot, timeout):
+                return False
+            self._slots[self._sequence % self._maxsize] = element
+            self._sequence += 1
+            self._condition.notify_all()
+            return True
+
+    def extend(self, iterable: Iterable[Any]):
+        """
+        Опубликовать последовательность событий
+
+        :param iterable: Публикуемая последовательность
+        :type iterable: Iterable[Any]
+
+        :return: None
+        """
+        for element in iterable:
+            self.put(element)
+
+    def add_reader(self) -> 'BroadcastReader':
+        """
+        Зарегистрировать нового читателя. Он получит события, опубликованные после регистрации
+
+        :rtype: BroadcastReader
+        :return: Читатель с собственным курсором
+        """
+        with self._condition:
+            reader = BroadcastReader(self, self._sequence)
+            self._readers.append(reader)
+            return reader
+
+    def remove_reader(self, reader: 'BroadcastReader'):
+        """
+        Отменить регистрацию читателя: писатель перестаёт его ждать
+
+        :param reader: Читатель этого буфера
+        :type reader: BroadcastReader
+
+        :return: None
+        """
+        with self._condition:
+            self._readers.remove(reader)
+            self._condition.notify_all()
+
+    def get_sequence(self) -> int:
+        """
+        Получить количество опубликованных событий
+
+        :rtype: int
+        :return: Номер следующего публикуемого события
+        """
+        return self._sequence
+
+    def get_maxsize(self) -> int:
+        """
+        Получить максимальный размер буфера
+
+        :rtype: int
+        :return: Максимальный размер буфера
+        """
+        return self._maxsize
+
+    def _has_free_slot(self) -> bool:
+        """
+        Проверить, что запись следующего события не затрёт непрочитанное событие ни у одного читателя
+
+        :rtype: bool
+        :return: True, если можно писать. Иначе False
+        """
+        if not self._readers:
+            return True
+        return self._sequence - min(reader._cursor for reader in self._readers) < self._maxsize
+
+    def _read(self, reader: 'BroadcastReader', max_items: int | None) -> list[Any]:
+        """
+        Прочитать пачку событий для читателя и сдвинуть его курсор.
+        Если часть событий уже перезаписана, курсор переносится на самое старое хранимое событие,
+        а пропущенные события засчитываются в потери читателя
+
+        :param reader: Читатель
+        :type reader: BroadcastReader
+        :param max_items: Максимальный размер пачки (None - все доступные события)
+        :type max_items: int | None
+
+        :rtype: list[Any]
+        :return: События в порядке публикации
+        """
+        if max_items is not None and max_items < 0:
+            raise ValueError('Max items must not be negative')
+        with self._condition:
+            available = self._sequence - reader._cursor
+            if available > self._maxsize:
+                reader._overrun += available - self._maxsize
+                reader._cursor = self._sequence - self._maxsize
+                available = self._maxsize
+            count = available if max_items is None else min(available, max_items)
+
+            start = reader._cursor % self._maxsize
+            if start + count <= self._maxsize:
+                batch = self._slots[start:start + count]
+            else:
+                batch = self._slots[start:] + self._slots[:start + count - self._maxsize]
+            reader._cursor += count
+            if count and not self._overwrite:
+                self._condition.notify_all()
+            return batch
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(sequence={self._sequence}, readers={len(self._readers)}, ' \
+               f'maxsize={self._maxsize})'
+
+
+class BroadcastReader:
+    """
+    Класс читателя BroadcastRingBuffer с собственным курсором
+
+    Атрибуты
+    ----
+    _buffer: BroadcastRingBuffer
+        Буфер, из которого читаются события
+    _cursor: int
+        Номер следующего непрочитанного события
+    _overrun: int
+        Количество событий, перезаписанных до того, как читатель их прочитал
+
+    Методы
+    ----
+    read(self, max_items: int | None = None) -> list
+        Прочитать пачку доступных событий
+    get_lag(self) -> int
+        Получить количество непрочитанных событий
+    get_overrun(self) -> int
+        Получить количество потерянных событий
+    """
+
+    def __init__(self, buffer: BroadcastRingBuffer, cursor: int):
+        """
+        Создать читателя. Используйте BroadcastRingBuffer.add_reader
+
+        :param buffer: Буфер, из которого читаются события
+        :type buffer: BroadcastRingBuffer
+        :param cursor: Номер первого события, которое получит читатель
+        :type cursor: int
+        """
+        self._buffer = buffer
+        self._cursor = cursor
+        self._overrun = 0
+
+    def read(self, max_items: int | None = None) -> list[Any]:
+        """
+        Прочитать пачку событий, опубликованных до текущего момента (без ожидания новых)
+
+        :param max_items: Максимальный размер пачки (не меньше 0, None - все доступные события)
+        :type max_items: int | None
+
+        :rtype: list[Any]
+        :return: События в порядке публикации. Пустой список, если новых событий нет
+        """
+        return self._buffer._read(self, max_items)
+
+    def get_lag(self) -> int:
+        """
+        Получить количество опубликованных, но ещё не прочитанных событий (включая перезаписанные)
+
+        :rtype: int
+        :return: Отставание читателя от писателя
+        """
+        return self._buffer.get_sequence() - self._cursor
+
+    def get_overrun(self) -> int:
+        """
+        Получить количество событий, перезаписанных до того, как читатель их прочитал
+
+        :rtype: int
+        :return: Количество потерянных событий
+        """
+        return self._overrun
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(cursor={self._cursor}, overrun={self._overrun})'
@@ -0,0 +1,256 @@
+import struct
+from collections.abc import Iterable, Iterator
+
+_LENGTH = struct.Struct('<I')
+_WRAP_MARKER = 0xFFFFFFFF
+
+
+class ByteRingBuffer:
+    """
+    Класс реализация циклического буфера FIFO для записей переменной длины в одном заранее выделенном bytearray
+
+    Каждая запись хранится как 4 байта длины и следом её байты. Запись никогда не разрывается концом буфера:
+    если она не помещается до конца, в оставшееся место пишется метка переноса и запись начинается с нулевого
+    смещения. Поэтому чтение возвращает memoryview на непрерывный участок буфера без копирования.
+    Если новой записи не хватает места, самые старые записи вытесняются, пока она не поместится
+
+    Атрибуты
+    ----
+    _arena: bytearray
+        Заранее выделенная память для записей
+    _maxsize: int
+        Размер буфера в байтах
+    _oldest_offset: int
+        Смещение самой старой записи
+    _newest_offset: int
+        Смещение, с которого будет записана следующая запись
+    _size: int
+        Текущее количество записей
+    _used: int
+        Количество байт, занятых записями вместе с их длинами
+
+    Методы
+    ----
+    put(self, record: bytes)
+        Добавить запись в буфер
+    extend(self, iterable: Iterable[bytes])
+        Добавить последовательность записей
+    pop(self) -> memoryview
+        Получить самую старую запись (с удалением из буфера)
+    get(self) -> memoryview
+        Получить самую старую запись (без удаления из буфера)
+    clear(self)
+        Удалить из буфера все записи
+    get_size(self) -> int
+        Получить текущее количество записей
+    get_used(self) -> int
+        Получить количество занятых байт
+    get_maxsize(self) -> int
+        Получить размер буфера в байтах
+    """
+
+    def __init__(self, size: int, iterable: Iterable[bytes] = ()):
+        """
+        Создать буфер размером size байт (обязателен, больше 4 и меньше 2^32 - 1)
+        из последовательности записей iterable (может отсутствовать)
+
+        :param size: Размер буфера в байтах
+        :type size: int
+        :param iterable: Последовательность записей, которую необходимо занести в буфер
+        :type iterable: Iterable[bytes]
+        """
+        if size <= _LENGTH.size:
+            raise ValueError(f'Size must be greater than {_LENGTH.size} bytes')
+        if size >= _WRAP_MARKER:
+            raise ValueError('Size must be less than 2^32 - 1 bytes')
+        self._maxsize = size
+        self._arena = bytearray(size)
+        self._oldest_offset = 0
+        self._newest_offset = 0
+        self._size = 0
+        self._used = 0
+        self.extend(iterable)
+
+    def put(self, record: bytes):
+        """
+        Добавить запись в буфер, вытеснив при необходимости самые старые записи
+
+        :param record: Байты записи (bytes, bytearray, memoryview)
+        :type record: bytes
+
+        :return: None
+        """
+        length = len(record)
+        needed = _LENGTH.size + length
+        if needed > self._maxsize:
+            raise ValueError('Record is larger than the buffer')
+
+        offset = self._find_space(needed)
+        while offset is None:
+            self._evict()
+            offset = self._find_space(needed)
+
+        if offset < self._newest_offset:
+            if self._maxsize - self._newest_offset >= _LENGTH.size:
+                _LENGTH.pack_into(self._arena, self._newest_offset, _WRAP_MARKER)
+            self._used += self._maxsize - self._newest_offset
+        _LENGTH.pack_into(self._arena, offset, length)
+        self._arena[offset + _LENGTH.size:offset + needed] = record
+        self._newest_offset = offset + needed
+        self._used += needed
+        self._size += 1
+
+    def extend(self, iterable: Iterable[bytes]):
+        """
+        Добавить последовательность записей
+
+        :param iterable: Добавляемая последовательность записей
+        :type iterable: Iterable[bytes]
+
+        :return: None
+        """
+        for record in iterable:
+            self.put(record)
+
+    def pop(self) -> memoryview | None:
+        """
+        Получить самую старую запись (с удалением из буфера).
+        Возвращается memoryview без копирования: он действителен до следующего вызова put
+
+        :rtype: memoryview | None
+        :return: Самая старая запись. Если буфер пуст - то None
+        """
+        record = self.get()
+        if record is not None:
+            self._evict()
+        return record
+
+    def get(self) -> memoryview | None:
+        """
+        Получить самую старую запись (без удаления из буфера).
+        Возвращается memoryview без копирования: он действителен, пока запись не вытеснена
+
+        :rtype: memoryview | None
+        :return: Самая старая запись. Если буфер пуст - то None
+        """
+        if not self._size:
+            return None
+        return self._record_at(self._oldest_offset)
+
+    def clear(self):
+        """
+        Удалить из буфера все записи
+
+        :return: None
+        """
+        self._oldest_offset = 0
+        self._newest_offset = 0
+        self._size = 0
+        self._used = 0
+
+    def get_size(self) -> int:
+        """
+        Получить текущее количество записей
+
+        :rtype: int
+        :return: Количество записей внутри буфера
+        """
+        return self._size
+
+    def get_used(self) -> int:
+        """
+        Получить количество занятых байт (записи, их длины и место, пропущенное при переносе)
+
+        :rtype: int
+        :return: Количество занятых байт
+        """
+        return self._used
+
+    def get_maxsize(self) -> int:
+        """
+        Получить размер буфера в байтах
+
+        :rtype: int
+        :return: Размер буфера
+        """
+        return self._maxsize
+
+    def _find_space(self, needed: int) -> int | None:
+        """
+        Найти непрерывное свободное место для записи вместе с длиной
+
+        :param needed: Количество байт
+        :type needed: int
+        :rtype: int | None
+        :return: Смещение для записи. None, если места нет и нужно вытеснить самую старую запись
+        """
+        if not self._size:
+            self._oldest_offset = self._newest_offset = 0
+            return 0
+        if self._newest_offset > self._oldest_offset:
+            if needed <= self._maxsize - self._newest_offset:
+                return self._newest_offset
+            if needed <= self._oldest_offset:
+                return 0
+            return None
+        if self._newest_offset < self._oldest_offset and needed <= self._oldest_offset - self._newest_offset:
+            return self._newest_offset
+        return None
+
+    def _evict(self):
+        """
+        Удалить самую старую запись и перейти к следующей, пропустив метку переноса
+
+        :return: None
+        """
+        length = _LENGTH.unpack_from(self._arena, self._oldest_offset)[0]
+        self._oldest_offset += _LENGTH.size + length
+        self._used -= _LENGTH.size + length
+        self._size -= 1
+        if not self._size:
+            self.clear()
+        elif self._is_wrap_point(self._oldest_offset):
+            self._used -= self._maxsize - self._oldest_offset
+            self._oldest_offset = 0
+
+    def _is_wrap_point(self, offset: int) -> bool:
+        """
+        Проверить, что со смещения offset записи продолжаются с начала буфера
+
+        :param offset: Смещение
+        :type offset: int
+        :rtype: bool
+        :return: True, если до конца буфера меньше 4 байт или по смещению записана метка переноса. Иначе False
+        """
+        return self._maxsize - offset < _LENGTH.size or _LENGTH.unpack_from(self._arena, offset)[0] == _WRAP_MARKER
+
+    def _record_at(self, offset: int) -> memoryview:
+        """
+        Получить запись по смещению её длины без копирования
+
+        :param offset: Смещение длины записи
+        :type offset: int
+        :rtype: memoryview
+        :return: Байты записи
+        """
+        length = _LENGTH.unpack_from(self._arena, offset)[0]
+        start = offset + _LENGTH.size
+        return memoryview(self._arena)[start:start + length]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[memoryview]:
+        offset = self._oldest_offset
+        for _ in range(self._size):
+            record = self._record_at(offset)
+            offset += _LENGTH.size + len(record)
+            if self._is_wrap_point(offset):
+                offset = 0
+            yield record
+
+    def __str__(self):
+        return f'{[bytes(record) for record in self]}'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({[bytes(record) for record in self]}, maxsize={self._maxsize})'
@@ -0,0 +1,286 @@
+import struct
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+_FLOAT_BITS = struct.Struct('<d')
+_UINT_BITS = struct.Struct('<Q')
+_KINDS = ('int', 'float')
+
+
+class CompressedRingBuffer:
+    """
+    Класс реализация циклического буфера FIFO для чисел, хранящихся в сжатых блоках
+
+    Новые значения копятся в несжатом хвосте. Заполненный хвост из block_size значений упаковывается в блок:
+    для целых - разности соседних значений в zigzag-кодировке, для вещественных - XOR соседних значений
+    в битовом представлении (как в Gorilla), в обоих случаях упакованные одинаковым минимальным числом бит.
+    Медленно меняющиеся счётчики и метки времени занимают несколько бит на значение вместо объекта int.
+    Самые старые значения вытесняются логически, а память освобождается удалением блока целиком,
+    когда из него вытеснено последнее значение. Блок распаковывается только при чтении
+
+    Атрибуты
+    ----
+    _blocks: deque[tuple]
+        Упакованные блоки: (количество, первое значение, ширина в битах, сдвиг, байты)
+    _tail: deque
+        Несжатые значения, ещё не упакованные в блок
+    _skip: int
+        Количество вытесненных значений самого старого блока
+    _decoded: list | None
+        Распакованный самый старый блок (кэш для pop и get)
+    _maxsize: int
+        Максимальный размер буфера
+    _block_size: int
+        Количество значений в блоке
+    _kind: str
+        Тип значений: 'int' или 'float'
+    _size: int
+        Текущая заполненность буфера
+
+    Методы
+    ----
+    put(self, element: int | float)
+        Добавить значение в буфер
+    extend(self, iterable: Iterable[int | float])
+        Добавить последовательность значений
+    pop(self) -> int | float
+        Получить самое старое значение (с удалением из буфера)
+    get(self) -> int | float
+        Получить самое старое значение (без удаления из буфера)
+    clear(self)
+        Удалить из буфера все значения
+    get_size(self) -> int
+        Получить текущую заполненность буфера
+    get_maxsize(self) -> int
+        Получить максимальный размер буфера
+    set_maxsize(self, size: int)
+        Изменить максимальный размер буфера
+    get_nbytes(self) -> int
+        Получить размер упакованных данных в байтах
+    """
+
+    def __init__(self, size: int, iterable: Iterable[int | float] = (), block_size: int = 256, kind: str = 'int'):
+        """
+        Создать буфер с заданным размером size (обязателен, больше 0)
+        из последовательности iterable (может отсутствовать)
+
+        :param size: Максимальное количество значений буфера
+        :type size: int
+        :param iterable: Последовательность, которую необходимо занести в буфер
+        :type iterable: Iterable[int | float]
+        :param block_size: Количество значений в упакованном блоке (больше 0)
+        :type block_size: int
+        :param kind: Тип значений: 'int' - целые, 'float' - вещественные
+        :type kind: str
+        """
+        if size <= 0:
+            raise ValueError('Size must be greater than zero')
+        if block_size <= 0:
+            raise ValueError('Block size must be greater than zero')
+        if kind not in _KINDS:
+            raise ValueError(f'Kind must be one of {_KINDS}')
+        self._maxsize = size
+        self._block_size = block_size
+        self._kind = kind
+        self._blocks = deque()
+        self._tail = deque()
+        self._skip = 0
+        self._decoded = None
+        self._size = 0
+        self.extend(iterable)
+
+    def put(self, element: int | float):
+        """
+        Добавить значение в буфер. Если буфер заполнен, самое старое значение вытесняется
+
+        :param element: Добавляемое значение
+        :type element: int | float
+
+        :return: None
+        """
+        self._tail.append(element)
+        if len(self._tail) == self._block_size:
+            self._blocks.append(self._encode(self._tail))
+            self._tail = deque()
+        if self._size == self._maxsize:
+            self._drop_oldest()
+        else:
+            self._size += 1
+
+    def extend(self, iterable: Iterable[int | float]):
+        """
+        Добавить последовательность значений
+
+        :param iterable: Добавляемая итерируемая последовательность
+        :type iterable: Iterable[int | float]
+
+        :return: None
+        """
+        for element in iterable:
+            self.put(element)
+
+    def pop(self) -> int | float | None:
+        """
+        Получить самое старое значение (с удалением из буфера)
+
+        :rtype: int | float | None
+        :return: Самое старое значение. Если буфер пуст - то None
+        """
+        element = self.get()
+        if self._size:
+            self._drop_oldest()
+            self._size -= 1
+        return element
+
+    def get(self) -> int | float | None:
+        """
+        Получить самое старое значение (без удаления из буфера)
+
+        :rtype: int | float | None
+        :return: Самое старое значение. Если буфер пуст - то None
+        """
+        if not self._size:
+            return None
+        if not self._blocks:
+            return self._tail[0]
+        if self._decoded is None:
+            self._decoded = self._decode(self._blocks[0])
+        return self._decoded[self._skip]
+
+    def clear(self):
+        """
+        Удалить из буфера все значения
+
+        :return: None
+        """
+        self._blocks.clear()
+        self._tail.clear()
+        self._skip = 0
+        self._decoded = None
+        self._size = 0
+
+    def get_size(self) -> int:
+        """
+        Получить текущую заполненность буфера
+
+        :rtype: int
+        :return: Текущее количество значений внутри буфера
+        """
+        return self._size
+
+    def get_maxsize(self) -> int:
+        """
+        Получить максимальный размер буфера
+
+        :rtype: int
+        :return: Максимальный размер буфера
+        """
+        return self._maxsize
+
+    def set_maxsize(self, size: int):
+        """
+        Изменить максимальный размер буфера. Если новый размер меньше текущей заполненности - самые старые значения
+        вытесняются
+
+        :param size: Новый максимальный размер буфера
+        :type size: int
+        :return: None
+        """
+        if size <= 0:
+            raise ValueError('Size must be greater than zero')
+        while self._size > size:
+            self.pop()
+        self._maxsize = size
+
+    def get_nbytes(self) -> int:
+        """
+        Получить размер упакованных данных в байтах (без накладных расходов на объекты блоков и несжатый хвост)
+
+        :rtype: int
+        :return: Суммарный размер упакованных блоков
+        """
+        return sum(len(block[4]) for block in self._blocks)
+
+    def _drop_oldest(self):
+        """
+        Вытеснить самое старое значение. Блок удаляется целиком, когда из него вытеснено последнее значение
+
+        :return: None
+        """
+        if not self._blocks:
+            self._tail.popleft()
+            return
+        self._skip += 1
+        if self._skip == self._blocks[0][0]:
+            self._blocks.popleft()
+            self._skip = 0
+            self._decoded = None
+
+    def _encode(self, values: Iterable[int | float]) -> tuple[int, int, int, int, bytes]:
+        """
+        Упаковать значения в блок: разности (zigzag) или XOR соседних значений одинаковой минимальной ширины
+
+        :param values: Значения блока
+        :type values: Iterable[int | float]
+        :rtype: tuple[int, int, int, int, bytes]
+        :return: Количество значений, первое значение, ширина в битах, сдвиг и упакованные байты
+        """
+        if self._kind == 'float':
+            values = [_UINT_BITS.unpack(_FLOAT_BITS.pack(value))[0] for value in values]
+            codes = [current ^ previous for previous, current in zip(values, values[1:])]
+        else:
+            values = list(values)
+            codes = [current - previous for previous, current in zip(values, values[1:])]
+            codes = [code << 1 if code >= 0 else (-code << 1) - 1 for code in codes]
+
+        # Общие младшие нулевые биты (у XOR вещественных чисел их обычно много) не хранятся
+        common = 0
+        for code in codes:
+            common |= code
+        shift = (common & -common).bit_length() - 1 if common else 0
+        width = (common >> shift).bit_length()
+        if not width:
+            return len(values), values[0], 0, 0, b''
+        bits = ''.join(format(code >> shift, f'0{width}b') for code in reversed(codes))
+        return len(values), values[0], width, shift, int(bits, 2).to_bytes((len(bits) + 7) // 8, 'little')
+
+    def _decode(self, block: tuple[int, int, int, int, bytes]) -> list[int | float]:
+        """
+        Распаковать блок
+
+        :param block: Упакованный блок
+        :type block: tuple[int, int, int, int, bytes]
+        :rtype: list[int | float]
+        :return: Значения блока
+        """
+        count, first, width, shift, payload = block
+        if width:
+            bits = format(int.from_bytes(payload, 'little'), f'0{(count - 1) * width}b')
+            codes = [int(bits[start - width:start], 2) << shift for start in range(len(bits), 0, -width)]
+        else:
+            codes = [0] * (count - 1)
+
+        values = [first]
+        if self._kind == 'float':
+            for code in codes:
+                values.append(values[-1] ^ code)
+            return [_FLOAT_BITS.unpack(_UINT_BITS.pack(value))[0] for value in values]
+        for code in codes:
+            values.append(values[-1] + (code >> 1 if not code & 1 else -((code + 1) >> 1)))
+        return values
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int | float]:
+        skip = self._skip
+        for block in list(self._blocks):
+            yield from self._decode(block)[skip:]
+            skip = 0
+        yield from list(self._tail)
+
+    def __str__(self):
+        return f'{list(self)}'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self)}, maxsize={self._maxsize})'
@@ -0,0 +1,373 @@
+import time
+from collections.abc import Iterable
+
+from solutions.task_2_1 import RingBuffer
+
+
+class Consolidated:
+    """
+    Класс сводной точки: минимум, максимум, среднее и последнее значение за отрезок времени
+
+    Атрибуты
+    ----
+    start: float
+        Метка времени первого значения
+    end: float
+        Метка времени последнего значения
+    count: int
+        Количество исходных значений
+    minimum: float
+        Минимальное значение
+    maximum: float
+        Максимальное значение
+    total: float
+        Сумма значений
+    last: float
+        Последнее значение
+
+    Методы
+    ----
+    add(self, other: Consolidated)
+        Добавить к точке более новую точку
+    """
+    __slots__ = ('start', 'end', 'count', 'minimum', 'maximum', 'total', 'last')
+
+    def __init__(self, timestamp: float, value: float):
+        """
+        Создать точку из одного значения
+
+        :param timestamp: Метка времени
+        :type timestamp: float
+        :param value: Значение
+        :type value: float
+        """
+        self.start = self.end = timestamp
+        self.count = 1
+        self.minimum = self.maximum = self.total = self.last = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
+    def add(self, other: 'Consolidated'):
+        """
+        Добавить к точке более новую точку
+
+        :param other: Точка, следующая за этой по времени
+        :type other: Consolidated
+
+        :return: None
+        """
+        self.end = other.end
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.total += other.total
+        self.last = other.last
+
+    def copy(self) -> 'Consolidated':
+        """
+        Получить копию точки
+
+        :rtype: Consolidated
+        :return: Новая точка с теми же значениями
+        """
+        point = Consolidated.__new__(Consolidated)
+        for name in self.__slots__:
+            setattr(point, name, getattr(self, name))
+        return point
+
+    def __eq__(self, other):
+        if not isinstance(other, Consolidated):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(start={self.start}, end={self.end}, count={self.count}, ' \
+               f'min={self.minimum}, max={self.maximum}, mean={self.mean}, last={self.last})'
+
+
+class DownsamplingRingBuffer:
+    """
+    Класс каскада циклических буферов с понижением разрешения (как в RRDtool)
+
+    Уровень 0 хранит исходные значения. Значения, вытесняемые из уровня, собираются по factor штук
+    в сводную точку (минимум, максимум, среднее, последнее), которая записывается в следующий, более грубый уровень.
+    Так каждый следующий уровень хранит более старые данные с меньшей детализацией,
+    а память ограничена суммой размеров уровней
+
+    Атрибуты
+    ----
+    _levels: list[RingBuffer]
+        Уровни от исходных значений к самому грубому
+    _factors: list[int]
+        Количество точек предыдущего уровня в одной точке уровня (для уровня 0 - 1)
+    _pending: list[Consolidated | None]
+        Собираемая, ещё не записанная точка каждого уровня
+    _pending_count: list[int]
+        Количество точек предыдущего уровня, собранных в _pending
+    _interval: float
+        Ожидаемый интервал между исходными значениями в секундах
+
+    Методы
+    ----
+    put(self, value: float, timestamp: float | None = None)
+        Добавить значение
+    extend(self, iterable: Iterable[tuple[float, float]])
+        Добавить последовательность пар (метка времени, значение)
+    query(self, start: float, stop: float, resolution: float = 0) -> list[Consolidated]
+        Получить точки за отрезок времени с детализацией не грубее resolution
+    get_level(self, level: int) -> list[Consolidated]
+        Получить все точки уровня
+    get_resolutions(self) -> list[float]
+        Получить разрешение каждого уровня в секундах
+    get_size(self) -> int
+        Получить количество хранимых точек на всех уровнях
+    clear(self)
+        Удалить все значения
+    """
+
+    def __init__(self, size: int, levels: Iterable[tuple[int, int]] = (), interval: float = 1.0):
+        """
+        Создать каскад из уровня исходных значений размером size и более грубых уровней levels
+
+        :param size: Количество хранимых исходных значений (больше 0)
+        :type size: int
+        :param levels: Пары (factor, size) для каждого следующего уровня: сколько точек предыдущего уровня
+            сводится в одну точку (больше 1) и сколько точек хранится
+        :type levels: Iterable[tuple[int, int]]
+        :param interval: Ожидаемый интервал между исходными значениями в секундах, по нему считается разрешение уровней
+        :type interval: float
+        """
+        if interval <= 0:
+            raise ValueError('Interval must be greater than zero')
+        self._interval = interval
+        self._levels = [RingBuffer(self._check_size(size))]
+        self._factors = [1]
+        for factor, level_size in levels:
+            if factor <= 1:
+                raise ValueError('Factor must be greater than one')
+            self._levels.append(RingBuffer(self._check_size(level_size)))
+            self._factors.append(factor)
+        self._pending = [None] * len(self._levels)
+        self._pending_count = [0] * len(self._levels)
+
+    def put(self, value: float, timestamp: float | None = None):
+        """
+        Добавить значение. Вытесненные значения сводятся в более грубые уровни
+
+        :param value: Значение
+        :type value: float
+        :param timestamp: Метка времени в секундах (None - текущее время)
+        :type timestamp: float | None
+
+        :return: None
+        """
+        self._put(0, (time.time() if timestamp is None else timestamp, value))
+
+    def extend(self, iterable: Iterable[tuple[float, float]]):
+        """
+        Добавить последовательность пар (метка времени, значение)
+
+        :param iterable: Добавляемая последовательность
+        :type iterable: Iterable[tuple[float, float]]
+
+        :return: None
+        """
+        for timestamp, value in iterable:
+            self._put(0, (timestamp, value))
+
+    def query(self, start: float, stop: float, resolution: float = 0) -> list[Consolidated]:
+        """
+        Получить точки за отрезок времени [start, stop) из самого грубого уровня, разрешение которого не грубее
+        resolution. Более новые данные, ещё не сведённые в этот уровень, сводятся на лету из более детальных уровней
+        с тем же шагом, поэтому отрезок до самого нового значения покрывается точками одной детализации.
+        Данные старше хранимых в выбранном уровне остались только в более грубых уровнях
+        и возвращаются с самой подробной доступной детализацией
+
+        :param start: Начало отрезка (метка времени)
+        :type start: float
+        :param stop: Конец отрезка (метка времени, не включается)
+        :type stop: float
+        :param resolution: Допустимое разрешение в секундах на точку (0 - исходные значения)
+        :type resolution: float
+
+        :rtype: list[Consolidated]
+        :return: Точки в порядке времени, пересекающиеся с отрезком
+        """
+        level = self._choose_level(resolution)
+
+        # Данные старше уровня от старых к новым: точки самого грубого уровня, его собираемая точка
+        # и так далее до собираемой точки следующего за выбранным уровня
+        points = []
+        for coarser in range(len(self._levels) - 1, level, -1):
+            points.extend(point.copy() for point in self._level_points(coarser))
+            if self._pending[coarser] is not None:
+                points.append(self._pending[coarser].copy())
+        points.extend(point.copy() for point in self._level_points(level))
+
+        # Данные новее уровня от старых к новым: собираемая точка уровня, точки более детального уровня,
+        # его собираемая точка и так далее до исходных значений
+        newer = []
+        for finer in range(level, 0, -1):
+            if self._pending[finer] is not None:
+                newer.append(self._pending[finer])
+            newer.extend(self._level_points(finer - 1))
+
+        step = self._step(level)
+        group = None
+        for point in newer:
+            if group is None:
+                group = point.copy()
+            else:
+                group.add(point)
+            if group.count >= step:
+                points.append(group)
+                group = None
+        if group is not None:
+            points.append(group)
+        return [point for point in points if point.end >= start and point.start < stop]
+
+    def get_level(self, level: int) -> list[Consolidated]:
+        """
+        Получить все точки уровня (для уровня 0 - исходные значения в виде точек из одного значения)
+
+        :param level: Номер уровня
+        :type level: int
+
+        :rtype: list[Consolidated]
+        :return: Точки уровня в порядке времени
+        """
+        return [point.copy() for point in self._level_points(level)]
+
+    def get_resolutions(self) -> list[float]:
+        """
+        Получить разрешение каждого уровня в секундах на точку
+
+        :rtype: list[float]
+        :return: Разрешения уровней от исходного к самому грубому
+        """
+        return [self._step(level) * self._interval for level in range(len(self._levels))]
+
+    def get_size(self) -> int:
+        """
+        Получить количество хранимых точек на всех уровнях
+
+        :rtype: int
+        :return: Суммарное количество точек
+        """
+        return sum(level.get_size() for level in self._levels)
+
+    def clear(self):
+        """
+        Удалить все значения
+
+        :return: None
+        """
+        for level in self._levels:
+            level.clear()
+        self._pending = [None] * len(self._levels)
+        self._pending_count = [0] * len(self._levels)
+
+    @staticmethod
+    def _check_size(size: int) -> int:
+        """
+        Проверить размер уровня
+
+        :param size: Размер уровня
+        :type size: int
+        :rtype: int
+        :return: Тот же размер
+        """
+        if size <= 0:
+            raise ValueError('Size must be greater than zero')
+        return size
+
+    def _put(self, level: int, point: tuple[float, float] | Consolidated):
+        """
+        Записать точку в уровень. Если уровень заполнен, самая старая точка сводится в следующий уровень
+
+        :param level: Номер уровня
+        :type level: int
+        :param point: Исходное значение (метка времени, значение) для уровня 0 или сводная точка
+        :type point: tuple[float, float] | Consolidated
+
+        :return: None
+        """
+        buffer = self._levels[level]
+        if buffer.get_size() == buffer.get_maxsize():
+            evicted = buffer.pop()
+            if level + 1 < len(self._levels):
+                self._consolidate(level + 1, evicted if level else Consolidated(*evicted))
+        buffer.put(point)
+
+    def _consolidate(self, level: int, point: Consolidated):
+        """
+        Добавить вытесненную точку в собираемую точку уровня; собрав factor точек, записать её в уровень
+
+        :param level: Номер уровня
+        :type level: int
+        :param point: Точка, вытесненная из предыдущего уровня
+        :type point: Consolidated
+
+        :return: None
+        """
+        if self._pending[level] is None:
+            self._pending[level] = point
+        else:
+            self._pending[level].add(point)
+        self._pending_count[level] += 1
+        if self._pending_count[level] == self._factors[level]:
+            pending = self._pending[level]
+            self._pending[level] = None
+            self._pending_count[level] = 0
+            self._put(level, pending)
+
+    def _level_points(self, level: int) -> list[Consolidated]:
+        """
+        Получить точки уровня без копирования сводных точек
+
+        :param level: Номер уровня
+        :type level: int
+        :rtype: list[Consolidated]
+        :return: Точки уровня в порядке времени
+        """
+        if level:
+            return list(self._levels[level])
+        return [Consolidated(timestamp, value) for timestamp, value in self._levels[0]]
+
+    def _step(self, level: int) -> int:
+        """
+        Получить количество исходных значений в одной точке уровня
+
+        :param level: Номер уровня
+        :type level: int
+        :rtype: int
+        :return: Произведение factor уровней от 1 до level
+        """
+        step = 1
+        for factor in self._factors[1:level + 1]:
+            step *= factor
+        return step
+
+    def _choose_level(self, resolution: float) -> int:
+        """
+        Выбрать самый грубый уровень, разрешение которого не грубее resolution
+
+        :param resolution: Допустимое разрешение в секундах на точку
+        :type resolution: float
+        :rtype: int
+        :return: Номер уровня
+        """
+        level = 0
+        for candidate, candidate_resolution in enumerate(self.get_resolutions()):
+            if candidate_resolution <= resolution:
+                level = candidate
+        return level
+
+    def __len__(self) -> int:
+        return self.get_size()
+
+    def __repr__(self):
+        sizes = [level.get_size() for level in self._levels]
+        return f'{self.__class__.__name__}(sizes={sizes}, resolutions={self.get_resolutions()})'
@@ -0,0 +1,140 @@
+from collections.abc import Hashable, Iterable
+
+from solutions.task_2_1 import RingBuffer
+
+
+class DedupRingBuffer(RingBuffer):
+    """
+    Класс циклического буфера FIFO последних увиденных ключей с проверкой вхождения за O(1)
+
+    Рядом с буфером хранится словарь: ключ -> сколько раз он встречается в буфере.
+    Словарь обновляется при каждой записи и вытеснении, поэтому `key in buffer` и put_if_absent
+    не просматривают буфер. Элементы должны быть хешируемыми
+
+    Атрибуты
+    ----
+    _buffer: deque
+        Двусвязный список заданного размера для хранения данных
+    _counts: dict
+        Количество вхождений каждого ключа в буфер
+
+    Методы
+    ----
+    put(self, element: Hashable)
+        Добавить элемент в буфер
+    put_if_absent(self, element: Hashable) -> bool
+        Добавить элемент, если его нет в буфере
+    pop(self) -> Hashable
+        Получить самый старый элемент (с удалением из буфера)
+    extend(self, iterable: Iterable[Hashable])
+        Добавить последовательность элементов
+    clear(self)
+        Удалить из буфера все элементы
+    get_size(self) -> int
+        Получить текущее количество элементов внутри буфера
+    get_maxsize(self) -> int
+        Получить максимальный размер буфера
+    peek_newest(self) -> Hashable
+        Получить самый новый элемент (без удаления из буфера)
+    """
+
+    def __init__(self, size: int, iterable: Iterable[Hashable] = ()):
+        """
+        Создать буфер с заданным размером size (обязателен, больше 0)
+        из последовательности iterable (может отсутствовать)
+
+        :param size: Максимальное количество элементов буфера
+        :type size: int
+        :param iterable: Последовательность, которую необходимо занести в буфер
+        :type iterable: Iterable[Hashable]
+        """
+        if size <= 0:
+            raise ValueError('Size must be greater than zero')
+        super().__init__(size)
+        self._counts = {}
+        self.extend(iterable)
+
+    def put(self, element: Hashable):
+        """
+        Добавить элемент в буфер. Если буфер заполнен, самый старый элемент вытесняется
+
+        :param element: Объект, который необходимо добавить в буфер
+        :type element: Hashable
+
+        :return: None
+        """
+        # Словарь обновляется первым: для нехешируемого элемента TypeError возникнет до изменения буфера
+        self._counts[element] = self._counts.get(element, 0) + 1
+        if len(self._buffer) == self._buffer.maxlen:
+            self._forget(self._buffer[0])
+        self._buffer.append(element)
+
+    def put_if_absent(self, element: Hashable) -> bool:
+        """
+        Добавить элемент, если его нет в буфере
+
+        :param element: Объект, который необходимо добавить в буфер
+        :type element: Hashable
+
+        :rtype: bool
+        :return: True, если элемент добавлен. False, если он уже есть в буфере
+        """
+        if element in self._counts:
+            return False
+        self.put(element)
+        return True
+
+    def pop(self) -> Hashable:
+        """
+        Получить самый старый элемент (с удалением из буфера)
+
+        :rtype: Hashable
+        :return: Самый старый элемент. Если буфер пуст - то None
+        """
+        if not self._buffer:
+            return None
+        element = self._buffer.popleft()
+        self._forget(element)
+        return element
+
+    def extend(self, iterable: Iterable[Hashable]):
+        """
+        Добавить последовательность элементов
+
+        :param iterable: Добавляемая итерируемая последовательность
+        :type iterable: Iterable[Hashable]
+
+        :return: None
+        """
+        for element in iterable:
+            self.put(element)
+
+    def clear(self):
+        """
+        Удалить из буфера все элементы
+
+        :return: None
+        """
+        self._buffer.clear()
+        self._counts.clear()
+
+    def _forget(self, element: Hashable):
+        """
+        Уменьшить количество вхождений ключа, удаляемого из буфера
+
+        :param element: Удаляемый ключ
+        :type element: Hashable
+
+        :return: None
+        """
+        count = self._counts[element]
+        if count == 1:
+            del self._counts[element]
+        else:
+            self._counts[element] = count - 1
+
+    def __contains__(self, element: Hashable) -> bool:
+        return element in self._counts
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self._buffer)}, maxsize={self._buffer.maxlen})'
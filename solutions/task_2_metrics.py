@@ -0,0 +1,252 @@
+import time
+from collections import deque
+from functools import wraps
+from typing import Any
+
+OPERATIONS = ('put', 'pop', 'extend', 'set_maxsize')
+_BUCKETS = 64
+
+
+class RingBufferMetrics:
+    """
+    Класс метрик операций циклического буфера
+
+    Задержки операций складываются в гистограмму с логарифмическими корзинами: корзина b содержит
+    вызовы длительностью меньше 2^b наносекунд (и не меньше 2^(b-1))
+
+    Атрибуты
+    ----
+    name: str
+        Имя буфера (метка buffer в формате Prometheus)
+    counts: dict[str, int]
+        Количество вызовов каждой операции
+    total_ns: dict[str, int]
+        Суммарное время каждой операции в наносекундах
+    histograms: dict[str, list[int]]
+        Количество вызовов каждой операции по корзинам задержки
+    occupancy: deque[tuple[float, int]]
+        Последние замеры заполненности: (время, количество элементов) после каждой операции
+    resizes: list[tuple[float, int, int]]
+        Изменения максимального размера: (время, прежний размер, новый размер)
+    size: int
+        Заполненность буфера после последней операции
+    maxsize: int
+        Максимальный размер буфера после последней операции
+
+    Методы
+    ----
+    record(self, operation: str, elapsed_ns: int, size: int, maxsize: int)
+        Учесть вызов операции
+    record_resize(self, previous: int, maxsize: int)
+        Учесть изменение максимального размера
+    snapshot(self) -> dict
+        Получить метрики в виде словаря
+    to_prometheus(self) -> str
+        Получить метрики в текстовом формате Prometheus
+    """
+
+    def __init__(self, name: str = 'ring_buffer', occupancy_samples: int = 1024):
+        self.name = name
+        self.counts = {operation: 0 for operation in OPERATIONS}
+        self.total_ns = {operation: 0 for operation in OPERATIONS}
+        self.histograms = {operation: [0] * _BUCKETS for operation in OPERATIONS}
+        self.occupancy = deque(maxlen=occupancy_samples)
+        self.resizes = []
+        self.size = 0
+        self.maxsize = 0
+        self._depth = 0
+
+    def record(self, operation: str, elapsed_ns: int, size: int, maxsize: int):
+        """
+        Учесть вызов операции
+
+        :param operation: Имя операции
+        :type operation: str
+        :param elapsed_ns: Длительность вызова в наносекундах
+        :type elapsed_ns: int
+        :param size: Заполненность буфера после вызова
+        :type size: int
+        :param maxsize: Максимальный размер буфера после вызова
+        :type maxsize: int
+
+        :return: None
+        """
+        self.counts[operation] += 1
+        self.total_ns[operation] += elapsed_ns
+        self.histograms[operation][min(elapsed_ns.bit_length(), _BUCKETS - 1)] += 1
+        self.occupancy.append((time.time(), size))
+        self.size, self.maxsize = size, maxsize
+
+    def record_resize(self, previous: int, maxsize: int):
+        """
+        Учесть изменение максимального размера буфера
+
+        :param previous: Прежний максимальный размер
+        :type previous: int
+        :param maxsize: Новый максимальный размер
+        :type maxsize: int
+
+        :return: None
+        """
+        if previous != maxsize:
+            self.resizes.append((time.time(), previous, maxsize))
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Получить метрики в виде словаря
+
+        :rtype: dict[str, Any]
+        :return: Счётчики, суммарное время, гистограммы (верхняя граница корзины в наносекундах -> количество),
+            текущая и максимальная заполненность, замеры заполненности и изменения размера
+        """
+        return {
+            'name': self.name,
+            'counts': dict(self.counts),
+            'total_ns': dict(self.total_ns),
+            'histograms': {
+                operation: {2 ** bucket: count for bucket, count in enumerate(histogram) if count}
+                for operation, histogram in self.histograms.items()
+            },
+            'size': self.size,
+            'maxsize': self.maxsize,
+            'occupancy': list(self.occupancy),
+            'resizes': list(self.resizes),
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Получить метрики в текстовом формате Prometheus: счётчики вызовов и изменений размера,
+        гистограммы задержек в секундах и текущую заполненность
+
+        :rtype: str
+        :return: Текст для отдачи по HTTP (text/plain; version=0.0.4)
+        """
+        buffer = f'buffer="{self.name}"'
+        lines = [
+            '# HELP ring_buffer_operations_total Ring buffer operation calls',
+            '# TYPE ring_buffer_operations_total counter',
+        ]
+        lines += [f'ring_buffer_operations_total{{{buffer},operation="{operation}"}} {count}'
+                  for operation, count in self.counts.items()]
+
+        lines += [
+            '# HELP ring_buffer_operation_duration_seconds Ring buffer operation latency',
+            '# TYPE ring_buffer_operation_duration_seconds histogram',
+        ]
+        for operation, histogram in self.histograms.items():
+            labels = f'{buffer},operation="{operation}"'
+            last = max((bucket for bucket, count in enumerate(histogram) if count), default=0)
+            cumulative = 0
+            for bucket in range(last + 1):
+                cumulative += histogram[bucket]
+                lines.append(f'ring_buffer_operation_duration_seconds_bucket{{{labels},le="{2 ** bucket / 1e9:g}"}} '
+                             f'{cumulative}')
+            count = self.counts[operation]
+            lines.append(f'ring_buffer_operation_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'ring_buffer_operation_duration_seconds_sum{{{labels}}} {self.total_ns[operation] / 1e9:g}')
+            lines.append(f'ring_buffer_operation_duration_seconds_count{{{labels}}} {count}')
+
+        lines += [
+            '# HELP ring_buffer_resizes_total Ring buffer maximum size changes',
+            '# TYPE ring_buffer_resizes_total counter',
+            f'ring_buffer_resizes_total{{{buffer}}} {len(self.resizes)}',
+            '# HELP ring_buffer_size Ring buffer elements',
+            '# TYPE ring_buffer_size gauge',
+            f'ring_buffer_size{{{buffer}}} {self.size}',
+            '# HELP ring_buffer_maxsize Ring buffer maximum size',
+            '# TYPE ring_buffer_maxsize gauge',
+            f'ring_buffer_maxsize{{{buffer}}} {self.maxsize}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(name={self.name!r}, counts={self.counts})'
+
+
+def enable_instrumentation(buffer: Any, name: str = 'ring_buffer', occupancy_samples: int = 1024) -> RingBufferMetrics:
+    """
+    Включить сбор метрик для буфера (AnotherRingBuffer, YetAnotherRingBuffer или другого с теми же методами).
+    Методы put, pop, extend и set_maxsize заменяются обёртками только у этого экземпляра,
+    поэтому остальные буферы и сам класс не меняются, а после disable_instrumentation накладных расходов нет.
+    Учитываются только внешние вызовы: put внутри extend и pop/extend внутри set_maxsize входят во время
+    внешней операции, но не считаются отдельно
+
+    :param buffer: Буфер
+    :type buffer: Any
+    :param name: Имя буфера в метриках
+    :type name: str
+    :param occupancy_samples: Сколько последних замеров заполненности хранить
+    :type occupancy_samples: int
+
+    :rtype: RingBufferMetrics
+    :return: Метрики, которые обновляются при каждом вызове
+    """
+    if hasattr(buffer, '_metrics'):
+        raise ValueError('Instrumentation is already enabled')
+    metrics = RingBufferMetrics(name, occupancy_samples)
+    metrics.size, metrics.maxsize = buffer.get_size(), buffer.get_maxsize()
+    for operation in OPERATIONS:
+        method = getattr(buffer, operation, None)
+        if method is not None:
+            setattr(buffer, operation, _instrument(buffer, operation, method, metrics))
+    buffer._metrics = metrics
+    return metrics
+
+
+def disable_instrumentation(buffer: Any) -> RingBufferMetrics | None:
+    """
+    Выключить сбор метрик: вернуть буферу методы класса
+
+    :param buffer: Буфер
+    :type buffer: Any
+
+    :rtype: RingBufferMetrics | None
+    :return: Собранные метрики. None, если сбор метрик не был включён
+    """
+    metrics = vars(buffer).pop('_metrics', None)
+    for operation in OPERATIONS:
+        vars(buffer).pop(operation, None)
+    return metrics
+
+
+def _instrument(buffer: Any, operation: str, method: Any, metrics: RingBufferMetrics) -> Any:
+    """
+    Обернуть метод буфера замером времени
+
+    :param buffer: Буфер
+    :type buffer: Any
+    :param operation: Имя операции
+    :type operation: str
+    :param method: Связанный метод буфера
+    :type method: Any
+    :param metrics: Метрики, в которые записываются замеры
+    :type metrics: RingBufferMetrics
+
+    :rtype: Any
+    :return: Обёртка с той же сигнатурой
+    """
+    clock = time.perf_counter_ns
+
+    @wraps(method)
+    def instrumented(*args, **kwargs):
+        if metrics._depth:
+            return method(*args, **kwargs)
+        metrics._depth += 1
+        started = clock()
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            metrics._depth -= 1
+        metrics.record(operation, clock() - started, buffer.get_size(), buffer.get_maxsize())
+        return result
+
+    @wraps(method)
+    def instrumented_resize(*args, **kwargs):
+        if metrics._depth:
+            return method(*args, **kwargs)
+        previous = buffer.get_maxsize()
+        result = instrumented(*args, **kwargs)
+        metrics.record_resize(previous, buffer.get_maxsize())
+        return result
+
+    return instrumented_resize if operation == 'set_maxsize' else instrumented
@@ -1,13 +1,77 @@
+import logging
+import sys
+from bisect import bisect_left, bisect_right
 from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from math import isqrt
+from typing import Any
 
+from solutions.task_3_numpy import is_numeric_array, vectorized_merge_sort
+from solutions.task_3_radix import lsd_radix_sort, msd_radix_sort
 
-def merge_sort(array, low, high):
+logger = logging.getLogger(__name__)
+
+_IN_PLACE_MIN_BUFFER = 8
+_PRESORTED_RUNS_RATIO = 256
+_ADAPTIVE_RUNS_RATIO = 4
+_PARALLEL_MIN_SIZE = 4096
+
+
+def merge_sort(array, low, high, in_place=False, workers=1):
+    if workers > 1 and high - low + 1 >= _PARALLEL_MIN_SIZE and not is_gil_enabled():
+        _parallel_merge_sort(array, low, high, in_place, workers)
+        return
     if low < high:
         middle = int((low + high) / 2)
-        merge_sort(array, low, middle)
-        merge_sort(array, middle + 1, high)
+        merge_sort(array, low, middle, in_place)
+        merge_sort(array, middle + 1, high, in_place)
+
+        if in_place:
+            _merge_in_place(array, low, middle, high)
+        else:
+            _merge(array, low, middle, high)
+
+
+def is_gil_enabled() -> bool:
+    """
+    Проверить, включена ли глобальная блокировка интерпретатора (GIL).
+    В сборках CPython без GIL (3.13+) потоки сортируют части списка действительно параллельно
+
+    :rtype: bool
+    :return: True, если GIL включена или интерпретатор не умеет её отключать. Иначе False
+    """
+    check = getattr(sys, '_is_gil_enabled', None)
+    return True if check is None else check()
 
-        _merge(array, low, middle, high)
+
+def _parallel_merge_sort(array, low, high, in_place, workers):
+    """
+    Разбить диапазон на workers непересекающихся частей, отсортировать их одновременно в пуле потоков,
+    затем сливать соседние части попарно: слияния одного уровня дерева тоже выполняются одновременно
+
+    :param array: Список
+    :type array: list
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+    :param in_place: Сливать части без копирования диапазона (_merge_in_place)
+    :type in_place: bool
+    :param workers: Количество потоков
+    :type workers: int
+    :return: None
+    """
+    size = high - low + 1
+    bounds = [low + size * part // workers for part in range(workers + 1)]
+    merge = _merge_in_place if in_place else _merge
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda start, end: merge_sort(array, start, end - 1, in_place), bounds, bounds[1:]))
+        while len(bounds) > 2:
+            starts, middles, ends = bounds[0:-2:2], bounds[1:-1:2], bounds[2::2]
+            list(executor.map(lambda start, middle, end: merge(array, start, middle - 1, end - 1),
+                              starts, middles, ends))
+            bounds = bounds[::2] if len(bounds) % 2 else bounds[::2] + [bounds[-1]]
 
 
 def _merge(array, low, middle, high):
@@ -31,3 +95,363 @@ def _merge(array, low, middle, high):
     while right_array:
         array[i] = right_array.popleft()
         i += 1
+
+
+def _merge_in_place(array, low, middle, high):
+    """
+    Стабильно слить отсортированные части array[low:middle + 1] и array[middle + 1:high + 1] без копирования
+    диапазона: длинная часть делится пополам, парная ей точка в другой части находится бинарным поиском,
+    внутренние отрезки меняются местами поворотом, и обе половины сливаются рекурсивно.
+    Как только короткая часть помещается в буфер из O(sqrt(N)) элементов, слияние идёт обычным способом через буфер.
+    Дополнительная память - O(sqrt(N)) на буфер и повороты и O(logN) на рекурсию
+
+    :param array: Список
+    :type array: list
+    :param low: Начало левой части
+    :type low: int
+    :param middle: Конец левой части
+    :type middle: int
+    :param high: Конец правой части
+    :type high: int
+    :return: None
+    """
+    left_size = middle - low + 1
+    right_size = high - middle
+    if not left_size or not right_size:
+        return
+    if min(left_size, right_size) <= max(_IN_PLACE_MIN_BUFFER, isqrt(left_size + right_size)):
+        _merge_with_short_buffer(array, low, middle, high)
+        return
+
+    if left_size > right_size:
+        left_cut = low + left_size // 2
+        right_cut = bisect_left(array, array[left_cut], middle + 1, high + 1)
+    else:
+        right_cut = middle + 1 + right_size // 2
+        left_cut = bisect_right(array, array[right_cut], low, middle + 1)
+
+    _rotate(array, left_cut, middle + 1, right_cut)
+    new_middle = left_cut + (right_cut - middle - 1)
+    _merge_in_place(array, low, left_cut - 1, new_middle - 1)
+    _merge_in_place(array, new_middle, right_cut - 1, high)
+
+
+def _merge_with_short_buffer(array, low, middle, high):
+    """
+    Слить отсортированные части array[low:middle + 1] и array[middle + 1:high + 1], копируя в буфер
+    только более короткую из них. Если короче правая часть - слияние идёт с конца диапазона
+
+    :param array: Список
+    :type array: list
+    :param low: Начало левой части
+    :type low: int
+    :param middle: Конец левой части
+    :type middle: int
+    :param high: Конец правой части
+    :type high: int
+    :return: None
+    """
+    if middle - low < high - middle:
+        buffer = array[low:middle + 1]
+        i, j, k = 0, middle + 1, low
+        while i < len(buffer) and j <= high:
+            if array[j] < buffer[i]:
+                array[k] = array[j]
+                j += 1
+            else:
+                array[k] = buffer[i]
+                i += 1
+            k += 1
+        array[k:j] = buffer[i:]
+    else:
+        buffer = array[middle + 1:high + 1]
+        i, j, k = len(buffer) - 1, middle, high
+        while i >= 0 and j >= low:
+            if buffer[i] < array[j]:
+                array[k] = array[j]
+                j -= 1
+            else:
+                array[k] = buffer[i]
+                i -= 1
+            k -= 1
+        array[k - i:k + 1] = buffer[:i + 1]
+
+
+def _rotate(array, low, middle, high):
+    """
+    Поменять местами соседние отрезки array[low:middle] и array[middle:high] тремя разворотами
+
+    :param array: Список
+    :type array: list
+    :param low: Начало первого отрезка
+    :type low: int
+    :param middle: Начало второго отрезка
+    :type middle: int
+    :param high: Конец второго отрезка (не включая)
+    :type high: int
+    :return: None
+    """
+    if low == middle or middle == high:
+        return
+    _reverse(array, low, middle)
+    _reverse(array, middle, high)
+    _reverse(array, low, high)
+
+
+def _reverse(array, low, high):
+    """
+    Развернуть отрезок array[low:high] обменом порций с концов. Размер порции не превышает sqrt(N),
+    поэтому временные копии ограничены O(sqrt(N)) элементов
+
+    :param array: Список
+    :type array: list
+    :param low: Начало отрезка
+    :type low: int
+    :param high: Конец отрезка (не включая)
+    :type high: int
+    :return: None
+    """
+    chunk = max(1, isqrt(high - low))
+    while high - low > 1:
+        size = min(chunk, (high - low) // 2)
+        head = array[low:low + size]
+        array[low:low + size] = array[high - size:high][::-1]
+        array[high - size:high] = head[::-1]
+        low += size
+        high -= size
+
+
+def natural_merge_sort(array, low, high):
+    """
+    Адаптивная сортировка слиянием: диапазон разбивается на уже упорядоченные серии (строго убывающие
+    разворачиваются), после чего соседние серии попарно сливаются с помощью _merge.
+    Время O(N log R), где R - количество серий; на отсортированных данных - O(N)
+
+    :param array: Список
+    :type array: list
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+    :return: None
+    """
+    if low >= high:
+        return
+    bounds = _run_bounds(array, low, high, reverse_descending=True)
+    while len(bounds) > 2:
+        merged_bounds = []
+        for i in range(0, len(bounds) - 2, 2):
+            merged_bounds.append(bounds[i])
+            if i + 2 < len(bounds):
+                _merge(array, bounds[i], bounds[i + 1] - 1, bounds[i + 2] - 1)
+        if (len(bounds) - 1) % 2:
+            merged_bounds.append(bounds[-2])
+        merged_bounds.append(bounds[-1])
+        bounds = merged_bounds
+
+
+def choose_engine(array, low, high) -> str:
+    """
+    Выбрать способ сортировки диапазона array[low:high + 1] по типу данных, размеру, размаху значений
+    и упорядоченности
+
+    :param array: Сортируемая последовательность
+    :type array: list | numpy.ndarray | array.array
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+
+    :rtype: str
+    :return: 'vectorized' - числовой массив numpy/array.array, 'adaptive' - мало упорядоченных серий,
+        'radix_lsd' - список целых чисел с небольшим размахом, 'radix_msd' - список строк или байтовых строк
+        с коротким общим префиксом, 'merge_sort' - во всех остальных случаях
+    """
+    size = high - low + 1
+    if size < 2:
+        return 'merge_sort'
+    if is_numeric_array(array):
+        return 'vectorized'
+
+    runs = len(_run_bounds(array, low, high, reverse_descending=False)) - 1
+    if runs <= size // _PRESORTED_RUNS_RATIO:
+        return 'adaptive'
+
+    # Поразрядные сортировки записывают результат списком, поэтому выбираются только для list:
+    # array.array без numpy сортируется слиянием
+    types = {type(element) for element in array[low:high + 1]} if isinstance(array, list) else set()
+    if types == {int}:
+        values = array[low:high + 1]
+        passes = -(-(max(values) - min(values)).bit_length() // 8)
+        if passes <= size.bit_length() - 5:
+            return 'radix_lsd'
+    elif types in ({str}, {bytes}):
+        # Общий префикс всех строк - общий префикс наименьшей и наибольшей. Каждый его символ - лишний проход
+        # по корзинам, а сравнение строк при слиянии пропускает его быстро
+        values = array[low:high + 1]
+        if _common_prefix_length(min(values), max(values)) < size.bit_length():
+            return 'radix_msd'
+    if runs <= size // _ADAPTIVE_RUNS_RATIO:
+        return 'adaptive'
+    return 'merge_sort'
+
+
+def auto_sort(array, low, high) -> str:
+    """
+    Отсортировать диапазон array[low:high + 1] на месте способом, выбранным choose_engine.
+    Выбранный способ пишется в журнал (уровень DEBUG) и возвращается
+
+    :param array: Сортируемая последовательность
+    :type array: list | numpy.ndarray | array.array
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+
+    :rtype: str
+    :return: Название использованного способа сортировки
+    """
+    engine = choose_engine(array, low, high)
+    logger.debug('Sorting %d elements with %s', high - low + 1, engine)
+    _ENGINES[engine](array, low, high)
+    return engine
+
+
+def _common_prefix_length(first, second) -> int:
+    """
+    Получить длину общего префикса двух строк
+
+    :param first: Первая строка
+    :type first: str | bytes
+    :param second: Вторая строка
+    :type second: str | bytes
+
+    :rtype: int
+    :return: Количество совпадающих начальных символов
+    """
+    length = min(len(first), len(second))
+    for position in range(length):
+        if first[position] != second[position]:
+            return position
+    return length
+
+
+def _run_bounds(array, low, high, reverse_descending):
+    """
+    Разбить диапазон на максимальные неубывающие или строго убывающие серии
+
+    :param array: Список
+    :type array: list
+    :param low: Индекс первого элемента диапазона
+    :type low: int
+    :param high: Индекс последнего элемента диапазона
+    :type high: int
+    :param reverse_descending: Развернуть строго убывающие серии на месте
+    :type reverse_descending: bool
+
+    :rtype: list[int]
+    :return: Индексы начал серий и индекс high + 1 в конце
+    """
+    bounds = [low]
+    start = low
+    while start <= high:
+        end = start + 1
+        if end <= high and array[end] < array[start]:
+            while end + 1 <= high and array[end + 1] < array[end]:
+                end += 1
+            if reverse_descending:
+                array[start:end + 1] = array[start:end + 1][::-1]
+        else:
+            while end <= high and not array[end] < array[end - 1]:
+                end += 1
+            end -= 1
+        start = end + 1
+        bounds.append(start)
+    return bounds
+
+
+def merge_iterables(*iterables: Iterable[Any], key: Callable[[Any], Any] | None = None,
+                    reverse: bool = False) -> Iterator[Any]:
+    """
+    Лениво слить k уже отсортированных последовательностей в одну отсортированную последовательность.
+
+    Слияние построено на дереве проигравших: выбор очередного элемента стоит O(log k) сравнений,
+    из каждого источника в памяти держится только текущий элемент, поэтому дополнительная память - O(k).
+    Как и в _merge, при равенстве ключей первым выдаётся элемент из более раннего источника.
+
+    :param iterables: Отсортированные последовательности (в порядке key/reverse)
+    :type iterables: Iterable[Any]
+    :param key: Функция получения ключа сравнения. Если None - сравниваются сами элементы
+    :type key: Callable[[Any], Any] | None
+    :param reverse: True, если последовательности отсортированы по убыванию
+    :type reverse: bool
+
+    :rtype: Iterator[Any]
+    :return: Генератор элементов в отсортированном порядке
+    """
+    iterators = [iter(iterable) for iterable in iterables]
+    count = len(iterators)
+    if count == 0:
+        return
+    if count == 1:
+        yield from iterators[0]
+        return
+
+    values = [None] * count
+    keys = [None] * count
+    exhausted = [False] * count
+
+    def advance(source):
+        try:
+            values[source] = next(iterators[source])
+        except StopIteration:
+            values[source] = None
+            keys[source] = None
+            exhausted[source] = True
+        else:
+            keys[source] = values[source] if key is None else key(values[source])
+
+    def beats(first, second):
+        if exhausted[second]:
+            return True
+        if exhausted[first]:
+            return False
+        first_key, second_key = keys[first], keys[second]
+        if reverse:
+            first_key, second_key = second_key, first_key
+        if first < second:
+            return not second_key < first_key
+        return first_key < second_key
+
+    for source in range(count):
+        advance(source)
+
+    losers = [0] * count
+    winners = [0] * (2 * count)
+    for source in range(count):
+        winners[count + source] = source
+    for node in range(count - 1, 0, -1):
+        left, right = winners[2 * node], winners[2 * node + 1]
+        if beats(left, right):
+            winners[node], losers[node] = left, right
+        else:
+            winners[node], losers[node] = right, left
+    winner = winners[1]
+
+    while not exhausted[winner]:
+        yield values[winner]
+        advance(winner)
+        node = (winner + count) // 2
+        while node:
+            if beats(losers[node], winner):
+                losers[node], winner = winner, losers[node]
+            node //= 2
+
+
+_ENGINES = {
+    'vectorized': vectorized_merge_sort,
+    'adaptive': natural_merge_sort,
+    'radix_lsd': lsd_radix_sort,
+    'radix_msd': msd_radix_sort,
+    'merge_sort': merge_sort,
+}
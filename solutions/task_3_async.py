@@ -0,0 +1,129 @@
+import asyncio
+from collections.abc import Generator, Iterator
+from concurrent.futures import Executor
+
+from solutions.task_3 import merge_sort
+
+
+async def async_merge_sort(array: list, low: int, high: int, step: int = 4096,
+                           executor_threshold: int | None = None, executor: Executor | None = None):
+    """
+    Отсортировать слиянием часть списка array[low:high + 1] на месте, не блокируя цикл событий asyncio.
+
+    Восходящая сортировка выполняется порциями: после каждых step перемещений элементов и после каждого
+    прохода слияния управление возвращается циклу событий. Если задан executor_threshold и диапазон не меньше
+    него, сортировка копии диапазона выполняется в executor (None - исполнитель цикла по умолчанию).
+    Пока сортировка не завершена, содержимое диапазона не упорядочено и не должно изменяться извне
+
+    :param array: Сортируемый список
+    :type array: list
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+    :param step: Максимальное количество перемещений элементов между возвратами управления циклу событий
+    :type step: int
+    :param executor_threshold: Размер диапазона, начиная с которого сортировка выносится в executor
+    :type executor_threshold: int | None
+    :param executor: Исполнитель для больших диапазонов (потоки или процессы)
+    :type executor: concurrent.futures.Executor | None
+
+    :return: None
+    """
+    if step <= 0:
+        raise ValueError('Step must be greater than zero')
+    if executor_threshold is not None and high - low + 1 >= executor_threshold:
+        loop = asyncio.get_running_loop()
+        array[low:high + 1] = await loop.run_in_executor(executor, _sorted_copy, array[low:high + 1])
+        return
+    for _ in _bottom_up_steps(array, low, high, step):
+        await asyncio.sleep(0)
+
+
+def _sorted_copy(array: list) -> list:
+    """
+    Отсортировать список и вернуть его. Функция уровня модуля, чтобы её можно было передать в пул процессов
+
+    :param array: Сортируемый список
+    :type array: list
+
+    :rtype: list
+    :return: Отсортированный список
+    """
+    merge_sort(array, 0, len(array) - 1)
+    return array
+
+
+def _bottom_up_steps(array: list, low: int, high: int, step: int) -> Iterator[None]:
+    """
+    Восходящая сортировка слиянием, приостанавливающаяся после каждой порции работы и после каждого прохода
+
+    :param array: Сортируемый список
+    :type array: list
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+    :param step: Максимальное количество перемещений элементов между остановками
+    :type step: int
+
+    :rtype: Iterator[None]
+    :return: Генератор, каждая итерация которого - точка возврата управления
+    """
+    width = 1
+    budget = step
+    while width <= high - low:
+        for start in range(low, high + 1 - width, 2 * width):
+            budget = yield from _merge_steps(array, start, start + width - 1, min(start + 2 * width - 1, high),
+                                             step, budget)
+            if budget <= 0:
+                yield
+                budget = step
+        width *= 2
+        yield
+        budget = step
+
+
+def _merge_steps(array: list, low: int, middle: int, high: int, step: int,
+                 budget: int) -> Generator[None, None, int]:
+    """
+    Слить отсортированные части array[low:middle + 1] и array[middle + 1:high + 1], приостанавливаясь,
+    когда исчерпан запас перемещений budget (после остановки запас восстанавливается до step).
+    Как и в _merge, при равенстве первым идёт элемент левой части
+
+    :param array: Список
+    :type array: list
+    :param low: Начало левой части
+    :type low: int
+    :param middle: Конец левой части
+    :type middle: int
+    :param high: Конец правой части
+    :type high: int
+    :param step: Максимальное количество перемещений элементов между остановками
+    :type step: int
+    :param budget: Количество перемещений, оставшееся до следующей остановки
+    :type budget: int
+
+    :rtype: Generator[None, None, int]
+    :return: Генератор, каждая итерация которого - точка возврата управления.
+        Возвращает оставшийся после слияния запас перемещений
+    """
+    left_array = array[low:middle + 1]
+    left_size = len(left_array)
+    i, j, k = 0, middle + 1, low
+
+    while i < left_size and j <= high:
+        if left_array[i] <= array[j]:
+            array[k] = left_array[i]
+            i += 1
+        else:
+            array[k] = array[j]
+            j += 1
+        k += 1
+        budget -= 1
+        if not budget:
+            yield
+            budget = step
+
+    array[k:j] = left_array[i:]
+    return budget - (left_size - i)
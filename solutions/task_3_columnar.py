@@ -0,0 +1,176 @@
+from collections.abc import Sequence
+from typing import Any
+
+from solutions.task_3_numpy import is_numeric_array, merge_argsort
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def columnar_argsort(columns: Any, by: Sequence[str], ascending: bool | Sequence[bool] = True) -> Any:
+    """
+    Получить стабильную перестановку строк, упорядочивающую столбцовые данные лексикографически по столбцам by.
+
+    Кортежи строк не создаются: перестановка последовательно стабильно сортируется слиянием по каждому
+    ключевому столбцу, начиная с последнего, поэтому порядок по первому столбцу главный, а равные по всем
+    ключам строки остаются в исходном порядке. Числовые столбцы numpy сортируются векторизованно (merge_argsort)
+
+    :param columns: Словарь столбцов одинаковой длины (списки или numpy.ndarray) или структурированный numpy.ndarray
+    :type columns: Mapping[str, Sequence] | numpy.ndarray
+    :param by: Названия ключевых столбцов в порядке убывания значимости
+    :type by: Sequence[str]
+    :param ascending: Направление сортировки: одно для всех ключей или по одному для каждого ключа
+    :type ascending: bool | Sequence[bool]
+
+    :rtype: list[int] | numpy.ndarray
+    :return: Перестановка индексов строк
+    """
+    if isinstance(ascending, bool):
+        ascending = [ascending] * len(by)
+    if len(ascending) != len(by):
+        raise ValueError('ascending must have one flag per key column')
+    if not by:
+        raise ValueError('At least one key column is required')
+
+    size = len(columns) if _is_structured(columns) else len(columns[by[0]])
+    permutation = np.arange(size) if np is not None and _has_numpy_columns(columns, by) else list(range(size))
+    for name, key_ascending in zip(reversed(by), reversed(ascending)):
+        column = columns[name]
+        if len(column) != size:
+            raise ValueError('Columns must have the same length')
+        permutation = _stable_reorder(permutation, column, key_ascending)
+    return permutation
+
+
+def sort_columns(columns: Any, by: Sequence[str], ascending: bool | Sequence[bool] = True) -> Any:
+    """
+    Отсортировать столбцовые данные по ключевым столбцам by. Перестановка вычисляется один раз
+    (columnar_argsort) и применяется к каждому столбцу одной выборкой
+
+    :param columns: Словарь столбцов одинаковой длины (списки или numpy.ndarray) или структурированный numpy.ndarray
+    :type columns: Mapping[str, Sequence] | numpy.ndarray
+    :param by: Названия ключевых столбцов в порядке убывания значимости
+    :type by: Sequence[str]
+    :param ascending: Направление сортировки: одно для всех ключей или по одному для каждого ключа
+    :type ascending: bool | Sequence[bool]
+
+    :rtype: dict[str, Sequence] | numpy.ndarray
+    :return: Новые отсортированные столбцы того же вида, что и columns
+    """
+    permutation = columnar_argsort(columns, by, ascending)
+    if _is_structured(columns):
+        return columns[permutation]
+    return {name: _gather(column, permutation) for name, column in columns.items()}
+
+
+def _stable_reorder(permutation: Any, column: Any, ascending: bool) -> Any:
+    """
+    Стабильно переупорядочить перестановку по значениям одного столбца.
+    Убывающий порядок получается стабильной сортировкой развёрнутых значений и разворотом результата
+
+    :param permutation: Текущая перестановка строк
+    :type permutation: list[int] | numpy.ndarray
+    :param column: Ключевой столбец
+    :type column: Sequence | numpy.ndarray
+    :param ascending: Направление сортировки
+    :type ascending: bool
+
+    :rtype: list[int] | numpy.ndarray
+    :return: Новая перестановка строк
+    """
+    keys = _gather(column, permutation)
+    if not ascending:
+        keys = keys[::-1]
+    if is_numeric_array(keys):
+        order = merge_argsort(keys)
+    elif isinstance(keys, list):
+        order = _merge_argsort(keys)
+    else:
+        order = np.array(_merge_argsort(keys.tolist()), dtype=np.intp)
+    if not ascending:
+        last = len(order) - 1
+        order = [last - index for index in reversed(order)] if isinstance(order, list) else last - order[::-1]
+    if isinstance(permutation, list):
+        return [permutation[index] for index in order]
+    return permutation[order]
+
+
+def _merge_argsort(keys: Sequence[Any]) -> list[int]:
+    """
+    Стабильная восходящая сортировка слиянием индексов 0..N-1 по значениям keys.
+    Как и в _merge, при равенстве первым идёт индекс из левой серии
+
+    :param keys: Значения ключа
+    :type keys: Sequence[Any]
+
+    :rtype: list[int]
+    :return: Перестановка индексов
+    """
+    size = len(keys)
+    order = list(range(size))
+    width = 1
+    while width < size:
+        merged = []
+        for low in range(0, size, 2 * width):
+            left = order[low:low + width]
+            right = order[low + width:low + 2 * width]
+            i = j = 0
+            while i < len(left) and j < len(right):
+                if keys[left[i]] <= keys[right[j]]:
+                    merged.append(left[i])
+                    i += 1
+                else:
+                    merged.append(right[j])
+                    j += 1
+            merged.extend(left[i:])
+            merged.extend(right[j:])
+        order = merged
+        width *= 2
+    return order
+
+
+def _gather(column: Any, permutation: Any) -> Any:
+    """
+    Выбрать элементы столбца в порядке перестановки
+
+    :param column: Столбец
+    :type column: Sequence | numpy.ndarray
+    :param permutation: Перестановка строк
+    :type permutation: list[int] | numpy.ndarray
+
+    :rtype: list | numpy.ndarray
+    :return: Переупорядоченный столбец
+    """
+    if np is not None and isinstance(column, np.ndarray):
+        return column[np.asarray(permutation, dtype=np.intp)]
+    return [column[index] for index in permutation]
+
+
+def _is_structured(columns: Any) -> bool:
+    """
+    Проверить, что данные - структурированный numpy.ndarray
+
+    :param columns: Столбцовые данные
+    :type columns: Any
+
+    :rtype: bool
+    :return: True, если columns - структурированный numpy.ndarray. Иначе False
+    """
+    return np is not None and isinstance(columns, np.ndarray) and columns.dtype.names is not None
+
+
+def _has_numpy_columns(columns: Any, by: Sequence[str]) -> bool:
+    """
+    Проверить, что ключевые столбцы хранятся в numpy
+
+    :param columns: Столбцовые данные
+    :type columns: Mapping[str, Sequence] | numpy.ndarray
+    :param by: Названия ключевых столбцов
+    :type by: Sequence[str]
+
+    :rtype: bool
+    :return: True, если данные структурированные или все ключевые столбцы - numpy.ndarray. Иначе False
+    """
+    return _is_structured(columns) or all(isinstance(columns[name], np.ndarray) for name in by)
@@ -0,0 +1,109 @@
+import heapq
+from collections.abc import Callable, Iterable
+from typing import Any
+
+
+class LazySorted:
+    """
+    Ленивое отсортированное представление последовательности: элементы выдаются по возрастанию по мере запроса
+
+    Первый элемент становится доступен за O(N) (построение кучи), каждый следующий - за O(log N).
+    Сортировка стабильна: равные элементы выдаются в порядке исходной последовательности
+
+    Атрибуты
+    ----
+    _heap: list
+        Куча из кортежей (ключ, исходный индекс, элемент). Строится при первом обращении
+    _heapified: bool
+        Признак того, что куча уже построена
+
+    Методы
+    ----
+    top_k(self, k: int) -> list
+        Получить k наименьших из оставшихся элементов (без удаления) за O(N log k)
+    """
+
+    def __init__(self, iterable: Iterable[Any], key: Callable[[Any], Any] | None = None, reverse: bool = False):
+        """
+        Создать представление последовательности iterable
+
+        :param iterable: Сортируемая последовательность
+        :type iterable: Iterable[Any]
+        :param key: Функция получения ключа сравнения. Если None - сравниваются сами элементы
+        :type key: Callable[[Any], Any] | None
+        :param reverse: True, если элементы нужно выдавать по убыванию
+        :type reverse: bool
+        """
+        def sort_key(element):
+            element_key = element if key is None else key(element)
+            return _ReversedKey(element_key) if reverse else element_key
+
+        self._heap = [(sort_key(element), index, element) for index, element in enumerate(iterable)]
+        self._heapified = False
+
+    def top_k(self, k: int) -> list[Any]:
+        """
+        Получить k наименьших из оставшихся элементов (без удаления) за O(N log k), не сортируя всю последовательность
+
+        :param k: Количество элементов
+        :type k: int
+
+        :rtype: list[Any]
+        :return: Список из не более чем k элементов в отсортированном порядке
+        """
+        return [entry[2] for entry in heapq.nsmallest(k, self._heap)]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        if not self._heapified:
+            heapq.heapify(self._heap)
+            self._heapified = True
+        if not self._heap:
+            raise StopIteration
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(remaining={len(self._heap)})'
+
+
+def nsmallest(iterable: Iterable[Any], k: int, key: Callable[[Any], Any] | None = None,
+              reverse: bool = False) -> list[Any]:
+    """
+    Получить k наименьших элементов последовательности за O(N log k) и O(k) дополнительной памяти.
+    Результат совпадает с sorted(iterable, key=key, reverse=reverse)[:k]
+
+    :param iterable: Исходная последовательность
+    :type iterable: Iterable[Any]
+    :param k: Количество элементов
+    :type k: int
+    :param key: Функция получения ключа сравнения. Если None - сравниваются сами элементы
+    :type key: Callable[[Any], Any] | None
+    :param reverse: True, если нужны k наибольших элементов
+    :type reverse: bool
+
+    :rtype: list[Any]
+    :return: Список из не более чем k элементов в отсортированном порядке
+    """
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    return select(k, iterable, key=key)
+
+
+class _ReversedKey:
+    """
+    Обёртка над ключом с обратным порядком сравнения
+    """
+    __slots__ = ('key',)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __lt__(self, other: '_ReversedKey') -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ReversedKey) and self.key == other.key
@@ -0,0 +1,160 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from solutions.task_3 import _merge, merge_iterables, merge_sort
+
+
+class SortedRuns:
+    """
+    Класс отсортированной коллекции по принципу LSM-дерева: вставки накапливаются в буфере,
+    заполненный буфер сортируется и становится новой отсортированной серией, а серии близкого размера
+    сливаются (_merge), как разряды двоичного счётчика
+
+    Каждый элемент участвует в O(logN) слияниях, поэтому амортизированная стоимость вставки - O(logN)
+    вместо полной пересортировки. Серий не больше O(logN), и их размеры убывают от самой старой к самой новой
+
+    Атрибуты
+    ----
+    _runs: list[list]
+        Отсортированные серии, от самой большой к самой маленькой
+    _buffer: list
+        Неотсортированные вставки, ещё не ставшие серией
+    _buffer_size: int
+        Размер буфера, при достижении которого он превращается в серию
+
+    Методы
+    ----
+    add(self, element: Any)
+        Добавить элемент
+    update(self, iterable: Iterable[Any])
+        Добавить последовательность элементов
+    flush(self)
+        Превратить буфер в серию
+    irange(self, minimum: Any, maximum: Any) -> Iterator[Any]
+        Получить по возрастанию элементы из отрезка [minimum, maximum]
+    get_runs_count(self) -> int
+        Получить количество серий
+    """
+
+    def __init__(self, iterable: Iterable[Any] = (), buffer_size: int = 64):
+        """
+        Создать коллекцию из последовательности iterable (может отсутствовать)
+
+        :param iterable: Последовательность, которую необходимо занести в коллекцию
+        :type iterable: Iterable[Any]
+        :param buffer_size: Количество вставок, накапливаемых до сортировки (больше 0)
+        :type buffer_size: int
+        """
+        if buffer_size <= 0:
+            raise ValueError('Buffer size must be greater than zero')
+        self._buffer_size = buffer_size
+        self._runs = []
+        self._buffer = []
+        self.update(iterable)
+
+    def add(self, element: Any):
+        """
+        Добавить элемент
+
+        :param element: Добавляемый элемент
+        :type element: Any
+
+        :return: None
+        """
+        self._buffer.append(element)
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def update(self, iterable: Iterable[Any]):
+        """
+        Добавить последовательность элементов
+
+        :param iterable: Добавляемая последовательность
+        :type iterable: Iterable[Any]
+
+        :return: None
+        """
+        for element in iterable:
+            self.add(element)
+
+    def flush(self):
+        """
+        Отсортировать буфер, добавить его как новую серию и слить серии, размер которых перестал убывать
+
+        :return: None
+        """
+        if not self._buffer:
+            return
+        run = self._buffer
+        self._buffer = []
+        merge_sort(run, 0, len(run) - 1)
+        self._runs.append(run)
+        while len(self._runs) > 1 and len(self._runs[-2]) <= len(self._runs[-1]) * 2:
+            newer = self._runs.pop()
+            older = self._runs.pop()
+            middle = len(older) - 1
+            older.extend(newer)
+            _merge(older, 0, middle, len(older) - 1)
+            self._runs.append(older)
+
+    def irange(self, minimum: Any, maximum: Any) -> Iterator[Any]:
+        """
+        Получить по возрастанию элементы из отрезка [minimum, maximum]. Границы в каждой серии находятся
+        бинарным поиском, а найденные части лениво сливаются (merge_iterables)
+
+        :param minimum: Нижняя граница (включительно)
+        :type minimum: Any
+        :param maximum: Верхняя граница (включительно)
+        :type maximum: Any
+
+        :rtype: Iterator[Any]
+        :return: Генератор элементов отрезка
+        """
+        self.flush()
+        parts = [run[bisect_left(run, minimum):bisect_right(run, maximum)] for run in self._runs]
+        return merge_iterables(*parts)
+
+    def get_runs_count(self) -> int:
+        """
+        Получить количество серий (без учёта буфера)
+
+        :rtype: int
+        :return: Количество отсортированных серий
+        """
+        return len(self._runs)
+
+    def __contains__(self, element: Any) -> bool:
+        """
+        Проверить наличие элемента. Буфер просматривается линейно, а в сериях ищется бинарным поиском;
+        серии, в диапазон [первый, последний] которых элемент не попадает, пропускаются без поиска.
+        В худшем случае - O(log^2 N + buffer_size): бинарный поиск в каждой из O(logN) серий
+
+        :param element: Искомый элемент
+        :type element: Any
+
+        :rtype: bool
+        :return: True, если элемент есть в коллекции. Иначе False
+        """
+        if element in self._buffer:
+            return True
+        for run in self._runs:
+            if element < run[0] or run[-1] < element:
+                continue
+            index = bisect_left(run, element)
+            if index < len(run) and run[index] == element:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[Any]:
+        self.flush()
+        return merge_iterables(*self._runs)
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self._runs) + len(self._buffer)
+
+    def __str__(self):
+        return f'{list(self)}'
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self)}, buffer_size={self._buffer_size})'
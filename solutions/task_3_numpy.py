@@ -0,0 +1,205 @@
+from array import array as py_array
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_BROADCAST_WIDTH = 16
+_BROADCAST_CELLS = 1 << 20
+
+
+def vectorized_merge_sort(array: Any, low: int, high: int):
+    """
+    Отсортировать слиянием часть числового массива array[low:high + 1] на месте.
+    Аналог merge_sort для numpy.ndarray и array.array: вместо поэлементных сравнений отсортированные блоки
+    сливаются векторными операциями numpy
+
+    :param array: Одномерный числовой массив (numpy.ndarray целого/вещественного типа или array.array)
+    :type array: numpy.ndarray | array.array
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+
+    :return: None
+    """
+    if low >= high:
+        return
+    view = _as_numeric_view(array)
+    values, _ = _merge_blocks(view[low:high + 1].copy(), None)
+    view[low:high + 1] = values
+
+
+def merge_argsort(array: Any) -> Any:
+    """
+    Получить стабильную перестановку индексов, упорядочивающую числовой массив
+
+    :param array: Одномерный числовой массив (numpy.ndarray целого/вещественного типа или array.array)
+    :type array: numpy.ndarray | array.array
+
+    :rtype: numpy.ndarray
+    :return: Массив индексов такой, что array[indices] отсортирован, а равные элементы идут в исходном порядке
+    """
+    view = _as_numeric_view(array)
+    _, indices = _merge_blocks(view.copy(), np.arange(len(view), dtype=np.intp))
+    return indices
+
+
+def is_numeric_array(array: Any) -> bool:
+    """
+    Проверить, что массив можно отсортировать векторизованным слиянием
+
+    :param array: Проверяемый объект
+    :type array: Any
+
+    :rtype: bool
+    :return: True, если установлен numpy и array - одномерный числовой numpy.ndarray или array.array. Иначе False
+    """
+    if np is None:
+        return False
+    if isinstance(array, py_array):
+        return array.typecode in 'bBhHiIlLqQfd'
+    return isinstance(array, np.ndarray) and array.ndim == 1 and array.dtype.kind in 'iuf'
+
+
+def _as_numeric_view(array: Any) -> Any:
+    """
+    Получить numpy-представление массива без копирования данных
+
+    :param array: Одномерный числовой массив
+    :type array: numpy.ndarray | array.array
+
+    :rtype: numpy.ndarray
+    :return: Представление, изменения в котором отражаются в исходном массиве
+    """
+    if np is None:
+        raise ImportError('numpy is required for the vectorized merge sort backend')
+    if not is_numeric_array(array):
+        raise TypeError('Expected a one-dimensional numeric numpy.ndarray or array.array')
+    view = np.frombuffer(array, dtype=array.typecode) if isinstance(array, py_array) else array
+    if view.dtype.kind == 'f' and np.isnan(view).any():
+        raise ValueError('NaN values cannot be ordered')
+    return view
+
+
+def _merge_blocks(values: Any, indices: Any) -> tuple[Any, Any]:
+    """
+    Восходящая сортировка слиянием: на каждом уровне пары соседних отсортированных блоков ширины width
+    сливаются в блоки ширины 2 * width
+
+    :param values: Сортируемые значения (будут изменены)
+    :type values: numpy.ndarray
+    :param indices: Исходные индексы значений, переставляемые вместе с ними. Может быть None
+    :type indices: numpy.ndarray | None
+
+    :rtype: tuple[numpy.ndarray, numpy.ndarray | None]
+    :return: Отсортированные значения и соответствующая им перестановка индексов
+    """
+    size = len(values)
+    width = 1
+    while width < size:
+        if width <= _BROADCAST_WIDTH:
+            values, indices = _merge_level_broadcast(values, indices, width)
+        else:
+            values, indices = _merge_level_searchsorted(values, indices, width)
+        width *= 2
+    return values, indices
+
+
+def _merge_level_broadcast(values: Any, indices: Any, width: int) -> tuple[Any, Any]:
+    """
+    Слить все пары блоков узкого уровня векторно: позиции элементов вычисляются
+    попарным сравнением внутри каждой пары блоков. Пары обрабатываются порциями,
+    чтобы матрица сравнений занимала не больше _BROADCAST_CELLS элементов
+
+    :param values: Значения, отсортированные блоками ширины width
+    :type values: numpy.ndarray
+    :param indices: Перестановка индексов. Может быть None
+    :type indices: numpy.ndarray | None
+    :param width: Ширина отсортированного блока
+    :type width: int
+
+    :rtype: tuple[numpy.ndarray, numpy.ndarray | None]
+    :return: Значения и индексы, отсортированные блоками ширины 2 * width
+    """
+    paired = len(values) // (2 * width) * (2 * width)
+    step = max(1, _BROADCAST_CELLS // (width * width)) * 2 * width
+    offsets = np.arange(width)
+    for low in range(0, paired, step):
+        high = min(low + step, paired)
+        blocks = values[low:high].reshape(-1, 2, width)
+        left, right = blocks[:, 0, :], blocks[:, 1, :]
+        left_positions = offsets + (right[:, None, :] < left[:, :, None]).sum(axis=2)
+        right_positions = offsets + (left[:, None, :] <= right[:, :, None]).sum(axis=2)
+
+        merged = np.empty((len(blocks), 2 * width), dtype=values.dtype)
+        np.put_along_axis(merged, left_positions, left, axis=1)
+        np.put_along_axis(merged, right_positions, right, axis=1)
+        values[low:high] = merged.ravel()
+
+        if indices is not None:
+            index_blocks = indices[low:high].reshape(-1, 2, width)
+            merged_indices = np.empty((len(blocks), 2 * width), dtype=indices.dtype)
+            np.put_along_axis(merged_indices, left_positions, index_blocks[:, 0, :], axis=1)
+            np.put_along_axis(merged_indices, right_positions, index_blocks[:, 1, :], axis=1)
+            indices[low:high] = merged_indices.ravel()
+
+    if len(values) - paired > width:
+        _merge_pair(values, indices, paired, paired + width, len(values))
+    return values, indices
+
+
+def _merge_level_searchsorted(values: Any, indices: Any, width: int) -> tuple[Any, Any]:
+    """
+    Слить пары блоков широкого уровня по одной паре за вызов numpy.searchsorted
+
+    :param values: Значения, отсортированные блоками ширины width
+    :type values: numpy.ndarray
+    :param indices: Перестановка индексов. Может быть None
+    :type indices: numpy.ndarray | None
+    :param width: Ширина отсортированного блока
+    :type width: int
+
+    :rtype: tuple[numpy.ndarray, numpy.ndarray | None]
+    :return: Значения и индексы, отсортированные блоками ширины 2 * width
+    """
+    size = len(values)
+    for low in range(0, size - width, 2 * width):
+        _merge_pair(values, indices, low, low + width, min(low + 2 * width, size))
+    return values, indices
+
+
+def _merge_pair(values: Any, indices: Any, low: int, middle: int, high: int):
+    """
+    Слить два соседних отсортированных блока values[low:middle] и values[middle:high].
+    Позиция элемента в результате - его номер в своём блоке плюс количество элементов другого блока перед ним;
+    при равенстве элементы левого блока идут первыми, как в _merge
+
+    :param values: Значения
+    :type values: numpy.ndarray
+    :param indices: Перестановка индексов. Может быть None
+    :type indices: numpy.ndarray | None
+    :param low: Начало левого блока
+    :type low: int
+    :param middle: Начало правого блока
+    :type middle: int
+    :param high: Конец правого блока (не включая)
+    :type high: int
+
+    :return: None
+    """
+    left, right = values[low:middle].copy(), values[middle:high].copy()
+    left_positions = np.arange(len(left)) + np.searchsorted(right, left, side='left')
+    right_positions = np.arange(len(right)) + np.searchsorted(left, right, side='right')
+
+    target = values[low:high]
+    target[left_positions] = left
+    target[right_positions] = right
+
+    if indices is not None:
+        left_indices, right_indices = indices[low:middle].copy(), indices[middle:high].copy()
+        target_indices = indices[low:high]
+        target_indices[left_positions] = left_indices
+        target_indices[right_positions] = right_indices
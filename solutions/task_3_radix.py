@@ -0,0 +1,109 @@
+_RADIX_BITS = 8
+_RADIX_MASK = (1 << _RADIX_BITS) - 1
+_MSD_INSERTION_LIMIT = 32
+
+
+def lsd_radix_sort(array, low, high):
+    """
+    Стабильно отсортировать часть списка целых чисел array[low:high + 1] поразрядной сортировкой
+    от младших разрядов (LSD) по основанию 256.
+    Отрицательные числа обрабатываются сдвигом всех значений на минимум, поэтому количество проходов
+    определяется размахом значений: O(N * ceil(log256(max - min + 1)))
+
+    :param array: Список целых чисел
+    :type array: list[int]
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+    :return: None
+    """
+    if low >= high:
+        return
+    values = array[low:high + 1]
+    minimum = min(values)
+    span = max(values) - minimum
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(_RADIX_MASK + 1)]
+        for value in values:
+            buckets[(value - minimum) >> shift & _RADIX_MASK].append(value)
+        values = [value for bucket in buckets for value in bucket]
+        shift += _RADIX_BITS
+    array[low:high + 1] = values
+
+
+def msd_radix_sort(array, low, high):
+    """
+    Стабильно отсортировать часть списка строк или байтовых строк array[low:high + 1] поразрядной сортировкой
+    от старших разрядов (MSD). На каждом уровне элементы раскладываются по корзинам по очередному символу,
+    более короткие строки идут первыми. Небольшие корзины досортировываются вставками
+
+    :param array: Список str или список bytes
+    :type array: list[str] | list[bytes]
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+    :return: None
+    """
+    if low >= high:
+        return
+    values = array[low:high + 1]
+    _msd_sort(values)
+    array[low:high + 1] = values
+
+
+def _msd_sort(values):
+    """
+    Отсортировать список строк, раскладывая диапазоны по корзинам очередного символа.
+    Необработанные диапазоны хранятся в явном стеке, поэтому длинные общие префиксы не упираются в глубину рекурсии
+
+    :param values: Список строк
+    :type values: list[str] | list[bytes]
+    :return: None
+    """
+    stack = [(0, len(values), 0)]
+    while stack:
+        low, high, depth = stack.pop()
+        if high - low <= _MSD_INSERTION_LIMIT:
+            _insertion_sort(values, low, high)
+            continue
+
+        finished = []
+        buckets = {}
+        for value in values[low:high]:
+            if len(value) <= depth:
+                finished.append(value)
+            else:
+                buckets.setdefault(value[depth], []).append(value)
+
+        position = low + len(finished)
+        values[low:position] = finished
+        for symbol in sorted(buckets):
+            bucket = buckets[symbol]
+            values[position:position + len(bucket)] = bucket
+            if len(bucket) > 1:
+                stack.append((position, position + len(bucket), depth + 1))
+            position += len(bucket)
+
+
+def _insertion_sort(values, low, high):
+    """
+    Стабильно отсортировать небольшой диапазон values[low:high] вставками
+
+    :param values: Список
+    :type values: list
+    :param low: Начало диапазона
+    :type low: int
+    :param high: Конец диапазона (не включая)
+    :type high: int
+    :return: None
+    """
+    for i in range(low + 1, high):
+        value = values[i]
+        j = i - 1
+        while j >= low and value < values[j]:
+            values[j + 1] = values[j]
+            j -= 1
+        values[j + 1] = value
@@ -0,0 +1,222 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from solutions.task_3 import merge_sort
+
+_MISSING = object()
+
+
+def distinct(iterable: Iterable[Any], key: Callable[[Any], Any] | None = None) -> Iterator[Any]:
+    """
+    Удалить повторы из отсортированной последовательности за один проход (остаётся первый из равных элементов)
+
+    :param iterable: Отсортированная последовательность
+    :type iterable: Iterable[Any]
+    :param key: Функция получения ключа сравнения. Если None - сравниваются сами элементы
+    :type key: Callable[[Any], Any] | None
+
+    :rtype: Iterator[Any]
+    :return: Генератор неповторяющихся элементов
+    """
+    for _, element in _distinct_pairs(iterable, key):
+        yield element
+
+
+def union(first: Iterable[Any], second: Iterable[Any], key: Callable[[Any], Any] | None = None) -> Iterator[Any]:
+    """
+    Объединение двух отсортированных последовательностей как множеств: каждый ключ выдаётся один раз,
+    при наличии в обеих последовательностях - элемент из first
+
+    :param first: Первая отсортированная последовательность
+    :type first: Iterable[Any]
+    :param second: Вторая отсортированная последовательность
+    :type second: Iterable[Any]
+    :param key: Функция получения ключа сравнения. Если None - сравниваются сами элементы
+    :type key: Callable[[Any], Any] | None
+
+    :rtype: Iterator[Any]
+    :return: Генератор элементов объединения в отсортированном порядке
+    """
+    for first_element, second_element in _aligned(first, second, key):
+        yield second_element if first_element is _MISSING else first_element
+
+
+def intersection(first: Iterable[Any], second: Iterable[Any],
+                 key: Callable[[Any], Any] | None = None) -> Iterator[Any]:
+    """
+    Пересечение двух отсортированных последовательностей как множеств (элементы берутся из first)
+
+    :param first: Первая отсортированная последовательность
+    :type first: Iterable[Any]
+    :param second: Вторая отсортированная последовательность
+    :type second: Iterable[Any]
+    :param key: Функция получения ключа сравнения. Если None - сравниваются сами элементы
+    :type key: Callable[[Any], Any] | None
+
+    :rtype: Iterator[Any]
+    :return: Генератор элементов пересечения в отсортированном порядке
+    """
+    for first_element, second_element in _aligned(first, second, key):
+        if first_element is not _MISSING and second_element is not _MISSING:
+            yield first_element
+
+
+def difference(first: Iterable[Any], second: Iterable[Any],
+               key: Callable[[Any], Any] | None = None) -> Iterator[Any]:
+    """
+    Разность двух отсортированных последовательностей как множеств: ключи first, которых нет в second
+
+    :param first: Первая отсортированная последовательность
+    :type first: Iterable[Any]
+    :param second: Вторая отсортированная последовательность
+    :type second: Iterable[Any]
+    :param key: Функция получения ключа сравнения. Если None - сравниваются сами элементы
+    :type key: Callable[[Any], Any] | None
+
+    :rtype: Iterator[Any]
+    :return: Генератор элементов разности в отсортированном порядке
+    """
+    for first_element, second_element in _aligned(first, second, key):
+        if second_element is _MISSING:
+            yield first_element
+
+
+def merge_join(first: Iterable[Any], second: Iterable[Any], first_key: Callable[[Any], Any],
+               second_key: Callable[[Any], Any]) -> Iterator[tuple[Any, Any]]:
+    """
+    Внутреннее соединение двух последовательностей, отсортированных по ключам first_key и second_key.
+    Для каждого ключа выдаются все пары элементов с этим ключом; в памяти хранится только
+    группа элементов second с текущим ключом
+
+    :param first: Первая отсортированная последовательность
+    :type first: Iterable[Any]
+    :param second: Вторая отсортированная последовательность
+    :type second: Iterable[Any]
+    :param first_key: Функция получения ключа элемента first
+    :type first_key: Callable[[Any], Any]
+    :param second_key: Функция получения ключа элемента second
+    :type second_key: Callable[[Any], Any]
+
+    :rtype: Iterator[tuple[Any, Any]]
+    :return: Генератор пар (элемент first, элемент second) с равными ключами
+    """
+    second_iterator = iter(second)
+    second_element = next(second_iterator, _MISSING)
+    group_key, group = _MISSING, []
+
+    for first_element in first:
+        key = first_key(first_element)
+        if group_key is _MISSING or group_key < key:
+            group_key, group = _MISSING, []
+            while second_element is not _MISSING and second_key(second_element) < key:
+                second_element = next(second_iterator, _MISSING)
+            while second_element is not _MISSING and not key < second_key(second_element):
+                group_key = key
+                group.append(second_element)
+                second_element = next(second_iterator, _MISSING)
+            if second_element is _MISSING and not group:
+                return
+        for matched in group:
+            yield first_element, matched
+
+
+def merge_sort_distinct(array, low, high) -> int:
+    """
+    Отсортировать диапазон array[low:high + 1] и удалить из него повторы, совместив удаление повторов
+    с последним слиянием: половины сортируются merge_sort, а при их слиянии каждый элемент записывается,
+    только если он отличается от предыдущего записанного. Лишние элементы в конце диапазона удаляются из списка
+
+    :param array: Список
+    :type array: list
+    :param low: Индекс первого элемента диапазона
+    :type low: int
+    :param high: Индекс последнего элемента диапазона
+    :type high: int
+
+    :rtype: int
+    :return: Количество оставшихся (неповторяющихся) элементов диапазона
+    """
+    if low > high:
+        return 0
+    middle = int((low + high) / 2)
+    merge_sort(array, low, middle)
+    merge_sort(array, middle + 1, high)
+
+    left_array = array[low:middle + 1]
+    i, j, k = 0, middle + 1, low
+    while i < len(left_array) or j <= high:
+        if j > high or (i < len(left_array) and left_array[i] <= array[j]):
+            element = left_array[i]
+            i += 1
+        else:
+            element = array[j]
+            j += 1
+        if k == low or array[k - 1] != element:
+            array[k] = element
+            k += 1
+
+    del array[k:high + 1]
+    return k - low
+
+
+def _distinct_pairs(iterable: Iterable[Any], key: Callable[[Any], Any] | None) -> Iterator[tuple[Any, Any]]:
+    """
+    Удалить повторы из отсортированной последовательности, выдавая пары (ключ, элемент)
+
+    :param iterable: Отсортированная последовательность
+    :type iterable: Iterable[Any]
+    :param key: Функция получения ключа сравнения. Если None - сравниваются сами элементы
+    :type key: Callable[[Any], Any] | None
+
+    :rtype: Iterator[tuple[Any, Any]]
+    :return: Генератор пар с неповторяющимися ключами
+    """
+    previous = _MISSING
+    for element in iterable:
+        element_key = element if key is None else key(element)
+        if previous is _MISSING or previous != element_key:
+            previous = element_key
+            yield element_key, element
+
+
+def _aligned(first: Iterable[Any], second: Iterable[Any],
+             key: Callable[[Any], Any] | None) -> Iterator[tuple[Any, Any]]:
+    """
+    Пройти двумя указателями по неповторяющимся ключам двух отсортированных последовательностей.
+    Для каждого ключа выдаётся пара элементов; если ключ есть только в одной последовательности,
+    на месте второго элемента - _MISSING
+
+    :param first: Первая отсортированная последовательность
+    :type first: Iterable[Any]
+    :param second: Вторая отсортированная последовательность
+    :type second: Iterable[Any]
+    :param key: Функция получения ключа сравнения. Если None - сравниваются сами элементы
+    :type key: Callable[[Any], Any] | None
+
+    :rtype: Iterator[tuple[Any, Any]]
+    :return: Генератор пар элементов в порядке возрастания ключа
+    """
+    first_pairs = _distinct_pairs(first, key)
+    second_pairs = _distinct_pairs(second, key)
+    first_key, first_element = next(first_pairs, (_MISSING, _MISSING))
+    second_key, second_element = next(second_pairs, (_MISSING, _MISSING))
+
+    while first_element is not _MISSING and second_element is not _MISSING:
+        if first_key < second_key:
+            yield first_element, _MISSING
+            first_key, first_element = next(first_pairs, (_MISSING, _MISSING))
+        elif second_key < first_key:
+            yield _MISSING, second_element
+            second_key, second_element = next(second_pairs, (_MISSING, _MISSING))
+        else:
+            yield first_element, second_element
+            first_key, first_element = next(first_pairs, (_MISSING, _MISSING))
+            second_key, second_element = next(second_pairs, (_MISSING, _MISSING))
+
+    while first_element is not _MISSING:
+        yield first_element, _MISSING
+        first_key, first_element = next(first_pairs, (_MISSING, _MISSING))
+
+    while second_element is not _MISSING:
+        yield _MISSING, second_element
+        second_key, second_element = next(second_pairs, (_MISSING, _MISSING))
@@ -0,0 +1,163 @@
+import time
+from collections import deque
+from typing import Any
+
+from solutions.task_3 import _run_bounds
+
+
+class SortStats:
+    """
+    Класс статистики одного вызова сортировки слиянием
+
+    Атрибуты
+    ----
+    size: int
+        Количество отсортированных элементов
+    comparisons: int
+        Количество сравнений элементов
+    moves: int
+        Количество записей элементов в сортируемый список
+    allocations: int
+        Количество созданных временных буферов
+    allocated_elements: int
+        Суммарное количество элементов, скопированных во временные буферы
+    level_times: dict[int, float]
+        Суммарное время слияний на каждом уровне рекурсии (0 - последнее, самое верхнее слияние), в секундах
+    level_merges: dict[int, int]
+        Количество слияний на каждом уровне рекурсии
+    run_lengths: list[int]
+        Длины серий во входных данных до сортировки: максимальных неубывающих или строго убывающих
+        (как их находит natural_merge_sort)
+    total_time: float
+        Общее время сортировки, в секундах
+
+    Методы
+    ----
+    to_dict(self) -> dict
+        Получить статистику в виде словаря
+    create_stats(self)
+        Заполнить атрибут stats в формате cProfile, чтобы статистику можно было передать в pstats.Stats
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.comparisons = 0
+        self.moves = 0
+        self.allocations = 0
+        self.allocated_elements = 0
+        self.level_times = {}
+        self.level_merges = {}
+        self.run_lengths = []
+        self.total_time = 0.0
+        self.stats = {}
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Получить статистику в виде словаря
+
+        :rtype: dict[str, Any]
+        :return: Словарь со счётчиками, временем по уровням и описанием серий входных данных
+        """
+        runs = self.run_lengths
+        return {
+            'size': self.size,
+            'comparisons': self.comparisons,
+            'moves': self.moves,
+            'allocations': self.allocations,
+            'allocated_elements': self.allocated_elements,
+            'level_times': dict(sorted(self.level_times.items())),
+            'level_merges': dict(sorted(self.level_merges.items())),
+            'runs': {
+                'count': len(runs),
+                'min_length': min(runs, default=0),
+                'max_length': max(runs, default=0),
+                'mean_length': self.size / len(runs) if runs else 0.0,
+            },
+            'total_time': self.total_time,
+        }
+
+    def create_stats(self):
+        """
+        Заполнить атрибут stats в формате cProfile: каждому уровню слияния соответствует отдельная
+        «функция» merge level N. Вызывается pstats.Stats(sort_stats)
+
+        :return: None
+        """
+        merge_sort_key = (__file__, 0, 'merge_sort')
+        self.stats = {merge_sort_key: (1, 1, 0.0, self.total_time, {})}
+        for level, level_time in self.level_times.items():
+            merges = self.level_merges[level]
+            callers = {merge_sort_key: (merges, merges, level_time, level_time)}
+            self.stats[(__file__, level, f'merge level {level}')] = (merges, merges, level_time, level_time, callers)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.to_dict()})'
+
+
+def instrumented_merge_sort(array, low, high) -> SortStats:
+    """
+    Отсортировать список так же, как merge_sort, собирая статистику сравнений, перемещений, выделений памяти,
+    времени по уровням рекурсии и структуры серий входных данных.
+    Это отдельная копия алгоритма: сам merge_sort не содержит проверок и не замедляется
+
+    :param array: Сортируемый список
+    :type array: list
+    :param low: Индекс первого элемента сортируемого диапазона
+    :type low: int
+    :param high: Индекс последнего элемента сортируемого диапазона
+    :type high: int
+
+    :rtype: SortStats
+    :return: Собранная статистика
+    """
+    stats = SortStats()
+    if low <= high:
+        stats.size = high - low + 1
+        bounds = _run_bounds(array, low, high, reverse_descending=False)
+        stats.run_lengths = [end - start for start, end in zip(bounds, bounds[1:])]
+    started = time.perf_counter()
+    _instrumented_sort(array, low, high, 0, stats)
+    stats.total_time = time.perf_counter() - started
+    return stats
+
+
+def _instrumented_sort(array, low, high, level, stats):
+    if low < high:
+        middle = int((low + high) / 2)
+        _instrumented_sort(array, low, middle, level + 1, stats)
+        _instrumented_sort(array, middle + 1, high, level + 1, stats)
+
+        started = time.perf_counter()
+        _instrumented_merge(array, low, middle, high, stats)
+        stats.level_times[level] = stats.level_times.get(level, 0.0) + time.perf_counter() - started
+        stats.level_merges[level] = stats.level_merges.get(level, 0) + 1
+
+
+def _instrumented_merge(array, low, middle, high, stats):
+    left_array = deque(array[low:middle + 1])
+    right_array = deque(array[middle + 1:high + 1])
+    stats.allocations += 2
+    stats.allocated_elements += high - low + 1
+
+    i = low
+    comparisons = 0
+
+    while left_array and right_array:
+        comparisons += 1
+        if left_array[0] <= right_array[0]:
+            array[i] = left_array.popleft()
+            i += 1
+        else:
+            array[i] = right_array.popleft()
+            i += 1
+
+    while left_array:
+        array[i] = left_array.popleft()
+        i += 1
+
+    while right_array:
+        array[i] = right_array.popleft()
+        i += 1
+
+    stats.comparisons += comparisons
+    stats.moves += high - low + 1
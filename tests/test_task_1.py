@@ -1,6 +1,6 @@
 import pytest
 
-from solutions.task_1 import my_is_even
+from solutions.task_1 import my_is_even, my_low_bits
 
 
 def test_my_is_even():
@@ -8,4 +8,12 @@ def test_my_is_even():
     assert my_is_even(2) == True
     assert my_is_even(0) == True
     assert my_is_even(-2) == True
-    assert my_is_even(-11) == False
\ No newline at end of file
+    assert my_is_even(-11) == False
+
+
+def test_my_low_bits():
+    assert my_low_bits(13, 2) == 1
+    assert my_low_bits(16, 4) == 0
+    assert my_low_bits(-1, 3) == 7
+    assert my_low_bits(5, 0) == 0
+    assert all(my_is_even(value) == (my_low_bits(value, 1) == 0) for value in range(-8, 8))
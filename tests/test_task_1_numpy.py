@@ -0,0 +1,51 @@
+import pytest
+import random
+from array import array
+
+np = pytest.importorskip('numpy')
+
+from solutions.task_1 import my_low_bits
+from solutions.task_1_numpy import group_by_low_bits, partition_by_low_bits
+
+
+@pytest.mark.parametrize('bits', [0, 1, 3, 8, 9, 17])
+def test_partition_matches_per_record_routing(bits):
+    ids = np.array([random.randrange(-10 ** 12, 10 ** 12) for _ in range(2000)], dtype=np.int64)
+    order, counts, offsets = partition_by_low_bits(ids, bits)
+    assert len(counts) == 2 ** bits
+    assert len(offsets) == 2 ** bits + 1
+    assert offsets[-1] == len(ids)
+    for shard in {my_low_bits(int(value), bits) for value in ids[:50]}:
+        expected = [index for index, value in enumerate(ids.tolist()) if my_low_bits(value, bits) == shard]
+        assert order[offsets[shard]:offsets[shard + 1]].tolist() == expected
+        assert counts[shard] == len(expected)
+
+
+def test_array_array_input():
+    ids = array('q', [5, 2, 7, 4, 1, 6])
+    grouped, offsets = group_by_low_bits(ids, 1)
+    assert grouped.tolist() == [2, 4, 6, 5, 7, 1]
+    assert offsets.tolist() == [0, 3, 6]
+
+
+def test_unsigned_and_small_types():
+    ids = np.array([255, 1, 128, 3], dtype=np.uint8)
+    grouped, offsets = group_by_low_bits(ids, 2)
+    assert grouped.tolist() == [128, 1, 255, 3]
+    assert offsets.tolist() == [0, 1, 2, 2, 4]
+
+
+def test_empty():
+    order, counts, offsets = partition_by_low_bits(np.array([], dtype=np.int64), 4)
+    assert len(order) == 0
+    assert counts.tolist() == [0] * 16
+    assert offsets.tolist() == [0] * 17
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        partition_by_low_bits(np.array([1.5]), 1)
+    with pytest.raises(TypeError):
+        partition_by_low_bits(array('d', [1.0]), 1)
+    with pytest.raises(ValueError):
+        partition_by_low_bits(np.array([1]), 25)
@@ -0,0 +1,69 @@
+import json
+import pytest
+
+from solutions import task_2
+from solutions.task_2 import WORKLOADS, calibrate, choose_backend, load_calibration, make_ring_buffer
+from solutions.task_2_1 import RingBuffer
+from solutions.task_2_2 import AnotherRingBuffer
+from solutions.task_2_3 import YetAnotherRingBuffer
+
+CALIBRATION = {
+    'host': {},
+    'best': {
+        'append': {'10': 'deque', '1000': 'deque', '100000': 'deque'},
+        'fifo': {'10': 'deque', '1000': 'list', '100000': 'dict'},
+        'peek': {'10': 'deque', '1000': 'deque', '100000': 'deque'},
+        'index': {'10': 'deque', '1000': 'deque', '100000': 'dict'},
+        'resize': {'10': 'list', '1000': 'list', '100000': 'dict'},
+    },
+}
+
+
+def test_choose_nearest_calibrated_size():
+    assert choose_backend(5, 'fifo', CALIBRATION) == 'deque'
+    assert choose_backend(2000, 'fifo', CALIBRATION) == 'list'
+    assert choose_backend(50000, 'fifo', CALIBRATION) == 'dict'
+    with pytest.raises(ValueError):
+        choose_backend(10, 'unknown', CALIBRATION)
+
+
+def test_make_ring_buffer():
+    buffer = make_ring_buffer(3, 'resize', [1, 2, 3, 4], calibration=CALIBRATION)
+    assert isinstance(buffer, AnotherRingBuffer)
+    assert buffer.get_size() == 3
+    assert isinstance(make_ring_buffer(10 ** 6, 'fifo', calibration=CALIBRATION), YetAnotherRingBuffer)
+    assert isinstance(make_ring_buffer(10, 'append', calibration=CALIBRATION), RingBuffer)
+    with pytest.raises(ValueError):
+        make_ring_buffer(0, calibration=CALIBRATION)
+
+
+def test_calibrate_skips_unsupported_backends():
+    calibration = calibrate(sizes=(4, 16), operations=50)
+    assert set(calibration['best']) == set(WORKLOADS)
+    assert set(calibration['timings']['resize']['4']) == {'list', 'dict'}
+    assert set(calibration['timings']['fifo']['16']) == {'deque', 'list', 'dict'}
+
+
+def test_load_cached_calibration(tmp_path):
+    path = tmp_path / 'calibration.json'
+    cached = dict(CALIBRATION, host=task_2._host())
+    path.write_text(json.dumps(cached))
+    assert load_calibration(path) == cached
+
+
+def test_corrupt_calibration_is_recalibrated(tmp_path, monkeypatch):
+    path = tmp_path / 'calibration.json'
+    path.write_text('{bad')
+    fresh = dict(CALIBRATION, host=task_2._host())
+    monkeypatch.setattr(task_2, 'calibrate', lambda: fresh)
+    monkeypatch.setattr(task_2, 'CALIBRATION_PATH', path)
+    monkeypatch.setattr(task_2, '_calibration', None)
+    assert isinstance(make_ring_buffer(10, 'append'), RingBuffer)
+    assert json.loads(path.read_text()) == fresh
+
+
+def test_calibration_unwritable_path(tmp_path, monkeypatch):
+    (tmp_path / 'cache').write_text('not a directory')
+    fresh = dict(CALIBRATION, host=task_2._host())
+    monkeypatch.setattr(task_2, 'calibrate', lambda: fresh)
+    assert load_calibration(tmp_path / 'cache' / 'calibration.json') == fresh
@@ -120,3 +120,58 @@ def test_extend_empty_iterable():
     assert str(buffer) == str([1, 2])
     assert buffer.get_size() == 2
     assert buffer.get_maxsize() == 3
+
+
+def test_len():
+    buffer = RingBuffer(3, [1, 2])
+    assert len(buffer) == 2
+    buffer.extend([3, 4])
+    assert len(buffer) == 3
+
+
+def test_getitem():
+    buffer = RingBuffer(5, [1, 2, 3, 4, 5, 6, 7])
+    assert buffer[0] == 3
+    assert buffer[4] == 7
+    assert buffer[-1] == 7
+    assert buffer[-5] == 3
+    assert str(buffer) == str([3, 4, 5, 6, 7])
+
+    with pytest.raises(IndexError):
+        buffer[5]
+
+    with pytest.raises(IndexError):
+        buffer[-6]
+
+
+def test_getitem_slice():
+    buffer = RingBuffer(5, [1, 2, 3, 4, 5, 6, 7])
+    assert buffer[1:4] == [4, 5, 6]
+    assert buffer[:] == [3, 4, 5, 6, 7]
+    assert buffer[-2:] == [6, 7]
+    assert buffer[::2] == [3, 5, 7]
+    assert buffer[::-1] == [7, 6, 5, 4, 3]
+    assert buffer[4:1] == []
+
+
+def test_getitem_slice_negative_step():
+    buffer = RingBuffer(5, range(7))
+    assert buffer[::-1] == [6, 5, 4, 3, 2]
+    assert buffer[3:0:-1] == [5, 4, 3]
+    assert buffer[::-2] == [6, 4, 2]
+    assert buffer[0:3:-1] == []
+    big = RingBuffer(10 ** 5, range(10 ** 5 + 10))
+    assert big[::-1] == list(range(10 ** 5 + 9, 9, -1))
+
+
+def test_iter():
+    buffer = RingBuffer(3, [1, 2, 3, 4])
+    assert list(buffer) == [2, 3, 4]
+    assert list(RingBuffer(3)) == []
+
+
+def test_peek_newest():
+    buffer = RingBuffer(3, [1, 2, 3, 4])
+    assert buffer.peek_newest() == 4
+    assert buffer.get_size() == 3
+    assert RingBuffer(3).peek_newest() is None
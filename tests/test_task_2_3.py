@@ -225,3 +225,60 @@ def test_set_maxsize():
     assert buffer._size == 3
     expected_dict = {0: 1, 1: 2, 2: 3, 3: None, 4: None}
     assert repr(buffer) == f'{buffer.__class__.__name__}({expected_dict}, maxsize=5)'
+
+
+def test_len():
+    buffer = RingBuffer(3, [1, 2])
+    assert len(buffer) == 2
+    buffer.extend([3, 4])
+    assert len(buffer) == 3
+
+
+def test_getitem():
+    buffer = RingBuffer(5, [1, 2, 3, 4, 5, 6, 7])
+    assert buffer._oldest_cell == 2
+    assert buffer[0] == 3
+    assert buffer[4] == 7
+    assert buffer[-1] == 7
+    assert buffer[-5] == 3
+
+    buffer.pop()
+    assert buffer[0] == 4
+    assert buffer[-1] == 7
+
+    with pytest.raises(IndexError):
+        buffer[4]
+
+    with pytest.raises(IndexError):
+        buffer[-5]
+
+    with pytest.raises(IndexError):
+        RingBuffer(3)[0]
+
+
+def test_getitem_slice():
+    buffer = RingBuffer(5, [1, 2, 3, 4, 5, 6, 7])
+    assert buffer[1:4] == [4, 5, 6]
+    assert buffer[:] == [3, 4, 5, 6, 7]
+    assert buffer[-2:] == [6, 7]
+    assert buffer[::2] == [3, 5, 7]
+    assert buffer[::-1] == [7, 6, 5, 4, 3]
+    assert buffer[4:1] == []
+
+
+def test_iter():
+    buffer = RingBuffer(3, [1, 2, 3, 4])
+    assert list(buffer) == [2, 3, 4]
+    assert list(RingBuffer(3)) == []
+
+
+def test_peek_newest():
+    buffer = RingBuffer(3, [1, 2, 3, 4])
+    assert buffer.peek_newest() == 4
+    assert buffer._newest_cell == 1
+    assert buffer.get_size() == 3
+
+    buffer = RingBuffer(3, [1])
+    buffer.pop()
+    assert buffer.peek_newest() is None
+    assert RingBuffer(3).peek_newest() is None
@@ -0,0 +1,103 @@
+import pytest
+import threading
+import time
+
+from solutions.task_2_4 import BroadcastRingBuffer
+
+
+def test_initialize_value_error():
+    with pytest.raises(ValueError):
+        buffer = BroadcastRingBuffer(0)
+
+    with pytest.raises(ValueError):
+        buffer = BroadcastRingBuffer(-1)
+
+
+def test_every_reader_gets_every_event():
+    buffer = BroadcastRingBuffer(5)
+    metrics, audit = buffer.add_reader(), buffer.add_reader()
+    buffer.extend([1, 2, 3])
+    assert metrics.read() == [1, 2, 3]
+    buffer.put(4)
+    assert metrics.read() == [4]
+    assert audit.read() == [1, 2, 3, 4]
+    assert metrics.read() == []
+    assert buffer.get_sequence() == 4
+
+
+def test_reader_starts_at_registration():
+    buffer = BroadcastRingBuffer(5, overwrite=False)
+    buffer.extend([1, 2])
+    reader = buffer.add_reader()
+    buffer.put(3)
+    assert reader.read() == [3]
+
+
+def test_read_batches():
+    buffer = BroadcastRingBuffer(4)
+    reader = buffer.add_reader()
+    buffer.extend([1, 2, 3])
+    assert reader.read(2) == [1, 2]
+    buffer.extend([4, 5])
+    assert reader.get_lag() == 3
+    assert reader.read(10) == [3, 4, 5]
+    assert reader.get_lag() == 0
+    assert reader.get_overrun() == 0
+
+
+def test_read_negative_max_items():
+    buffer = BroadcastRingBuffer(4)
+    reader = buffer.add_reader()
+    buffer.extend([1, 2, 3])
+    assert reader.read(2) == [1, 2]
+    with pytest.raises(ValueError):
+        reader.read(-1)
+    assert reader.read(0) == []
+    assert reader.read() == [3]
+
+
+def test_overrun():
+    buffer = BroadcastRingBuffer(3)
+    slow, fast = buffer.add_reader(), buffer.add_reader()
+    buffer.extend([1, 2])
+    assert fast.read() == [1, 2]
+    buffer.extend([3, 4, 5, 6])
+    assert fast.read() == [4, 5, 6]
+    assert slow.read() == [4, 5, 6]
+    assert slow.get_overrun() == 3
+    assert fast.get_overrun() == 1
+
+
+def test_writer_waits_for_slowest_reader():
+    buffer = BroadcastRingBuffer(2, overwrite=False)
+    reader = buffer.add_reader()
+    assert buffer.put(1)
+    assert buffer.put(2)
+    assert not buffer.put(3, timeout=0.01)
+    assert reader.read(1) == [1]
+    assert buffer.put(3, timeout=0.01)
+    assert reader.read() == [2, 3]
+
+    buffer.remove_reader(reader)
+    assert buffer.put(4, timeout=0.01)
+    assert buffer.put(5, timeout=0.01)
+    assert buffer.put(6, timeout=0.01)
+
+
+def test_threaded_readers():
+    buffer = BroadcastRingBuffer(8, overwrite=False)
+    readers = [buffer.add_reader() for _ in range(3)]
+    results = [[] for _ in readers]
+
+    def consume(reader, result):
+        while len(result) < 1000:
+            result.extend(reader.read(5))
+            time.sleep(0)
+
+    threads = [threading.Thread(target=consume, args=pair) for pair in zip(readers, results)]
+    for thread in threads:
+        thread.start()
+    buffer.extend(range(1000))
+    for thread in threads:
+        thread.join(timeout=10)
+    assert all(result == list(range(1000)) for result in results)
@@ -0,0 +1,88 @@
+import pytest
+
+from solutions.task_2_5 import ByteRingBuffer
+
+
+def test_initialize_value_error():
+    with pytest.raises(ValueError):
+        buffer = ByteRingBuffer(4)
+
+    with pytest.raises(ValueError):
+        buffer = ByteRingBuffer(2 ** 32 - 1)
+
+
+def test_put_larger_than_buffer():
+    buffer = ByteRingBuffer(16)
+    with pytest.raises(ValueError):
+        buffer.put(b'x' * 13)
+    buffer.put(b'x' * 12)
+    assert buffer.get_used() == 16
+
+
+def test_put_get_pop():
+    buffer = ByteRingBuffer(64, [b'alpha', b'', b'gamma'])
+    assert buffer.get_size() == 3
+    assert buffer.get_used() == 3 * 4 + 10
+    assert buffer.get() == b'alpha'
+    assert buffer.pop() == b'alpha'
+    assert buffer.pop() == b''
+    assert buffer.pop() == b'gamma'
+    assert buffer.pop() is None
+    assert buffer.get() is None
+    assert buffer.get_used() == 0
+
+
+def test_evicts_oldest_until_record_fits():
+    buffer = ByteRingBuffer(24, [b'aaaa', b'bbbb', b'cc'])
+    buffer.put(b'dddddd')
+    assert [bytes(record) for record in buffer] == [b'cc', b'dddddd']
+
+
+def test_wrap_marker():
+    buffer = ByteRingBuffer(20, [b'aaaa', b'bbbbbb'])
+    assert buffer.pop() == b'aaaa'
+    buffer.put(b'cccc')
+    assert [bytes(record) for record in buffer] == [b'bbbbbb', b'cccc']
+    assert buffer.get_used() == 20
+    assert buffer.pop() == b'bbbbbb'
+    assert buffer.get() == b'cccc'
+    assert buffer.get_used() == 8
+
+
+def test_short_tail_is_skipped():
+    buffer = ByteRingBuffer(18, [b'aaaaaa', b'bbbb'])
+    buffer.put(b'cc')
+    assert [bytes(record) for record in buffer] == [b'bbbb', b'cc']
+    assert buffer.pop() == b'bbbb'
+    assert buffer.pop() == b'cc'
+
+
+def test_records_are_memoryviews_without_copy():
+    buffer = ByteRingBuffer(32, [bytearray(b'record')])
+    record = buffer.get()
+    assert isinstance(record, memoryview)
+    assert record.obj is buffer._arena
+    assert record.tobytes() == b'record'
+
+
+def test_fifo_order_under_churn():
+    buffer = ByteRingBuffer(100)
+    records = [bytes([index % 256]) * (index % 17) for index in range(500)]
+    kept = []
+    for record in records:
+        buffer.put(record)
+        kept = [bytes(item) for item in buffer]
+        assert kept[-1] == record
+        assert buffer.get_used() <= buffer.get_maxsize()
+    start = len(records) - len(kept)
+    assert kept == records[start:]
+
+
+def test_clear():
+    buffer = ByteRingBuffer(16, [b'ab', b'cd'])
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.get_used() == 0
+    assert list(buffer) == []
+    buffer.put(b'ef')
+    assert str(buffer) == "[b'ef']"
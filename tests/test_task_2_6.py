@@ -0,0 +1,93 @@
+import math
+import pytest
+
+from solutions.task_2_6 import CompressedRingBuffer
+
+
+def test_initialize_value_error():
+    with pytest.raises(ValueError):
+        buffer = CompressedRingBuffer(0)
+
+    with pytest.raises(ValueError):
+        buffer = CompressedRingBuffer(10, block_size=0)
+
+    with pytest.raises(ValueError):
+        buffer = CompressedRingBuffer(10, kind='str')
+
+
+def test_put_pop_get_size():
+    buffer = CompressedRingBuffer(5, block_size=2)
+    buffer.extend([10, 11, 13])
+    assert buffer.get_size() == 3
+    assert buffer.get() == 10
+    assert buffer.pop() == 10
+    assert buffer.pop() == 11
+    assert buffer.pop() == 13
+    assert buffer.pop() is None
+    assert buffer.get() is None
+    assert buffer.get_size() == 0
+
+
+def test_overwrite_oldest():
+    buffer = CompressedRingBuffer(5, range(12), block_size=3)
+    assert list(buffer) == [7, 8, 9, 10, 11]
+    assert buffer.get_size() == 5
+    assert buffer.pop() == 7
+
+
+def test_whole_blocks_are_dropped():
+    buffer = CompressedRingBuffer(4, range(8), block_size=2)
+    assert len(buffer._blocks) == 2
+    buffer.put(8)
+    assert len(buffer._blocks) == 2
+    assert buffer._skip == 1
+    assert list(buffer) == [5, 6, 7, 8]
+
+
+def test_int_round_trip():
+    values = [0, 5, 5, 5, -3, 2 ** 70, -(2 ** 70), 1, 1]
+    buffer = CompressedRingBuffer(len(values), values, block_size=4)
+    assert list(buffer) == values
+    assert [buffer.pop() for _ in values] == values
+
+
+def test_float_round_trip():
+    values = [20.5, 20.5, 20.75, -0.0, math.inf, 1e-300, 3.14]
+    buffer = CompressedRingBuffer(len(values), values, block_size=3, kind='float')
+    assert list(buffer) == values
+    assert math.copysign(1, list(buffer)[3]) == -1
+    buffer.put(math.nan)
+    assert math.isnan(list(buffer)[-1])
+
+
+def test_slowly_changing_values_are_compact():
+    buffer = CompressedRingBuffer(1024, [1_700_000_000] * 1024, block_size=256)
+    assert buffer.get_nbytes() == 0
+    buffer = CompressedRingBuffer(1024, range(1_700_000_000, 1_700_001_024), block_size=256)
+    assert buffer.get_nbytes() == 4 * 32
+    buffer = CompressedRingBuffer(1024, (index * 3 + index % 5 for index in range(1024)), block_size=256)
+    assert buffer.get_nbytes() <= 4 * 128
+
+
+def test_block_is_decoded_only_when_read():
+    buffer = CompressedRingBuffer(10, range(10), block_size=4)
+    assert buffer._decoded is None
+    assert buffer.get() == 0
+    assert buffer._decoded == [0, 1, 2, 3]
+
+
+def test_set_maxsize():
+    buffer = CompressedRingBuffer(6, range(6), block_size=4)
+    buffer.set_maxsize(2)
+    assert list(buffer) == [4, 5]
+    buffer.set_maxsize(4)
+    buffer.extend([6, 7, 8])
+    assert list(buffer) == [5, 6, 7, 8]
+
+
+def test_clear():
+    buffer = CompressedRingBuffer(6, range(6), block_size=4)
+    buffer.clear()
+    assert buffer.get_size() == 0
+    assert list(buffer) == []
+    assert buffer.get_nbytes() == 0
@@ -0,0 +1,79 @@
+import pytest
+
+from solutions.task_2_7 import Consolidated, DownsamplingRingBuffer
+
+
+def spans(points):
+    return [(point.start, point.end, point.count) for point in points]
+
+
+def test_initialize_value_error():
+    with pytest.raises(ValueError):
+        buffer = DownsamplingRingBuffer(0)
+
+    with pytest.raises(ValueError):
+        buffer = DownsamplingRingBuffer(4, [(1, 4)])
+
+    with pytest.raises(ValueError):
+        buffer = DownsamplingRingBuffer(4, [(2, 0)])
+
+    with pytest.raises(ValueError):
+        buffer = DownsamplingRingBuffer(4, interval=0)
+
+
+def test_evicted_values_are_consolidated():
+    buffer = DownsamplingRingBuffer(4, [(2, 3), (3, 2)])
+    buffer.extend((timestamp, float(timestamp)) for timestamp in range(40))
+    assert spans(buffer.get_level(0)) == [(36, 36, 1), (37, 37, 1), (38, 38, 1), (39, 39, 1)]
+    assert spans(buffer.get_level(1)) == [(30, 31, 2), (32, 33, 2), (34, 35, 2)]
+    assert spans(buffer.get_level(2)) == [(18, 23, 6), (24, 29, 6)]
+    assert buffer.get_size() == 9
+    assert buffer.get_resolutions() == [1.0, 2.0, 6.0]
+
+
+def test_consolidated_point():
+    buffer = DownsamplingRingBuffer(1, [(4, 1)])
+    buffer.extend([(0, 5.0), (1, -1.0), (2, 9.0), (3, 3.0), (4, 0.0)])
+    point = buffer.get_level(1)[0]
+    assert (point.minimum, point.maximum, point.mean, point.last) == (-1.0, 9.0, 4.0, 3.0)
+
+
+def test_query_picks_coarsest_satisfying_level():
+    buffer = DownsamplingRingBuffer(4, [(2, 3), (3, 2)], interval=10)
+    buffer.extend((timestamp * 10, float(timestamp)) for timestamp in range(41))
+    assert spans(buffer.query(0, 1000, resolution=60)) == [
+        (180, 230, 6), (240, 290, 6), (300, 350, 6), (360, 400, 5)]
+    assert spans(buffer.query(300, 1000, resolution=25)) == [
+        (300, 310, 2), (320, 330, 2), (340, 350, 2), (360, 370, 2), (380, 390, 2), (400, 400, 1)]
+
+
+def test_query_older_data_from_coarser_levels():
+    buffer = DownsamplingRingBuffer(4, [(2, 3), (3, 2)])
+    buffer.extend((timestamp, float(timestamp)) for timestamp in range(41))
+    assert spans(buffer.query(25, 38)) == [
+        (24, 29, 6), (30, 31, 2), (32, 33, 2), (34, 35, 2), (36, 36, 1), (37, 37, 1)]
+
+
+def test_query_returns_copies():
+    buffer = DownsamplingRingBuffer(2, [(2, 2)])
+    buffer.extend((timestamp, 1.0) for timestamp in range(6))
+    point = buffer.query(0, 10, resolution=2)[0]
+    point.add(Consolidated(100, 100.0))
+    assert buffer.get_level(1)[0].maximum == 1.0
+
+
+def test_put_uses_current_time():
+    buffer = DownsamplingRingBuffer(2)
+    buffer.put(1.0)
+    buffer.put(2.0, timestamp=0)
+    first, second = buffer.get_level(0)
+    assert first.start > 0
+    assert second.start == 0
+
+
+def test_clear():
+    buffer = DownsamplingRingBuffer(2, [(2, 2)])
+    buffer.extend((timestamp, 1.0) for timestamp in range(5))
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.query(0, 10) == []
@@ -0,0 +1,58 @@
+import pytest
+
+from solutions.task_2_8 import DedupRingBuffer
+
+
+def test_initialize_value_error():
+    with pytest.raises(ValueError):
+        buffer = DedupRingBuffer(0)
+
+
+def test_contains_follows_window():
+    buffer = DedupRingBuffer(3, ['a', 'b', 'c'])
+    assert 'a' in buffer
+    buffer.put('d')
+    assert 'a' not in buffer
+    assert list(buffer) == ['b', 'c', 'd']
+
+
+def test_duplicates_are_refcounted():
+    buffer = DedupRingBuffer(3, ['a', 'b', 'a'])
+    buffer.put('c')
+    assert 'a' in buffer
+    buffer.put('d')
+    assert 'a' in buffer
+    buffer.put('e')
+    assert 'a' not in buffer
+    assert buffer._counts == {'c': 1, 'd': 1, 'e': 1}
+
+
+def test_put_if_absent():
+    buffer = DedupRingBuffer(2)
+    assert buffer.put_if_absent(1)
+    assert not buffer.put_if_absent(1)
+    assert buffer.put_if_absent(2)
+    assert buffer.put_if_absent(3)
+    assert buffer.put_if_absent(1)
+    assert list(buffer) == [3, 1]
+
+
+def test_pop_and_clear():
+    buffer = DedupRingBuffer(3, [1, 2])
+    assert buffer.pop() == 1
+    assert 1 not in buffer
+    assert buffer.get_size() == 1
+    buffer.clear()
+    assert 2 not in buffer
+    assert buffer.pop() is None
+
+
+def test_unhashable_element_leaves_buffer_unchanged():
+    buffer = DedupRingBuffer(2, [1, 2])
+    with pytest.raises(TypeError):
+        buffer.put([3])
+    assert list(buffer) == [1, 2]
+    assert buffer._counts == {1: 1, 2: 1}
+    buffer.put(2)
+    assert list(buffer) == [2, 2]
+    assert buffer._counts == {2: 2}
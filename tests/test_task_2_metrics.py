@@ -0,0 +1,72 @@
+import pytest
+
+from solutions.task_2_2 import AnotherRingBuffer
+from solutions.task_2_3 import YetAnotherRingBuffer
+from solutions.task_2_metrics import disable_instrumentation, enable_instrumentation
+
+
+@pytest.mark.parametrize('buffer_class', [AnotherRingBuffer, YetAnotherRingBuffer])
+def test_counts_and_occupancy(buffer_class):
+    buffer = buffer_class(3)
+    metrics = enable_instrumentation(buffer, name='events')
+    buffer.put(1)
+    buffer.extend([2, 3, 4])
+    assert buffer.pop() == 2
+    snapshot = metrics.snapshot()
+    assert snapshot['counts'] == {'put': 1, 'pop': 1, 'extend': 1, 'set_maxsize': 0}
+    assert sum(snapshot['histograms']['put'].values()) == 1
+    assert [size for _, size in snapshot['occupancy']] == [1, 3, 2]
+    assert snapshot['size'] == 2
+    assert snapshot['maxsize'] == 3
+
+
+@pytest.mark.parametrize('buffer_class', [AnotherRingBuffer, YetAnotherRingBuffer])
+def test_resize_events(buffer_class):
+    buffer = buffer_class(4, range(4))
+    metrics = enable_instrumentation(buffer)
+    buffer.set_maxsize(2)
+    buffer.set_maxsize(2)
+    buffer.set_maxsize(8)
+    assert [(previous, new) for _, previous, new in metrics.resizes] == [(4, 2), (2, 8)]
+    assert metrics.counts['set_maxsize'] == 3
+
+
+@pytest.mark.parametrize('buffer_class', [AnotherRingBuffer, YetAnotherRingBuffer])
+def test_internal_calls_are_not_recorded(buffer_class):
+    buffer = buffer_class(100, range(100))
+    metrics = enable_instrumentation(buffer)
+    buffer.set_maxsize(10)
+    buffer.set_maxsize(200)
+    assert metrics.counts == {'put': 0, 'pop': 0, 'extend': 0, 'set_maxsize': 2}
+    assert len(metrics.occupancy) == 2
+    assert buffer.get_size() == 10
+
+
+def test_disable_restores_class_methods():
+    buffer = AnotherRingBuffer(3)
+    other = AnotherRingBuffer(3)
+    enable_instrumentation(buffer)
+    assert 'put' in vars(buffer)
+    assert 'put' not in vars(other)
+    with pytest.raises(ValueError):
+        enable_instrumentation(buffer)
+
+    metrics = disable_instrumentation(buffer)
+    buffer.put(1)
+    assert buffer.put.__func__ is AnotherRingBuffer.put
+    assert metrics.counts['put'] == 0
+    assert disable_instrumentation(buffer) is None
+
+
+def test_prometheus_text():
+    buffer = YetAnotherRingBuffer(2)
+    metrics = enable_instrumentation(buffer, name='ids')
+    for element in [1, 2, 3]:
+        buffer.put(element)
+    text = metrics.to_prometheus()
+    assert '# TYPE ring_buffer_operation_duration_seconds histogram' in text
+    assert 'ring_buffer_operations_total{buffer="ids",operation="put"} 3' in text
+    assert 'ring_buffer_operation_duration_seconds_bucket{buffer="ids",operation="put",le="+Inf"} 3' in text
+    assert 'ring_buffer_operation_duration_seconds_count{buffer="ids",operation="pop"} 0' in text
+    assert 'ring_buffer_size{buffer="ids"} 2' in text
+    assert text.endswith('\n')
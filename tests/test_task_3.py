@@ -1,7 +1,9 @@
 import pytest
 import random
+from array import array
 
-from solutions.task_3 import merge_sort
+from solutions import task_3, task_3_numpy
+from solutions.task_3 import auto_sort, choose_engine, merge_iterables, merge_sort, natural_merge_sort
 
 
 def test_positive_sort():
@@ -18,3 +20,140 @@ def test_positive_sort():
     assert actual_list != expected_list
     merge_sort(actual_list, 0, len(actual_list) - 1)
     assert actual_list == expected_list
+
+
+def test_merge_iterables():
+    streams = [sorted(random.sample(range(1000), 50)) for _ in range(7)]
+    assert list(merge_iterables(*streams)) == sorted(x for stream in streams for x in stream)
+
+    assert list(merge_iterables()) == []
+    assert list(merge_iterables([], [1, 3], [], [2])) == [1, 2, 3]
+    assert list(merge_iterables([1, 2, 3])) == [1, 2, 3]
+
+
+def test_merge_iterables_stable():
+    first = [(1, 'a'), (2, 'a'), (3, 'a')]
+    second = [(1, 'b'), (3, 'b')]
+    third = [(2, 'c'), (3, 'c')]
+    actual = list(merge_iterables(first, second, third, key=lambda item: item[0]))
+    assert actual == sorted(first + second + third, key=lambda item: item[0])
+
+
+def test_merge_iterables_reverse():
+    streams = [sorted(random.sample(range(1000), 30), reverse=True) for _ in range(5)]
+    actual = list(merge_iterables(*streams, reverse=True))
+    assert actual == sorted((x for stream in streams for x in stream), reverse=True)
+
+
+def test_merge_iterables_lazy():
+    def endless(start):
+        value = start
+        while True:
+            yield value
+            value += 3
+
+    merged = merge_iterables(endless(0), endless(1), endless(2))
+    assert [next(merged) for _ in range(9)] == list(range(9))
+
+
+def test_in_place_sort():
+    for size in (0, 1, 2, 3, 10, 257, 1000):
+        actual_list = [random.randint(-size, size) for _ in range(size)]
+        expected_list = sorted(actual_list)
+        merge_sort(actual_list, 0, len(actual_list) - 1, in_place=True)
+        assert actual_list == expected_list
+
+    actual_list = [9, 8, 7, 3, 1, 2, 0]
+    merge_sort(actual_list, 2, 5, in_place=True)
+    assert actual_list == [9, 8, 1, 2, 3, 7, 0]
+
+
+def test_in_place_sort_stable():
+    class Record:
+        def __init__(self, item):
+            self.item = item
+
+        def __lt__(self, other):
+            return self.item[0] < other.item[0]
+
+        def __le__(self, other):
+            return self.item[0] <= other.item[0]
+
+    records = [(random.randint(0, 5), index) for index in range(500)]
+    actual_list = [Record(item) for item in records]
+    merge_sort(actual_list, 0, len(actual_list) - 1, in_place=True)
+    assert [record.item for record in actual_list] == sorted(records, key=lambda item: item[0])
+
+
+def test_natural_merge_sort():
+    for size in (0, 1, 2, 3, 100, 1000):
+        actual_list = [random.randint(-20, 20) for _ in range(size)]
+        for source in (actual_list, sorted(actual_list), sorted(actual_list, reverse=True)):
+            result = source.copy()
+            natural_merge_sort(result, 0, len(result) - 1)
+            assert result == sorted(source)
+
+
+def test_choose_engine():
+    assert choose_engine([1], 0, 0) == 'merge_sort'
+    assert choose_engine(list(range(1000)), 0, 999) == 'adaptive'
+    assert choose_engine(list(range(1000, 0, -1)), 0, 999) == 'adaptive'
+
+    actual_list = [random.randint(-1000, 1000) for _ in range(1000)]
+    assert choose_engine(actual_list, 0, 999) == 'radix_lsd'
+    actual_list = [random.randint(-2 ** 70, 2 ** 70) for _ in range(100)]
+    assert choose_engine(actual_list, 0, 99) == 'merge_sort'
+
+    actual_list = [str(random.random()) for _ in range(100)]
+    assert choose_engine(actual_list, 0, 99) == 'radix_msd'
+    actual_list = ['x' * 196 + str(random.random())[2:6] for _ in range(4096)]
+    assert choose_engine(actual_list, 0, 4095) == 'merge_sort'
+    actual_list = [b'key' + random.randbytes(4) for _ in range(4096)]
+    assert choose_engine(actual_list, 0, 4095) == 'radix_msd'
+    actual_list = [random.random() for _ in range(100)]
+    assert choose_engine(actual_list, 0, 99) == 'merge_sort'
+
+
+def test_auto_sort():
+    sources = [
+        [random.randint(-1000, 1000) for _ in range(500)],
+        [random.random() for _ in range(500)],
+        [str(random.random()) for _ in range(500)],
+        sorted(random.random() for _ in range(500)),
+        [(random.randint(0, 3), random.random()) for _ in range(500)],
+    ]
+    for source in sources:
+        actual_list = source.copy()
+        assert auto_sort(actual_list, 0, len(actual_list) - 1) == choose_engine(source, 0, len(source) - 1)
+        assert actual_list == sorted(source)
+
+
+def test_auto_sort_array_without_numpy(monkeypatch):
+    monkeypatch.setattr(task_3_numpy, 'np', None)
+    for typecode, values in (('q', [random.randint(-1000, 1000) for _ in range(1000)]),
+                             ('d', [random.random() for _ in range(1000)]),
+                             ('q', list(range(1000)))):
+        actual_array = array(typecode, values)
+        assert choose_engine(actual_array, 0, 999) in ('adaptive', 'merge_sort')
+        auto_sort(actual_array, 0, 999)
+        assert actual_array == array(typecode, sorted(values))
+
+
+@pytest.mark.parametrize('workers', [2, 3, 4, 8])
+def test_parallel_sort(monkeypatch, workers):
+    monkeypatch.setattr(task_3, 'is_gil_enabled', lambda: False)
+    for in_place in (False, True):
+        actual_list = [random.randint(-1000, 1000) for _ in range(5000)]
+        expected_list = [-1] + sorted(actual_list) + [-2]
+        actual_list = [-1] + actual_list + [-2]
+        merge_sort(actual_list, 1, len(actual_list) - 2, in_place=in_place, workers=workers)
+        assert actual_list == expected_list
+
+
+def test_parallel_sort_falls_back_with_gil(monkeypatch):
+    monkeypatch.setattr(task_3, 'is_gil_enabled', lambda: True)
+    monkeypatch.setattr(task_3, '_parallel_merge_sort', None)
+    actual_list = [random.randint(-1000, 1000) for _ in range(5000)]
+    expected_list = sorted(actual_list)
+    merge_sort(actual_list, 0, len(actual_list) - 1, workers=4)
+    assert actual_list == expected_list
@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from solutions.task_3_async import async_merge_sort
+
+
+def test_async_merge_sort():
+    for size in (0, 1, 2, 3, 100, 1001):
+        actual_list = [random.randint(-50, 50) for _ in range(size)]
+        expected_list = sorted(actual_list)
+        asyncio.run(async_merge_sort(actual_list, 0, len(actual_list) - 1, step=7))
+        assert actual_list == expected_list
+
+
+def test_async_merge_sort_subrange():
+    actual_list = [9, 8, 7, 3, 1, 2, 0]
+    asyncio.run(async_merge_sort(actual_list, 2, 5))
+    assert actual_list == [9, 8, 1, 2, 3, 7, 0]
+
+
+def test_async_merge_sort_stable():
+    records = [(random.randint(0, 5), index) for index in range(300)]
+
+    class Record:
+        def __init__(self, item):
+            self.item = item
+
+        def __le__(self, other):
+            return self.item[0] <= other.item[0]
+
+    actual_list = [Record(item) for item in records]
+    asyncio.run(async_merge_sort(actual_list, 0, len(actual_list) - 1, step=10))
+    assert [record.item for record in actual_list] == sorted(records, key=lambda item: item[0])
+
+
+def test_async_merge_sort_yields_to_loop():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        actual_list = list(range(2000, 0, -1))
+        await async_merge_sort(actual_list, 0, len(actual_list) - 1, step=100)
+        task.cancel()
+        assert actual_list == list(range(1, 2001))
+
+    asyncio.run(main())
+    assert len(ticks) > 10
+
+
+def test_async_merge_sort_executor():
+    actual_list = [random.randint(-50, 50) for _ in range(500)]
+    expected_list = sorted(actual_list)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        asyncio.run(async_merge_sort(actual_list, 0, len(actual_list) - 1,
+                                     executor_threshold=100, executor=executor))
+    assert actual_list == expected_list
+
+
+def test_async_merge_sort_value_error():
+    with pytest.raises(ValueError):
+        asyncio.run(async_merge_sort([2, 1], 0, 1, step=0))
@@ -0,0 +1,73 @@
+import pytest
+import random
+
+from solutions.task_3_columnar import columnar_argsort, sort_columns
+
+
+def make_columns(size):
+    return {
+        'city': [random.choice(['Moscow', 'Kazan', 'Omsk']) for _ in range(size)],
+        'age': [random.randint(18, 25) for _ in range(size)],
+        'id': list(range(size)),
+    }
+
+
+def expected_rows(columns, key):
+    rows = list(zip(columns['city'], columns['age'], columns['id']))
+    return sorted(rows, key=key)
+
+
+def test_columnar_argsort():
+    columns = make_columns(300)
+    permutation = columnar_argsort(columns, ['city', 'age'])
+    rows = [(columns['city'][i], columns['age'][i], columns['id'][i]) for i in permutation]
+    assert rows == expected_rows(columns, key=lambda row: (row[0], row[1]))
+
+
+def test_sort_columns_mixed_directions():
+    columns = make_columns(300)
+    actual = sort_columns(columns, ['city', 'age'], ascending=[True, False])
+    rows = list(zip(actual['city'], actual['age'], actual['id']))
+    assert rows == expected_rows(columns, key=lambda row: (row[0], -row[1]))
+
+    actual = sort_columns(columns, ['age'], ascending=False)
+    rows = list(zip(actual['city'], actual['age'], actual['id']))
+    assert rows == expected_rows(columns, key=lambda row: -row[1])
+
+
+def test_sort_columns_empty():
+    assert sort_columns({'a': [], 'b': []}, ['a']) == {'a': [], 'b': []}
+
+
+def test_columnar_argsort_value_error():
+    columns = make_columns(10)
+    with pytest.raises(ValueError):
+        columnar_argsort(columns, ['city', 'age'], ascending=[True])
+
+    with pytest.raises(ValueError):
+        columnar_argsort(columns, [])
+
+    with pytest.raises(ValueError):
+        columnar_argsort({'a': [1, 2], 'b': [1]}, ['a', 'b'])
+
+
+def test_sort_columns_numpy():
+    np = pytest.importorskip('numpy')
+    columns = make_columns(500)
+    numpy_columns = {
+        'city': np.array(columns['city']),
+        'age': np.array(columns['age'], dtype=np.int64),
+        'id': np.array(columns['id'], dtype=np.int64),
+    }
+    actual = sort_columns(numpy_columns, ['city', 'age'], ascending=[False, True])
+    rows = list(zip(actual['city'].tolist(), actual['age'].tolist(), actual['id'].tolist()))
+    expected = sorted(expected_rows(columns, key=lambda row: row[1]), key=lambda row: row[0], reverse=True)
+    assert rows == expected
+
+
+def test_sort_columns_structured():
+    np = pytest.importorskip('numpy')
+    columns = make_columns(500)
+    records = np.array(list(zip(columns['age'], columns['id'])), dtype=[('age', np.int64), ('id', np.int64)])
+    actual = sort_columns(records, ['age'], ascending=False)
+    assert actual['id'].tolist() == [row[2] for row in expected_rows(columns, key=lambda row: -row[1])]
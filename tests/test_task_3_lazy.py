@@ -0,0 +1,48 @@
+import pytest
+import random
+
+from solutions.task_3_lazy import LazySorted, nsmallest
+
+
+def test_lazy_sorted():
+    actual_list = [x for x in range(-100, 100)]
+    random.shuffle(actual_list)
+    assert list(LazySorted(actual_list)) == sorted(actual_list)
+    assert list(LazySorted([])) == []
+
+
+def test_lazy_sorted_partial():
+    view = LazySorted([5, 3, 9, 1, 7])
+    assert len(view) == 5
+    assert next(view) == 1
+    assert next(view) == 3
+    assert len(view) == 3
+    assert list(view) == [5, 7, 9]
+    with pytest.raises(StopIteration):
+        next(view)
+
+
+def test_lazy_sorted_stable():
+    records = [(random.randint(0, 5), index) for index in range(100)]
+    assert list(LazySorted(records, key=lambda item: item[0])) == sorted(records, key=lambda item: item[0])
+    assert list(LazySorted(records, key=lambda item: item[0], reverse=True)) == \
+           sorted(records, key=lambda item: item[0], reverse=True)
+
+
+def test_lazy_sorted_top_k():
+    actual_list = random.sample(range(1000), 100)
+    view = LazySorted(actual_list)
+    assert view.top_k(10) == sorted(actual_list)[:10]
+    assert len(view) == 100
+    next(view)
+    assert view.top_k(3) == sorted(actual_list)[1:4]
+    assert view.top_k(1000) == sorted(actual_list)[1:]
+
+
+def test_nsmallest():
+    actual_list = [random.randint(0, 20) for _ in range(200)]
+    assert nsmallest(actual_list, 15) == sorted(actual_list)[:15]
+    assert nsmallest(actual_list, 15, reverse=True) == sorted(actual_list, reverse=True)[:15]
+    assert nsmallest(iter(actual_list), 0) == []
+    records = [(value, index) for index, value in enumerate(actual_list)]
+    assert nsmallest(records, 30, key=lambda item: item[0]) == sorted(records, key=lambda item: item[0])[:30]
@@ -0,0 +1,72 @@
+import pytest
+import random
+
+from solutions.task_3_lsm import SortedRuns
+
+
+def test_initialize():
+    collection = SortedRuns()
+    assert len(collection) == 0
+    assert list(collection) == []
+
+    collection = SortedRuns([3, 1, 2], buffer_size=2)
+    assert len(collection) == 3
+    assert list(collection) == [1, 2, 3]
+
+
+def test_initialize_value_error():
+    with pytest.raises(ValueError):
+        SortedRuns(buffer_size=0)
+
+
+def test_add_batches():
+    collection = SortedRuns(buffer_size=8)
+    expected = []
+    for _ in range(50):
+        batch = [random.randint(-1000, 1000) for _ in range(random.randint(1, 20))]
+        collection.update(batch)
+        expected.extend(batch)
+        assert len(collection) == len(expected)
+    assert list(collection) == sorted(expected)
+    assert str(collection) == str(sorted(expected))
+
+
+def test_runs_count_is_logarithmic():
+    collection = SortedRuns(range(10000, 0, -1), buffer_size=4)
+    collection.flush()
+    assert collection.get_runs_count() <= 12
+    assert list(collection) == list(range(1, 10001))
+
+
+def test_contains():
+    values = random.sample(range(10000), 1000)
+    collection = SortedRuns(values, buffer_size=16)
+    for value in values[:100]:
+        assert value in collection
+    missing = set(range(10000)) - set(values)
+    for value in list(missing)[:100]:
+        assert value not in collection
+
+    collection.add(-5)
+    assert -5 in collection
+
+
+def test_contains_at_run_boundaries():
+    collection = SortedRuns(range(0, 272, 2), buffer_size=8)
+    collection.flush()
+    assert collection.get_runs_count() > 1
+    for run in collection._runs:
+        assert run[0] in collection
+        assert run[-1] in collection
+        assert run[0] - 1 not in collection
+        assert run[-1] + 1 not in collection
+    assert -2 not in collection
+    assert 272 not in collection
+
+
+def test_irange():
+    values = [random.randint(0, 100) for _ in range(500)]
+    collection = SortedRuns(values, buffer_size=16)
+    assert list(collection.irange(10, 20)) == sorted(value for value in values if 10 <= value <= 20)
+    assert list(collection.irange(200, 300)) == []
+    assert list(collection.irange(-10, 1000)) == sorted(values)
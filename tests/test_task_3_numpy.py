@@ -0,0 +1,70 @@
+import pytest
+import random
+from array import array
+
+np = pytest.importorskip('numpy')
+
+from solutions.task_3 import auto_sort
+from solutions.task_3_numpy import is_numeric_array, merge_argsort, vectorized_merge_sort
+
+
+@pytest.mark.parametrize('size', [0, 1, 2, 3, 17, 100, 1000, 4099])
+def test_vectorized_merge_sort_int64(size):
+    actual = np.random.randint(-1000, 1000, size=size).astype(np.int64)
+    expected = np.sort(actual, kind='stable')
+    vectorized_merge_sort(actual, 0, size - 1)
+    assert np.array_equal(actual, expected)
+
+
+def test_vectorized_merge_sort_float64():
+    actual = np.random.standard_normal(5000)
+    expected = np.sort(actual, kind='stable')
+    vectorized_merge_sort(actual, 0, len(actual) - 1)
+    assert np.array_equal(actual, expected)
+
+
+def test_vectorized_merge_sort_subrange():
+    actual = np.array([9, 8, 7, 3, 1, 2, 0], dtype=np.int64)
+    vectorized_merge_sort(actual, 2, 5)
+    assert actual.tolist() == [9, 8, 1, 2, 3, 7, 0]
+
+
+def test_vectorized_merge_sort_array_array():
+    values = [random.randint(-100, 100) for _ in range(500)]
+    actual = array('q', values)
+    vectorized_merge_sort(actual, 0, len(actual) - 1)
+    assert actual.tolist() == sorted(values)
+
+
+@pytest.mark.parametrize('size', [0, 1, 5, 64, 1000, 3333])
+def test_merge_argsort_stable(size):
+    values = np.random.randint(0, 10, size=size)
+    assert np.array_equal(merge_argsort(values), np.argsort(values, kind='stable'))
+
+
+def test_merge_argsort_array_array():
+    values = array('d', [3.0, 1.0, 2.0, 1.0])
+    assert merge_argsort(values).tolist() == [1, 3, 2, 0]
+
+
+def test_is_numeric_array():
+    assert is_numeric_array(np.zeros(3))
+    assert is_numeric_array(array('i', [1, 2]))
+    assert not is_numeric_array([1, 2, 3])
+    assert not is_numeric_array(np.array(['a', 'b']))
+    assert not is_numeric_array(np.zeros((2, 2)))
+
+
+def test_vectorized_merge_sort_errors():
+    with pytest.raises(TypeError):
+        vectorized_merge_sort([3, 2, 1], 0, 2)
+
+    with pytest.raises(ValueError):
+        vectorized_merge_sort(np.array([1.0, np.nan]), 0, 1)
+
+
+def test_auto_sort_vectorized():
+    actual = np.random.randint(-1000, 1000, size=300)
+    expected = np.sort(actual, kind='stable')
+    assert auto_sort(actual, 0, len(actual) - 1) == 'vectorized'
+    assert np.array_equal(actual, expected)
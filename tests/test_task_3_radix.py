@@ -0,0 +1,51 @@
+import random
+
+from solutions.task_3_radix import lsd_radix_sort, msd_radix_sort
+
+
+def test_lsd_radix_sort():
+    for size in (0, 1, 2, 100, 1000):
+        actual_list = [random.randint(-10 ** 12, 10 ** 12) for _ in range(size)]
+        expected_list = sorted(actual_list)
+        lsd_radix_sort(actual_list, 0, len(actual_list) - 1)
+        assert actual_list == expected_list
+
+
+def test_lsd_radix_sort_negative_and_duplicates():
+    actual_list = [x for x in range(-100, 100)] * 3
+    random.shuffle(actual_list)
+    expected_list = sorted(actual_list)
+    lsd_radix_sort(actual_list, 0, len(actual_list) - 1)
+    assert actual_list == expected_list
+
+    actual_list = [7] * 10
+    lsd_radix_sort(actual_list, 0, len(actual_list) - 1)
+    assert actual_list == [7] * 10
+
+
+def test_lsd_radix_sort_subrange():
+    actual_list = [9, 8, 7, 3, -1, 2, 0]
+    lsd_radix_sort(actual_list, 2, 5)
+    assert actual_list == [9, 8, -1, 2, 3, 7, 0]
+
+
+def test_msd_radix_sort_str():
+    for size in (0, 1, 2, 31, 33, 1000):
+        actual_list = [''.join(random.choice('abcя') for _ in range(random.randint(0, 6))) for _ in range(size)]
+        expected_list = sorted(actual_list)
+        msd_radix_sort(actual_list, 0, len(actual_list) - 1)
+        assert actual_list == expected_list
+
+
+def test_msd_radix_sort_bytes():
+    actual_list = [bytes(random.randint(0, 255) for _ in range(4)) for _ in range(1000)]
+    expected_list = sorted(actual_list)
+    msd_radix_sort(actual_list, 0, len(actual_list) - 1)
+    assert actual_list == expected_list
+
+
+def test_msd_radix_sort_long_common_prefix():
+    actual_list = ['x' * 5000 + str(x % 10) for x in range(100)]
+    expected_list = sorted(actual_list)
+    msd_radix_sort(actual_list, 0, len(actual_list) - 1)
+    assert actual_list == expected_list
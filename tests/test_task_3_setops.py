@@ -0,0 +1,51 @@
+import random
+
+from solutions.task_3_setops import difference, distinct, intersection, merge_join, merge_sort_distinct, union
+
+
+def random_sorted(size, limit=50):
+    return sorted(random.randint(0, limit) for _ in range(size))
+
+
+def test_distinct():
+    assert list(distinct([])) == []
+    assert list(distinct([1, 1, 2, 3, 3, 3])) == [1, 2, 3]
+    assert list(distinct(iter([(1, 'a'), (1, 'b'), (2, 'c')]), key=lambda item: item[0])) == [(1, 'a'), (2, 'c')]
+
+
+def test_set_operations():
+    for _ in range(50):
+        first, second = random_sorted(random.randint(0, 40)), random_sorted(random.randint(0, 40))
+        assert list(union(first, second)) == sorted(set(first) | set(second))
+        assert list(intersection(first, second)) == sorted(set(first) & set(second))
+        assert list(difference(first, second)) == sorted(set(first) - set(second))
+        assert list(difference(iter(second), iter(first))) == sorted(set(second) - set(first))
+
+
+def test_set_operations_key():
+    first = [(1, 'a'), (2, 'a'), (4, 'a')]
+    second = [(2, 'b'), (3, 'b'), (4, 'b')]
+    assert list(union(first, second, key=lambda item: item[0])) == [(1, 'a'), (2, 'a'), (3, 'b'), (4, 'a')]
+    assert list(intersection(first, second, key=lambda item: item[0])) == [(2, 'a'), (4, 'a')]
+    assert list(difference(first, second, key=lambda item: item[0])) == [(1, 'a')]
+
+
+def test_merge_join():
+    for _ in range(50):
+        first = [(key, index) for index, key in enumerate(random_sorted(random.randint(0, 30), 10))]
+        second = [(key, -index) for index, key in enumerate(random_sorted(random.randint(0, 30), 10))]
+        expected = [(left, right) for left in first for right in second if left[0] == right[0]]
+        actual = list(merge_join(first, iter(second), lambda item: item[0], lambda item: item[0]))
+        assert actual == expected
+
+
+def test_merge_sort_distinct():
+    for size in (0, 1, 2, 3, 100, 1000):
+        source = [random.randint(-20, 20) for _ in range(size)]
+        actual_list = source.copy()
+        assert merge_sort_distinct(actual_list, 0, len(actual_list) - 1) == len(set(source))
+        assert actual_list == sorted(set(source))
+
+    actual_list = [9, 3, 1, 3, 1, 2, 0]
+    assert merge_sort_distinct(actual_list, 1, 5) == 3
+    assert actual_list == [9, 1, 2, 3, 0]
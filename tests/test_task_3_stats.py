@@ -0,0 +1,46 @@
+import pstats
+import random
+
+from solutions.task_3_stats import instrumented_merge_sort
+
+
+def test_instrumented_merge_sort():
+    actual_list = [x for x in range(-100, 100)]
+    expected_list = [x for x in range(-100, 100)]
+    random.shuffle(actual_list)
+    stats = instrumented_merge_sort(actual_list, 0, len(actual_list) - 1)
+    assert actual_list == expected_list
+
+    result = stats.to_dict()
+    assert result['size'] == 200
+    assert 0 < result['comparisons'] <= 200 * 8
+    assert result['allocations'] == 2 * 199
+    assert result['moves'] == result['allocated_elements']
+    assert result['level_merges'][0] == 1
+    assert sum(result['level_merges'].values()) == 199
+    assert sum(result['level_times'].values()) <= result['total_time']
+
+
+def test_instrumented_merge_sort_runs():
+    stats = instrumented_merge_sort([1, 2, 3, 0, 5, 6, 4], 0, 6)
+    assert stats.run_lengths == [3, 3, 1]
+    assert stats.to_dict()['runs'] == {'count': 3, 'min_length': 1, 'max_length': 3, 'mean_length': 7 / 3}
+
+    stats = instrumented_merge_sort(list(range(16)), 0, 15)
+    assert stats.run_lengths == [16]
+    assert stats.comparisons == 32
+
+
+def test_instrumented_merge_sort_empty():
+    stats = instrumented_merge_sort([], 0, -1)
+    assert stats.to_dict()['size'] == 0
+    assert stats.to_dict()['runs']['count'] == 0
+
+
+def test_pstats_export():
+    actual_list = [random.random() for _ in range(100)]
+    stats = instrumented_merge_sort(actual_list, 0, len(actual_list) - 1)
+    profile = pstats.Stats(stats)
+    functions = {function_name for _, _, function_name in profile.stats}
+    assert functions == {'merge_sort'} | {f'merge level {level}' for level in stats.level_times}
+    assert profile.total_calls == 1 + sum(stats.level_merges.values())